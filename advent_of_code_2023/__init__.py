@@ -1,2 +1,5 @@
 """Advent of Code 2023."""
 from .data_structures import *
+from .parsing import *
+from .profiling import *
+from .streams import *
@@ -0,0 +1,5 @@
+"""Run all Advent of Code 2023 solutions."""
+
+from .runner import main
+
+main()
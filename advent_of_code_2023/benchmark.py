@@ -0,0 +1,405 @@
+"""
+Benchmark the Advent of Code 2023 solutions on synthetic inputs of increasing size.
+
+Every solution runs on generated inputs of doubling size until it exceeds the time budget. The
+empirical complexity is fitted from the resulting scaling curve, and the curves can be stored as a
+baseline to compare later runs against.
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+from .generators import GENERATORS, write_input
+from .runner import Measurement, Solution, discover_solutions, run_solutions
+
+# The smallest and largest size to benchmark. For grid days the size is the side of the grid.
+LINE_SCALE = (64, 2**20)
+GRID_SCALE = (8, 2**12)
+
+SCALES: dict[str, tuple[int, int]] = {
+    day: GRID_SCALE
+    for day in ["day03", "day10", "day11", "day14", "day16", "day17", "day21"]
+}
+
+# Arguments for entry points that need more than the input path, scaled with the input size.
+BENCHMARK_ARGUMENTS: dict[tuple[str, str], Callable[[int], dict[str, int]]] = {
+    ("day14", "part2"): lambda _: {"ticks": 3},
+    ("day21", "part1"): lambda size: {"steps": size - size % 2},
+    ("day21", "part2"): lambda size: {"steps": size - size % 2},
+}
+
+# Timings below this many seconds are too noisy to fit a curve through.
+MIN_FIT_TIME = 1e-3
+
+COMPLEXITY_CLASSES = {0: "O(1)", 1: "O(n)", 2: "O(n^2)", 3: "O(n^3)"}
+
+
+@dataclass(frozen=True)
+class Sample:
+    """A single measurement of a solution at a given input size."""
+
+    size: int
+    wall_time: float
+    cpu_time: float | None
+    peak_rss: int | None
+    error: str | None = None
+
+
+@dataclass
+class Curve:
+    """The scaling curve of a solution, along with its fitted complexity."""
+
+    day: str
+    part: str
+    samples: list[Sample] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Return the key of the curve in a baseline file."""
+        return f"{self.day}.{self.part}"
+
+    @property
+    def exponent(self) -> float | None:
+        """Fit the exponent `k` of `t = c * n^k` through the samples."""
+        points = fit_points(self.samples)
+
+        if len(points) < 2:  # noqa: PLR2004
+            return None
+
+        slope, _ = least_squares([math.log(n) for n, _ in points], [math.log(t) for _, t in points])
+        return slope
+
+    @property
+    def complexity(self) -> str:
+        """Return the complexity class that best matches the samples."""
+        exponent = self.exponent
+
+        if exponent is None:
+            return "unknown"
+
+        if exponent > max(COMPLEXITY_CLASSES) + 0.5 and is_exponential(self.samples):
+            return "O(2^n)"
+
+        if exponent > max(COMPLEXITY_CLASSES) + 0.5:
+            return f"O(n^{round(exponent)})"
+
+        return COMPLEXITY_CLASSES[min(COMPLEXITY_CLASSES, key=lambda k: abs(k - exponent))]
+
+    def to_json(self) -> dict:
+        """Convert the curve to a JSON serializable dictionary."""
+        return {
+            "samples": [asdict(sample) for sample in self.samples],
+            "exponent": self.exponent,
+            "complexity": self.complexity,
+        }
+
+    @classmethod
+    def from_json(cls, key: str, data: dict) -> "Curve":
+        """Read a curve from a dictionary in a baseline file."""
+        day, part = key.split(".")
+        return cls(day, part, [Sample(**sample) for sample in data["samples"]])
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A solution that got slower, or stopped working, compared to the baseline."""
+
+    day: str
+    part: str
+    size: int
+    baseline: float
+    current: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        """Return how many times slower the current run is compared to the baseline."""
+        return self.current / self.baseline if self.current is not None else None
+
+
+def fit_points(samples: Iterable[Sample]) -> list[tuple[int, float]]:
+    """Return the successful samples that took long enough to fit a curve through."""
+    return [
+        (sample.size, sample.wall_time)
+        for sample in samples
+        if sample.error is None and sample.wall_time >= MIN_FIT_TIME
+    ]
+
+
+def least_squares(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """Return the slope and the sum of squared residuals of a least squares line fit."""
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    slope = (
+        sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / variance
+        if variance
+        else 0.0
+    )
+
+    residuals = sum(
+        (y - (mean_y + slope * (x - mean_x))) ** 2 for x, y in zip(xs, ys, strict=True)
+    )
+
+    return slope, residuals
+
+
+def is_exponential(samples: Iterable[Sample]) -> bool:
+    """Determine whether `t = c * b^n` fits the samples better than `t = c * n^k`."""
+    points = fit_points(samples)
+    log_times = [math.log(t) for _, t in points]
+
+    _, polynomial_residuals = least_squares([math.log(n) for n, _ in points], log_times)
+    _, exponential_residuals = least_squares([float(n) for n, _ in points], log_times)
+
+    return exponential_residuals < polynomial_residuals
+
+
+def sizes_for(day: str) -> list[int]:
+    """Return the doubling input sizes to benchmark the given day on."""
+    smallest, largest = SCALES.get(day, LINE_SCALE)
+    return [smallest * 2**i for i in range(int(math.log2(largest // smallest)) + 1)]
+
+
+def measure(  # noqa: PLR0913
+    solution: Solution,
+    size: int,
+    directory: Path,
+    seed: int,
+    repeat: int,
+    timeout: float | None,
+) -> Sample:
+    """Measure a solution on a generated input of the given size, keeping the fastest run."""
+    path = write_input(solution.day, size, directory / f"{solution.day}_{size}", seed)
+    arguments = BENCHMARK_ARGUMENTS.get((solution.day, solution.part))
+
+    if arguments is not None:
+        solution = replace(solution, arguments=arguments(size))
+
+    measurements: list[Measurement] = []
+
+    for _ in range(repeat):
+        (measurement,) = run_solutions([(solution, path)], workers=1, timeout=timeout)
+        measurements.append(measurement)
+
+        if measurement.error is not None:
+            break
+
+    fastest = min(measurements, key=lambda measurement: measurement.wall_time)
+    error = next((measurement.error for measurement in measurements if measurement.error), None)
+
+    return Sample(
+        size=size,
+        wall_time=fastest.wall_time,
+        cpu_time=fastest.cpu_time,
+        peak_rss=max(measurement.peak_rss or 0 for measurement in measurements) or None,
+        error=error,
+    )
+
+
+def benchmark(  # noqa: PLR0913
+    solutions: Iterable[Solution],
+    sizes: dict[str, list[int]] | None = None,
+    budget: float = 2,
+    timeout: float | None = 30,
+    repeat: int = 3,
+    seed: int = 0,
+) -> list[Curve]:
+    """
+    Measure the scaling curve of every solution.
+
+    Solutions run on inputs of increasing size until a run exceeds the time budget or fails. Pass
+    `sizes` to benchmark each solution on exactly the given sizes instead.
+    """
+    curves = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for solution in solutions:
+            if solution.day not in GENERATORS:
+                continue
+
+            curve = Curve(solution.day, solution.part)
+
+            if sizes is not None and curve.key not in sizes:
+                continue
+
+            solution_sizes = sizes[curve.key] if sizes is not None else sizes_for(solution.day)
+
+            for size in solution_sizes:
+                sample = measure(solution, size, Path(directory), seed, repeat, timeout)
+                curve.samples.append(sample)
+
+                logging.info("%s at size %d: %.3fs", curve.key, size, sample.wall_time)
+
+                if sample.error is not None or (sizes is None and sample.wall_time > budget):
+                    break
+
+            curves.append(curve)
+
+    return curves
+
+
+def compare(
+    baseline: Iterable[Curve],
+    current: Iterable[Curve],
+    threshold: float,
+) -> list[Regression]:
+    """
+    Compare the current curves against the baseline curves.
+
+    A solution regresses when it is more than `threshold` slower than the baseline at the largest
+    size measured in both runs, or when it fails at a size where the baseline succeeded.
+    """
+    current_curves = {curve.key: curve for curve in current}
+    regressions = []
+
+    for baseline_curve in baseline:
+        current_curve = current_curves.get(baseline_curve.key)
+
+        if current_curve is None:
+            continue
+
+        current_samples = {sample.size: sample for sample in current_curve.samples}
+        common = [
+            (sample, current_samples[sample.size])
+            for sample in baseline_curve.samples
+            if sample.error is None and sample.size in current_samples
+        ]
+
+        if not common:
+            continue
+
+        baseline_sample, current_sample = common[-1]
+
+        if current_sample.error is not None:
+            current_time = None
+        elif current_sample.wall_time > baseline_sample.wall_time * (1 + threshold):
+            current_time = current_sample.wall_time
+        else:
+            continue
+
+        regressions.append(
+            Regression(
+                day=baseline_curve.day,
+                part=baseline_curve.part,
+                size=baseline_sample.size,
+                baseline=baseline_sample.wall_time,
+                current=current_time,
+            ),
+        )
+
+    return regressions
+
+
+def read_baseline(path: Path) -> list[Curve]:
+    """Read the curves from a baseline file."""
+    data = json.loads(path.read_text())
+    return [Curve.from_json(key, curve) for key, curve in data["curves"].items()]
+
+
+def write_baseline(path: Path, curves: Iterable[Curve], seed: int) -> None:
+    """Write the curves to a baseline file."""
+    data = {"seed": seed, "curves": {curve.key: curve.to_json() for curve in curves}}
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def format_curves(curves: Iterable[Curve]) -> str:
+    """Format the scaling curves as a plain text table."""
+    lines = [f"{'solution':<12}  {'max size':>8}  {'time (s)':>8}  {'exponent':>8}  complexity"]
+
+    for curve in curves:
+        last = curve.samples[-1] if curve.samples else None
+        exponent = curve.exponent
+
+        lines.append(
+            f"{curve.key:<12}  {last.size if last else '-':>8}  "
+            f"{f'{last.wall_time:.3f}' if last else '-':>8}  "
+            f"{f'{exponent:.2f}' if exponent is not None else '-':>8}  {curve.complexity}"
+            + (f"  ({last.error})" if last and last.error else ""),
+        )
+
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: Iterable[Regression]) -> str:
+    """Format the regressions as a plain text report."""
+    return "\n".join(
+        f"{regression.day}.{regression.part} at size {regression.size}: "
+        + (
+            f"{regression.baseline:.3f}s -> {regression.current:.3f}s ({regression.ratio:.2f}x)"
+            if regression.current is not None
+            else f"{regression.baseline:.3f}s -> failed"
+        )
+        for regression in regressions
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the solutions on synthetic inputs of increasing size.",
+    )
+    parser.add_argument("--days", type=int, nargs="+", help="only benchmark the given days")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size, fastest is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds allowed per run")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure the scaling curves")
+    run.add_argument("--budget", type=float, default=2, help="stop growing after this many seconds")
+    run.add_argument("--output", type=Path, help="write the curves to this baseline file")
+
+    compare = commands.add_parser("compare", help="compare against a baseline file")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative slowdown that counts as a regression",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark selected on the command line and return the exit code."""
+    args = parse_args(argv)
+    solutions = discover_solutions(args.days)
+
+    if args.command == "run":
+        curves = benchmark(solutions, None, args.budget, args.timeout, args.repeat, args.seed)
+
+        if args.output is not None:
+            write_baseline(args.output, curves, args.seed)
+
+        sys.stdout.write(format_curves(curves) + "\n")
+        return 0
+
+    baseline = read_baseline(args.baseline)
+    sizes = {curve.key: [sample.size for sample in curve.samples] for curve in baseline}
+    seed = json.loads(args.baseline.read_text())["seed"]
+
+    curves = benchmark(solutions, sizes, timeout=args.timeout, repeat=args.repeat, seed=seed)
+    regressions = compare(baseline, curves, args.threshold)
+
+    sys.stdout.write(format_curves(curves) + "\n")
+
+    if regressions:
+        sys.stdout.write("\nRegressions:\n" + format_regressions(regressions) + "\n")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    sys.exit(main())
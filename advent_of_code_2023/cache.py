@@ -0,0 +1,203 @@
+"""A content-addressed, on-disk cache for the results of Advent of Code 2023 solutions."""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from .streams import read_blocks
+
+CACHE_DIRECTORY = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "advent_of_code_2023"
+)
+
+# Entries are tiny, so this keeps the results of many thousands of runs around.
+MAX_CACHE_SIZE = 1 << 20
+
+Answer = int | float
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 digest of the contents of a file."""
+    digest = hashlib.sha256()
+
+    for block in read_blocks(path):
+        digest.update(block)
+
+    return digest.hexdigest()
+
+
+def imported_modules(module: ModuleType) -> list[ModuleType]:
+    """
+    Return the module and every module of the same top-level package that it uses.
+
+    A module uses another one if it holds the other module, or a function or class defined in it,
+    as a global, so modules that a solution reaches through the package's `__init__` re-exports are
+    found as well. Dependencies are followed transitively.
+    """
+    package = module.__name__.partition(".")[0]
+    found = {module.__name__: module}
+    stack = [module]
+
+    while stack:
+        for value in vars(stack.pop()).values():
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+
+            if not isinstance(name, str) or name in found or name.partition(".")[0] != package:
+                continue
+
+            if (dependency := sys.modules.get(name)) is not None:
+                found[name] = dependency
+                stack.append(dependency)
+
+    return [found[name] for name in sorted(found)]
+
+
+def source_version(function: Callable[..., Answer]) -> str:
+    """
+    Return a version stamp that changes whenever the source of the function changes.
+
+    The stamp covers the module defining the function and every module of the package it uses,
+    such as the day's shared parser and the data structures, so editing any of them invalidates
+    the cached answers.
+    """
+    module = inspect.getmodule(function)
+
+    if module is None:
+        return hashlib.sha256(function.__qualname__.encode()).hexdigest()
+
+    digest = hashlib.sha256()
+
+    for dependency in imported_modules(module):
+        source_file = inspect.getsourcefile(dependency)
+
+        if source_file is not None:
+            digest.update(dependency.__name__.encode())
+            digest.update(hashlib.sha256(Path(source_file).read_bytes()).digest())
+
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    """
+    A size-bounded cache of solution answers, stored as one JSON file per entry.
+
+    Entries are addressed by a hash of everything that determines the answer: the contents of the
+    input file, the solver, its extra arguments and the version of its source. When the cache
+    grows beyond `max_size` bytes, the least recently used entries are evicted. With `bypass` set,
+    every lookup misses, so answers are recomputed and the stored entries refreshed.
+    """
+
+    directory: Path = CACHE_DIRECTORY
+    max_size: int = MAX_CACHE_SIZE
+    bypass: bool = False
+
+    def key(
+        self,
+        function: Callable[..., Answer],
+        path: Path,
+        arguments: dict[str, int],
+        version: str,
+    ) -> str:
+        """Return the cache key for calling the function on the given input file."""
+        parts = [
+            hash_file(path),
+            f"{function.__module__}.{function.__qualname__}",
+            json.dumps(arguments, sort_keys=True),
+            version,
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Answer | None:
+        """Return the cached answer for the given key, or `None` if there is none."""
+        if self.bypass:
+            return None
+
+        entry = self.directory / f"{key}.json"
+
+        try:
+            answer = json.loads(entry.read_text())["answer"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # The modification time doubles as the last access time for eviction.
+        entry.touch()
+
+        return answer
+
+    def put(self, key: str, answer: Answer) -> None:
+        """Store the answer under the given key and evict entries if the cache is too large."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so concurrent readers never see a partial entry.
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, delete=False) as f:
+            json.dump({"answer": answer}, f)
+
+        Path(f.name).replace(self.directory / f"{key}.json")
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within its maximum size."""
+        entries = []
+
+        for entry in self.directory.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, entry in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self.directory.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+
+def cached(
+    function: Callable[..., Answer],
+    cache: ResultCache | None = None,
+    version: str | None = None,
+) -> Callable[..., Answer]:
+    """
+    Wrap a solution entry point so its answers are read from and written to the cache.
+
+    The version defaults to a hash of the source of the module defining the entry point, so
+    editing a solution invalidates its cached answers.
+    """
+    cache = cache or ResultCache()
+    version = version or source_version(function)
+
+    @functools.wraps(function)
+    def wrapper(path: Path, **arguments: int) -> Answer:
+        key = cache.key(function, path, arguments, version)
+
+        if (answer := cache.get(key)) is not None:
+            return answer
+
+        answer = function(path, **arguments)
+        cache.put(key, answer)
+
+        return answer
+
+    return wrapper
@@ -1,7 +1,33 @@
 """Data structures for Advent of Code 2023."""
 
+from .aho_corasick import AhoCorasick
+from .byte_trie_map import ByteTrieMap
+from .frozen_trie_map import FrozenTrieMap
+from .grid import Grid
 from .interval import Interval
+from .interval_array import IntervalArray
+from .interval_set import IntervalSet
+from .interval_tree import IntervalTree
+from .radix_trie_map import RadixTrieMap
+from .range_map import RangeMap
+from .snapshot import load_snapshot, write_snapshot
 from .trie import Trie
-from .trie_map import TrieMap
+from .trie_map import TrieMap, TrieMapCursor
 
-__all__ = ["Interval", "Trie", "TrieMap"]
+__all__ = [
+    "AhoCorasick",
+    "ByteTrieMap",
+    "FrozenTrieMap",
+    "Grid",
+    "Interval",
+    "IntervalArray",
+    "IntervalSet",
+    "IntervalTree",
+    "RadixTrieMap",
+    "RangeMap",
+    "Trie",
+    "TrieMap",
+    "TrieMapCursor",
+    "load_snapshot",
+    "write_snapshot",
+]
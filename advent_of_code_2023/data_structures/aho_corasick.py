@@ -0,0 +1,90 @@
+"""An Aho-Corasick automaton for Advent of Code 2023."""
+
+from collections import deque
+from collections.abc import Generator, Iterable
+from typing import Generic, TypeVar
+
+from .trie_map import TrieMap
+
+T = TypeVar("T")
+
+
+class AhoCorasick(Generic[T]):
+    """
+    An Aho-Corasick automaton, finding all keys of a TrieMap in a text in a single pass.
+
+    Every node of the TrieMap becomes a state. Besides the edges of the TrieMap, each state has a
+    failure link to the state of the longest proper suffix of its prefix that is also a prefix of
+    some key, and an output link to the nearest state along the failure links at which a key ends.
+    The text is read one character at a time, following failure links when there is no edge for
+    it, so a text of length n takes O(n + m) time for m matches. The empty key never matches.
+    """
+
+    def __init__(self, patterns: TrieMap[T]) -> None:
+        """Build the automaton for the keys of the TrieMap."""
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output_links: list[int] = [-1]
+        # The key and value of every state at which a key ends.
+        self.outputs: dict[int, tuple[str, T]] = {}
+
+        nodes = [patterns]
+        prefixes = [""]
+        queue = deque([0])
+
+        # States are numbered in breadth-first order, so the failure links of all shorter prefixes
+        # are known by the time a state is reached.
+        while queue:
+            state = queue.popleft()
+
+            for char, child in nodes[state].children.items():
+                child_state = len(self.goto)
+                prefix = prefixes[state] + char
+
+                fail = self._next_state(self.fail[state], char) if state else 0
+
+                self.goto.append({})
+                self.fail.append(fail)
+                self.output_links.append(fail if fail in self.outputs else self.output_links[fail])
+                self.goto[state][char] = child_state
+
+                if child.value is not None:
+                    self.outputs[child_state] = prefix, child.value
+
+                nodes.append(child)
+                prefixes.append(prefix)
+                queue.append(child_state)
+
+    def __len__(self) -> int:
+        return len(self.outputs)
+
+    def _next_state(self, state: int, char: str) -> int:
+        """Return the state reached from the given one by reading the character."""
+        goto, fail = self.goto, self.fail
+
+        while state and char not in goto[state]:
+            state = fail[state]
+
+        return goto[state].get(char, 0)
+
+    def search(self, text: Iterable[str]) -> Generator[tuple[int, str, T], None, None]:
+        """
+        Yield the start, key and value of every occurrence of a key in the text.
+
+        Occurrences may overlap. They are yielded in the order in which they end, and of the ones
+        that end at the same position, the longest comes first.
+        """
+        goto, fail, output_links, outputs = self.goto, self.fail, self.output_links, self.outputs
+        state = 0
+
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+            match = state if state in outputs else output_links[state]
+
+            while match >= 0:
+                key, value = outputs[match]
+                yield end - len(key), key, value
+                match = output_links[match]
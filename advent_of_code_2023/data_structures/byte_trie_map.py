@@ -0,0 +1,191 @@
+"""A ByteTrieMap data structure for Advent of Code 2023."""
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# The children of every node without any, shared so that leaves do not each need a table.
+_NO_CHILDREN: tuple[None, ...] = (None,) * 256
+
+
+class ByteTrieMap(Generic[T]):
+    """
+    A TrieMap whose keys are bytes, with the children of every node in a table indexed by byte.
+
+    Looking up a child is a single list index with the byte's value, without hashing or creating a
+    one-character string, and keys and texts can be any bytes-like object, such as a memoryview
+    of a memory-mapped file, without decoding them first. Every node with children holds a table
+    of 256 slots, so this suits small dictionaries scanned over large inputs; `RadixTrieMap` suits
+    large dictionaries better. Every node keeps the number of entries below it, like in `TrieMap`.
+    """
+
+    __slots__ = ("children", "value", "size")
+
+    def __init__(self) -> None:
+        self.children: list[ByteTrieMap[T] | None] | tuple[None, ...] = _NO_CHILDREN
+        self.value: T | None = None
+        # The number of entries at or below this node.
+        self.size: int = 0
+
+    @classmethod
+    def create(cls, kv_pairs: dict[bytes, T]) -> "ByteTrieMap[T]":
+        """Create a ByteTrieMap from a dictionary of key-value pairs."""
+        trie = cls()
+        for key, value in kv_pairs.items():
+            trie[key] = value
+        return trie
+
+    def __setitem__(self, key: bytes | memoryview, value: T) -> None:
+        if (node := self._find_node(key)) is not None and node.value is not None:
+            node.value = value
+            return
+
+        node = self
+        node.size += 1
+
+        for byte in key:
+            children = node.children
+
+            if isinstance(children, tuple):
+                children = node.children = list[ByteTrieMap[T] | None](children)
+
+            child = children[byte]
+
+            if child is None:
+                child = children[byte] = ByteTrieMap[T]()
+
+            node = child
+            node.size += 1
+
+        node.value = value
+
+    def __getitem__(self, key: bytes | memoryview) -> T | None:
+        node = self._find_node(key)
+        return node.value if node is not None else None
+
+    def __contains__(self, key: bytes | memoryview) -> bool:
+        node = self._find_node(key)
+        return node is not None and node.value is not None
+
+    def __delitem__(self, key: bytes | memoryview) -> None:
+        path: list[tuple[ByteTrieMap[T], int]] = []
+        node = self
+
+        for byte in key:
+            child = node.children[byte]
+
+            if child is None:
+                return
+
+            path.append((node, byte))
+            node = child
+
+        if node.value is None:
+            return
+
+        node.value = None
+        node.size -= 1
+
+        # Remove the nodes that no longer lead to any value, from the bottom up.
+        for parent, byte in reversed(path):
+            parent.size -= 1
+            children = parent.children
+            child = children[byte]
+
+            if isinstance(children, list) and child is not None and not child.size:
+                children[byte] = None
+
+                if parent.size == (parent.value is not None):
+                    parent.children = _NO_CHILDREN
+
+    def __iter__(self) -> Iterator[tuple[bytes, T]]:
+        yield from _items(self, b"")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _find_node(self, prefix: bytes | memoryview) -> "ByteTrieMap[T] | None":
+        """Return the node at the end of the prefix, or `None` if there is none."""
+        node: ByteTrieMap[T] | None = self
+
+        for byte in prefix:
+            node = node.children[byte]
+
+            if node is None:
+                return None
+
+        return node
+
+    def has_prefix(self, prefix: bytes | memoryview) -> bool:
+        """Return whether any key starts with the given prefix."""
+        node = self._find_node(prefix)
+        return node is not None and node.size > 0
+
+    def count_prefix(self, prefix: bytes | memoryview) -> int:
+        """Return the number of keys that start with the given prefix."""
+        node = self._find_node(prefix)
+        return node.size if node is not None else 0
+
+    def find(self, prefix: bytes | memoryview) -> Iterator[tuple[bytes, T]]:
+        """Find all entries with the given prefix."""
+        node = self._find_node(prefix)
+
+        if node is not None:
+            yield from _items(node, bytes(prefix))
+
+    def longest_matches(self, data: bytes | memoryview) -> Iterator[tuple[int, bytes, T]]:
+        """
+        Yield the start, key and value of every token, splitting the data into the longest keys.
+
+        The data is scanned from left to right. At every position, the longest key that starts
+        there is yielded and the scan continues after it; positions where no key starts are
+        skipped. The empty key is never matched.
+        """
+        start = 0
+
+        while start < len(data):
+            node: ByteTrieMap[T] | None = self
+            end, value = start, None
+
+            for i in range(start, len(data)):
+                node = node.children[data[i]]
+
+                if node is None:
+                    break
+
+                if node.value is not None:
+                    end, value = i + 1, node.value
+
+            if value is None:
+                start += 1
+            else:
+                yield start, bytes(data[start:end]), value
+                start = end
+
+
+def _items(node: ByteTrieMap[T], prefix: bytes) -> Iterator[tuple[bytes, T]]:
+    """Yield the entries below the node, in the order of their keys, preceded by the prefix."""
+    if node.value is not None:
+        yield (prefix, node.value)
+
+    path = bytearray(prefix)
+    stack = [enumerate(node.children)]
+
+    while stack:
+        for byte, child in stack[-1]:
+            if child is None:
+                continue
+
+            path.append(byte)
+
+            if child.value is not None:
+                yield (bytes(path), child.value)
+
+            stack.append(enumerate(child.children))
+            break
+        else:
+            stack.pop()
+
+            if stack:
+                path.pop()
@@ -0,0 +1,160 @@
+"""A FrozenTrieMap data structure for Advent of Code 2023."""
+
+import pickle
+from array import array
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .trie_map import TrieMap
+
+T = TypeVar("T")
+
+
+class FrozenTrieMap(Generic[T]):
+    """
+    A read-only TrieMap, compiled into flat tables.
+
+    The nodes are numbered breadth first, with the children of every node in the order of their
+    characters, so the children of a node have consecutive numbers and the edge into node i is edge
+    i - 1. The characters of all edges are then stored in a single string, and a node only needs
+    the index of its first edge: finding a child is a search for its character within the edges of
+    the node, and the child's number follows from where the character was found. The values and
+    the number of entries below every node are kept in flat tables as well, so the whole map is a
+    handful of objects that pickle quickly, whatever its size. The tables can also be any sequence
+    of integers, such as a memoryview of a snapshot. Entries are yielded in the order of their keys.
+    """
+
+    def __init__(self, trie: "TrieMap[T]") -> None:
+        """Compile the entries of the TrieMap."""
+        chars: list[str] = []
+        first_edges = array("q", [0])
+        value_ids = array("q")
+        sizes = array("q")
+        self.values: list[T] = []
+
+        queue = deque([trie])
+
+        while queue:
+            node = queue.popleft()
+
+            if node.value is not None:
+                value_ids.append(len(self.values))
+                self.values.append(node.value)
+            else:
+                value_ids.append(-1)
+
+            sizes.append(node.size)
+
+            for char in sorted(node.children):
+                chars.append(char)
+                queue.append(node.children[char])
+
+            first_edges.append(len(chars))
+
+        self.chars = "".join(chars)
+        self.first_edges: Sequence[int] = first_edges
+        self.value_ids: Sequence[int] = value_ids
+        self.sizes: Sequence[int] = sizes
+
+    @classmethod
+    def from_tables(cls, tables: Mapping[str, memoryview]) -> "FrozenTrieMap[T]":
+        """Create a FrozenTrieMap on the tables of a snapshot, without copying the integer ones."""
+        frozen = cls.__new__(cls)
+        frozen.chars = str(tables["chars"], "utf-8")
+        frozen.first_edges = tables["first_edges"]
+        frozen.value_ids = tables["value_ids"]
+        frozen.sizes = tables["sizes"]
+        # Snapshots are written by `to_tables`, so their values are as trusted as the map itself.
+        frozen.values = pickle.loads(tables["values"])  # noqa: S301
+        return frozen
+
+    def to_tables(self) -> dict[str, memoryview]:
+        """Return the tables of the map as buffers, to write a snapshot of it."""
+        return {
+            "chars": memoryview(self.chars.encode()),
+            "first_edges": memoryview(array("q", self.first_edges)),
+            "value_ids": memoryview(array("q", self.value_ids)),
+            "sizes": memoryview(array("q", self.sizes)),
+            "values": memoryview(pickle.dumps(self.values)),
+        }
+
+    def __getitem__(self, key: str) -> T | None:
+        state = self._find_state(key)
+
+        if state < 0 or self.value_ids[state] < 0:
+            return None
+
+        return self.values[self.value_ids[state]]
+
+    def __contains__(self, key: str) -> bool:
+        state = self._find_state(key)
+        return state >= 0 and self.value_ids[state] >= 0
+
+    def __iter__(self) -> Iterator[tuple[str, T]]:
+        yield from self._items(0, "")
+
+    def __len__(self) -> int:
+        return self.sizes[0]
+
+    def _find_state(self, prefix: str) -> int:
+        """Return the number of the node at the end of the prefix, or -1 if there is none."""
+        chars, first_edges = self.chars, self.first_edges
+        state = 0
+
+        for char in prefix:
+            edge = chars.find(char, first_edges[state], first_edges[state + 1])
+
+            if edge < 0:
+                return -1
+
+            state = edge + 1
+
+        return state
+
+    def _items(self, state: int, prefix: str) -> Iterator[tuple[str, T]]:
+        """Yield the entries below the node, depth first, with their keys preceded by the prefix."""
+        chars, first_edges, value_ids, values = (
+            self.chars,
+            self.first_edges,
+            self.value_ids,
+            self.values,
+        )
+
+        if value_ids[state] >= 0:
+            yield (prefix, values[value_ids[state]])
+
+        path = [prefix]
+        stack = [iter(range(first_edges[state], first_edges[state + 1]))]
+
+        while stack:
+            for edge in stack[-1]:
+                path.append(chars[edge])
+                child = edge + 1
+
+                if value_ids[child] >= 0:
+                    yield ("".join(path), values[value_ids[child]])
+
+                stack.append(iter(range(first_edges[child], first_edges[child + 1])))
+                break
+            else:
+                stack.pop()
+                path.pop()
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return whether any key starts with the given prefix."""
+        state = self._find_state(prefix)
+        return state >= 0 and self.sizes[state] > 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """Return the number of keys that start with the given prefix."""
+        state = self._find_state(prefix)
+        return self.sizes[state] if state >= 0 else 0
+
+    def find(self, prefix: str) -> Iterator[tuple[str, T]]:
+        """Find all entries with the given prefix."""
+        state = self._find_state(prefix)
+
+        if state >= 0:
+            yield from self._items(state, prefix)
@@ -0,0 +1,223 @@
+"""A Grid data structure for Advent of Code 2023."""
+
+from collections.abc import Generator, Iterable
+
+
+class RaggedGridError(Exception):
+    """Raised when the rows of a grid do not all have the same length."""
+
+
+class Grid:
+    """
+    A two dimensional grid of bytes, stored in a single flat buffer.
+
+    Cells are addressed by `(x, y)` coordinates, or by their flat index `y * width + x`. Views such
+    as `transpose`, `flip_vertical` and `read_only` share the buffer of the grid they were created
+    from, and only differ in how coordinates map onto it or in whether cells can be set.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        width: int,
+        height: int,
+        data: bytearray | memoryview | None = None,
+        offset: int = 0,
+        row_stride: int | None = None,
+        column_stride: int = 1,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.data: bytearray | memoryview = data if data is not None else bytearray(width * height)
+        self.offset = offset
+        self.row_stride = row_stride if row_stride is not None else width
+        self.column_stride = column_stride
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes]) -> "Grid":
+        """Create a Grid from the given lines, skipping empty lines."""
+        rows = [line.encode() if isinstance(line, str) else line for line in lines]
+        rows = [row.strip() for row in rows if row.strip()]
+
+        width = len(rows[0]) if rows else 0
+
+        if any(len(row) != width for row in rows):
+            raise RaggedGridError
+
+        return cls(width, len(rows), bytearray(b"".join(rows)))
+
+    @classmethod
+    def from_text(cls, text: str | bytes) -> "Grid":
+        """Create a Grid from text with one row per line."""
+        return cls.from_lines(text.splitlines())
+
+    def __repr__(self) -> str:
+        return f"Grid({self.width}, {self.height})"
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(row).decode() for row in self.rows())
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return (self.width, self.height) == (other.width, other.height) and all(
+            a == b for a, b in zip(self.rows(), other.rows(), strict=True)
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __getitem__(self, key: tuple[int, int]) -> int:
+        x, y = key
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(key)
+
+        return self.data[self.offset + y * self.row_stride + x * self.column_stride]
+
+    def __setitem__(self, key: tuple[int, int], value: int) -> None:
+        x, y = key
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(key)
+
+        self.data[self.offset + y * self.row_stride + x * self.column_stride] = value
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Return whether the rows of the grid are laid out one after the other in the buffer."""
+        return self.offset == 0 and self.row_stride == self.width and self.column_stride == 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Return whether the given coordinates lie within the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat index of the given coordinates."""
+        if not self.in_bounds(x, y):
+            raise IndexError((x, y))
+
+        return y * self.width + x
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        """Return the coordinates of the given flat index."""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def get(self, index: int) -> int:
+        """Return the value at the given flat index."""
+        if self.is_contiguous:
+            return self.data[index]
+
+        return self[self.coordinates(index)]
+
+    def get_wrapped(self, x: int, y: int) -> int:
+        """Return the value at the given coordinates, wrapping around the edges like a torus."""
+        return self[x % self.width, y % self.height]
+
+    def neighbours(self, index: int) -> Generator[int, None, None]:
+        """Iterate over the flat indices of the orthogonal neighbours of the given flat index."""
+        y, x = divmod(index, self.width)
+
+        if y > 0:
+            yield index - self.width
+        if x > 0:
+            yield index - 1
+        if x < self.width - 1:
+            yield index + 1
+        if y < self.height - 1:
+            yield index + self.width
+
+    def row(self, y: int) -> memoryview:
+        """Return a view of the row at the given index."""
+        if not 0 <= y < self.height:
+            raise IndexError(y)
+
+        return self._slice(self.offset + y * self.row_stride, self.column_stride, self.width)
+
+    def column(self, x: int) -> memoryview:
+        """Return a view of the column at the given index."""
+        if not 0 <= x < self.width:
+            raise IndexError(x)
+
+        return self._slice(self.offset + x * self.column_stride, self.row_stride, self.height)
+
+    def rows(self) -> Generator[memoryview, None, None]:
+        """Iterate over views of all rows from top to bottom."""
+        for y in range(self.height):
+            yield self.row(y)
+
+    def columns(self) -> Generator[memoryview, None, None]:
+        """Iterate over views of all columns from left to right."""
+        for x in range(self.width):
+            yield self.column(x)
+
+    def transpose(self) -> "Grid":
+        """Return a view of the grid with rows and columns swapped."""
+        return Grid(
+            self.height,
+            self.width,
+            self.data,
+            self.offset,
+            self.column_stride,
+            self.row_stride,
+        )
+
+    def flip_vertical(self) -> "Grid":
+        """Return a view of the grid with the order of the rows reversed."""
+        return Grid(
+            self.width,
+            self.height,
+            self.data,
+            self.offset + (self.height - 1) * self.row_stride,
+            -self.row_stride,
+            self.column_stride,
+        )
+
+    def read_only(self) -> "Grid":
+        """Return a view of the grid whose cells cannot be set."""
+        return Grid(
+            self.width,
+            self.height,
+            memoryview(self.data).toreadonly(),
+            self.offset,
+            self.row_stride,
+            self.column_stride,
+        )
+
+    def copy(self) -> "Grid":
+        """Return a contiguous, writable copy of the grid."""
+        return Grid(self.width, self.height, self._copy_data())
+
+    def translate(self, table: bytes) -> "Grid":
+        """Return a contiguous copy of the grid with every value mapped through the table."""
+        return Grid(self.width, self.height, self._copy_data().translate(table))
+
+    def find(self, value: int) -> tuple[int, int] | None:
+        """Return the coordinates of the first occurrence of the given value."""
+        for y, row in enumerate(self.rows()):
+            if (x := bytes(row).find(value)) != -1:
+                return x, y
+
+        return None
+
+    def _copy_data(self) -> bytearray:
+        """Return a copy of the values of the grid, with its rows laid out one after the other."""
+        if self.is_contiguous:
+            return bytearray(memoryview(self.data)[: len(self)])
+
+        return bytearray(b"".join(map(bytes, self.rows())))
+
+    def _slice(self, start: int, step: int, length: int) -> memoryview:
+        """Return a view of `length` values in the buffer, `step` apart, from `start`."""
+        view = memoryview(self.data)
+
+        if step == 1:
+            return view[start : start + length]
+
+        return view[start::step][:length]
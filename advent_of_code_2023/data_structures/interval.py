@@ -2,11 +2,20 @@
 
 from collections.abc import Generator
 from dataclasses import dataclass
+from typing import ClassVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Interval:
-    """An Interval data structure."""
+    """
+    An Interval data structure.
+
+    Intervals are half-open and immutable. All empty results of operations are the shared
+    `Interval.EMPTY`, and the predicates answer questions about two intervals without creating a
+    new one.
+    """
+
+    EMPTY: ClassVar["Interval"]
 
     start: int
     end: int
@@ -37,10 +46,13 @@ class Interval:
 
     def __and__(self, other: "Interval") -> "Interval":
         """Return the intersection between two intervals."""
-        if self.end < other.start or other.end < self.start:
-            return Interval(0, 0)
+        start = max(self.start, other.start)
+        end = min(self.end, other.end)
 
-        return Interval(max(self.start, other.start), min(self.end, other.end))
+        if start >= end:
+            return Interval.EMPTY
+
+        return Interval(start, end)
 
     def __add__(self, other: "Interval") -> "Interval":
         """Return the union between two intervals."""
@@ -54,4 +66,24 @@ class Interval:
         if other.end < self.start:
             return Interval(other.end, self.start)
 
-        return Interval(0, 0)
+        return Interval.EMPTY
+
+    def overlaps(self, other: "Interval") -> bool:
+        """Return whether the two intervals have any integer in common."""
+        return (
+            self.start < other.end
+            and other.start < self.end
+            and self.start < self.end
+            and other.start < other.end
+        )
+
+    def intersection_length(self, other: "Interval") -> int:
+        """Return the length of the intersection between two intervals."""
+        return max(0, min(self.end, other.end) - max(self.start, other.start))
+
+    def contains_interval(self, other: "Interval") -> bool:
+        """Return whether every integer in the other interval is also in this one."""
+        return not other or (self.start <= other.start and other.end <= self.end)
+
+
+Interval.EMPTY = Interval(0, 0)
@@ -0,0 +1,154 @@
+"""An IntervalArray data structure for Advent of Code 2023."""
+
+from array import array
+from collections.abc import Generator, Iterable, Mapping
+
+from .interval import Interval
+
+
+class MismatchedLengthError(Exception):
+    """Raised when an IntervalArray is given different numbers of starts and ends."""
+
+
+class IntervalArray:
+    """
+    A compact sequence of intervals, stored as two arrays of 64-bit starts and ends.
+
+    Every interval takes 16 bytes, instead of a Python object per `Interval`. Operations work on
+    the whole array at once and return a new array, without creating an `Interval` for each
+    element; intervals are only converted to and from `Interval` when they are added or read.
+    """
+
+    def __init__(self, starts: Iterable[int] = (), ends: Iterable[int] = ()) -> None:
+        self.starts = array("q", starts)
+        self.ends = array("q", ends)
+
+        if len(self.starts) != len(self.ends):
+            raise MismatchedLengthError
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval]) -> "IntervalArray":
+        """Create an IntervalArray from the given intervals."""
+        interval_array = cls()
+        starts, ends = interval_array.starts, interval_array.ends
+
+        for interval in intervals:
+            starts.append(interval.start)
+            ends.append(interval.end)
+
+        return interval_array
+
+    @classmethod
+    def from_tables(cls, tables: Mapping[str, memoryview]) -> "IntervalArray":
+        """Create an IntervalArray from the tables of a snapshot, copying them into arrays."""
+        interval_array = cls()
+        interval_array.starts.frombytes(tables["starts"].cast("B"))
+        interval_array.ends.frombytes(tables["ends"].cast("B"))
+
+        if len(interval_array.starts) != len(interval_array.ends):
+            raise MismatchedLengthError
+
+        return interval_array
+
+    def to_tables(self) -> dict[str, memoryview]:
+        """Return the starts and ends as buffers, to write a snapshot of the array."""
+        return {"starts": memoryview(self.starts), "ends": memoryview(self.ends)}
+
+    def __repr__(self) -> str:
+        return f"IntervalArray({list(self)})"
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> Interval:
+        return Interval(self.starts[index], self.ends[index])
+
+    def __iter__(self) -> Generator[Interval, None, None]:
+        for start, end in zip(self.starts, self.ends, strict=True):
+            yield Interval(start, end)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+
+        return self.starts == other.starts and self.ends == other.ends
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes taken by the starts and ends."""
+        return (len(self.starts) + len(self.ends)) * self.starts.itemsize
+
+    def append(self, interval: Interval) -> None:
+        """Add an interval to the end of the array."""
+        self.starts.append(interval.start)
+        self.ends.append(interval.end)
+
+    def extend(self, other: "IntervalArray") -> None:
+        """Add all intervals of another array to the end of this one."""
+        self.starts.extend(other.starts)
+        self.ends.extend(other.ends)
+
+    def shift(self, offset: int) -> "IntervalArray":
+        """Return the intervals moved by the given offset."""
+        return IntervalArray(
+            [start + offset for start in self.starts],
+            [end + offset for end in self.ends],
+        )
+
+    def clip(self, bound: Interval) -> "IntervalArray":
+        """
+        Return the intervals clipped to lie within the bound.
+
+        Intervals outside of the bound become empty, but are kept, so the result lines up with the
+        original array. Use `intersect` to drop them instead.
+        """
+        lower, upper = bound.start, bound.end
+
+        starts = [min(max(start, lower), upper) for start in self.starts]
+        ends = [max(min(end, upper), lower) for end in self.ends]
+
+        return IntervalArray(starts, ends)
+
+    def intersect(self, interval: Interval) -> "IntervalArray":
+        """Return the non-empty intersections of the intervals with the given interval."""
+        lower, upper = interval.start, interval.end
+        intersection = IntervalArray()
+        starts, ends = intersection.starts, intersection.ends
+
+        for start, end in zip(self.starts, self.ends, strict=True):
+            clipped_start = max(start, lower)
+            clipped_end = min(end, upper)
+
+            if clipped_start < clipped_end:
+                starts.append(clipped_start)
+                ends.append(clipped_end)
+
+        return intersection
+
+    def sort(self) -> None:
+        """Sort the intervals by their start, in place."""
+        order = sorted(range(len(self)), key=self.starts.__getitem__)
+
+        self.starts = array("q", map(self.starts.__getitem__, order))
+        self.ends = array("q", map(self.ends.__getitem__, order))
+
+    def merge(self) -> "IntervalArray":
+        """Return the intervals sorted, with overlapping and adjacent ones merged."""
+        order = sorted(range(len(self)), key=self.starts.__getitem__)
+        merged = IntervalArray()
+        starts, ends = merged.starts, merged.ends
+
+        for index in order:
+            start, end = self.starts[index], self.ends[index]
+
+            if start >= end:
+                continue
+
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return merged
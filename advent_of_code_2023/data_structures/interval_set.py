@@ -0,0 +1,183 @@
+"""An IntervalSet data structure for Advent of Code 2023."""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterable
+
+from .interval import Interval
+
+
+class IntervalSet:
+    """
+    A set of integers, stored as a sorted list of disjoint intervals.
+
+    Intervals are half-open, like `Interval`. Overlapping and adjacent intervals are merged as they
+    are added, so the set never holds more intervals than needed to cover its integers. The starts
+    and ends of the intervals are kept in two parallel sorted lists, so adding or removing an
+    interval takes an O(log n) search for the intervals it overlaps and an O(n) splice of the lists.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+
+        for interval in intervals:
+            self.add(interval)
+
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[tuple[int, int]]) -> "IntervalSet":
+        """Create an IntervalSet from `(start, end)` pairs sorted by their start."""
+        interval_set = cls()
+        starts, ends = interval_set.starts, interval_set.ends
+
+        for start, end in intervals:
+            if start >= end:
+                continue
+
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return interval_set
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(map(str, self)) + "}"
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __iter__(self) -> Generator[Interval, None, None]:
+        for start, end in zip(self.starts, self.ends, strict=True):
+            yield Interval(start, end)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.ends[i]
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the union of two sets."""
+        return self._from_sorted(
+            heapq.merge(
+                zip(self.starts, self.ends, strict=True),
+                zip(other.starts, other.ends, strict=True),
+            ),
+        )
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the intersection of two sets."""
+        intersection = IntervalSet()
+        i, j = 0, 0
+
+        while i < len(self) and j < len(other):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+
+            if start < end:
+                intersection.starts.append(start)
+                intersection.ends.append(end)
+
+            # Move past whichever interval ends first, as it cannot overlap anything further on.
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        return intersection
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        """Return the difference between two sets."""
+        return self & other.complement(self.bounds)
+
+    @property
+    def bounds(self) -> Interval:
+        """Return the smallest interval that covers the whole set, or `Interval.EMPTY` if empty."""
+        if not self.starts:
+            return Interval.EMPTY
+
+        return Interval(self.starts[0], self.ends[-1])
+
+    def copy(self) -> "IntervalSet":
+        """Return a copy of the set."""
+        interval_set = IntervalSet()
+        interval_set.starts = self.starts.copy()
+        interval_set.ends = self.ends.copy()
+        return interval_set
+
+    def add(self, interval: Interval) -> None:
+        """Add all integers in the interval to the set."""
+        if not interval:
+            return
+
+        start, end = interval.start, interval.end
+
+        # The intervals that overlap or touch the new one are merged into it.
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def discard(self, interval: Interval) -> None:
+        """Remove all integers in the interval from the set."""
+        if not interval:
+            return
+
+        start, end = interval.start, interval.end
+
+        # Only the first and last overlapping intervals can stick out of the removed one.
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+
+        if i >= j:
+            return
+
+        starts, ends = [], []
+
+        if self.starts[i] < start:
+            starts.append(self.starts[i])
+            ends.append(start)
+
+        if end < self.ends[j - 1]:
+            starts.append(end)
+            ends.append(self.ends[j - 1])
+
+        self.starts[i:j] = starts
+        self.ends[i:j] = ends
+
+    def overlapping(self, interval: Interval) -> Generator[Interval, None, None]:
+        """Yield the parts of the set that lie within the interval, in order."""
+        start, end = interval.start, interval.end
+
+        for i in range(bisect_right(self.ends, start), bisect_left(self.starts, end)):
+            yield Interval(max(self.starts[i], start), min(self.ends[i], end))
+
+    def complement(self, bound: Interval) -> "IntervalSet":
+        """Return the integers within the bound that are not in the set."""
+        gaps = []
+        start = bound.start
+
+        for interval in self.overlapping(bound):
+            gaps.append((start, interval.start))
+            start = interval.end
+
+        gaps.append((start, bound.end))
+
+        return self._from_sorted(gaps)
@@ -0,0 +1,114 @@
+"""An IntervalTree data structure for Advent of Code 2023."""
+
+from bisect import bisect_left
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from .interval import Interval
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Node(Generic[T]):
+    """A node of an interval tree, holding the intervals that contain its center."""
+
+    center: int
+    # The intervals containing the center, by ascending start and by descending end.
+    by_start: list[tuple[Interval, T]]
+    by_end: list[tuple[Interval, T]]
+    left: "_Node[T] | None"
+    right: "_Node[T] | None"
+
+
+class IntervalTree(Generic[T]):
+    """
+    A static interval tree, mapping intervals to values.
+
+    The tree is built once from all of its intervals. Every node holds the intervals that contain
+    its center point, and the intervals entirely before and after the center go to its left and
+    right subtrees. Finding the intervals that contain a point, or overlap another interval, takes
+    O(log n + k) time for k results. Intervals are half-open, like `Interval`, and empty intervals
+    are ignored.
+    """
+
+    def __init__(self, items: Iterable[tuple[Interval, T]]) -> None:
+        self.items = sorted(
+            ((interval, value) for interval, value in items if interval),
+            key=lambda item: item[0].start,
+        )
+        self.starts = [interval.start for interval, _ in self.items]
+        self.root = self._build(self.items)
+
+    @classmethod
+    def _build(cls, items: list[tuple[Interval, T]]) -> _Node[T] | None:
+        """Build the subtree for the given items, sorted by their start."""
+        if not items:
+            return None
+
+        center = items[len(items) // 2][0].start
+        left, right, by_start = [], [], []
+
+        # Every partition keeps the items in the order of their start.
+        for item in items:
+            if item[0].end <= center:
+                left.append(item)
+            elif item[0].start > center:
+                right.append(item)
+            else:
+                by_start.append(item)
+
+        return _Node(
+            center=center,
+            by_start=by_start,
+            by_end=sorted(by_start, key=lambda item: item[0].end, reverse=True),
+            left=cls._build(left) if left else None,
+            right=cls._build(right) if right else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Generator[tuple[Interval, T], None, None]:
+        yield from self.items
+
+    def stab(self, point: int) -> Generator[tuple[Interval, T], None, None]:
+        """Yield the intervals that contain the point, along with their values."""
+        node = self.root
+
+        while node is not None:
+            if point < node.center:
+                # These intervals all end after the center, so they contain the point if they
+                # start before it.
+                for item in node.by_start:
+                    if item[0].start > point:
+                        break
+                    yield item
+
+                node = node.left
+            else:
+                # These intervals all start before the center, so they contain the point if they
+                # end after it.
+                for item in node.by_end:
+                    if item[0].end <= point:
+                        break
+                    yield item
+
+                node = node.right if point > node.center else None
+
+    def overlapping(self, interval: Interval) -> Generator[tuple[Interval, T], None, None]:
+        """Yield the intervals that overlap the given interval, along with their values."""
+        if not interval:
+            return
+
+        # The intervals that start before the given one overlap it if they contain its start, and
+        # the ones that start within it always overlap it.
+        for item in self.stab(interval.start):
+            if item[0].start < interval.start:
+                yield item
+
+        first = bisect_left(self.starts, interval.start)
+        last = bisect_left(self.starts, interval.end, lo=first)
+
+        yield from self.items[first:last]
@@ -0,0 +1,230 @@
+"""A RadixTrieMap data structure for Advent of Code 2023."""
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RadixTrieMap(Generic[T]):
+    """
+    A path-compressed TrieMap, whose edges are labelled with strings instead of characters.
+
+    Every node other than the root either holds a value or branches into at least two children, so
+    a run of characters that only one key follows takes a single node instead of one per character.
+    Nodes are split when a key diverges from an edge part of the way along it, and merged with
+    their only child again when a deletion leaves them without a value. The children of a node are
+    indexed by the first character of their label, and every node keeps the number of entries
+    below it, like in `TrieMap`.
+    """
+
+    __slots__ = ("children", "label", "value", "size")
+
+    def __init__(self) -> None:
+        self.children: dict[str, RadixTrieMap[T]] = {}
+        # The characters on the edge into this node.
+        self.label: str = ""
+        self.value: T | None = None
+        # The number of entries at or below this node.
+        self.size: int = 0
+
+    @classmethod
+    def create(cls, kv_pairs: dict[str, T]) -> "RadixTrieMap[T]":
+        """Create a RadixTrieMap from a dictionary of key-value pairs."""
+        trie = cls()
+        for key, value in kv_pairs.items():
+            trie[key] = value
+        return trie
+
+    @classmethod
+    def _leaf(cls, label: str, value: T) -> "RadixTrieMap[T]":
+        """Create a node without children for the given label and value."""
+        leaf = cls()
+        leaf.label = label
+        leaf.value = value
+        leaf.size = 1
+        return leaf
+
+    def __setitem__(self, key: str, value: T) -> None:
+        if (node := self._find_node(key)) is not None and node.value is not None:
+            node.value = value
+            return
+
+        node = self
+        node.size += 1
+        i = 0
+
+        while i < len(key):
+            child = node.children.get(key[i])
+
+            if child is None:
+                node.children[key[i]] = self._leaf(key[i:], value)
+                return
+
+            label = child.label
+            common = _common_prefix_length(label, key, i)
+
+            # The key leaves the edge part of the way along it, so split the edge at that point.
+            if common < len(label):
+                middle = RadixTrieMap[T]()
+                middle.label = label[:common]
+                middle.size = child.size
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+
+            child.size += 1
+            node = child
+            i += common
+
+        node.value = value
+
+    def __getitem__(self, key: str) -> T | None:
+        node = self._find_node(key)
+        return node.value if node is not None else None
+
+    def __contains__(self, key: str) -> bool:
+        node = self._find_node(key)
+        return node is not None and node.value is not None
+
+    def __delitem__(self, key: str) -> None:
+        path: list[RadixTrieMap[T]] = [self]
+        i = 0
+
+        while i < len(key):
+            child = path[-1].children.get(key[i])
+
+            if child is None or not key.startswith(child.label, i):
+                return
+
+            path.append(child)
+            i += len(child.label)
+
+        node = path[-1]
+
+        if node.value is None:
+            return
+
+        node.value = None
+
+        for parent in path:
+            parent.size -= 1
+
+        if node is self:
+            return
+
+        parent = path[-2]
+
+        if not node.size:
+            del parent.children[node.label[0]]
+
+            # Removing the leaf can leave its parent with a single child and no value.
+            if parent is not self and parent.value is None and len(parent.children) == 1:
+                _merge_with_child(path[-3], parent)
+        elif len(node.children) == 1:
+            _merge_with_child(parent, node)
+
+    def __iter__(self) -> Iterator[tuple[str, T]]:
+        yield from _items(self, "")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _find_node(self, key: str) -> "RadixTrieMap[T] | None":
+        """Return the node at the end of the key, or `None` if there is none."""
+        node = self
+        i = 0
+
+        while i < len(key):
+            child = node.children.get(key[i])
+
+            if child is None or not key.startswith(child.label, i):
+                return None
+
+            node = child
+            i += len(child.label)
+
+        return node
+
+    def _find_prefix(self, prefix: str) -> "tuple[RadixTrieMap[T], str] | None":
+        """Return the highest node whose key starts with the prefix, along with its key."""
+        node = self
+        i = 0
+
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+
+            if child is None:
+                return None
+
+            if not prefix.startswith(child.label, i):
+                # The prefix may still end part of the way along the edge.
+                if child.label.startswith(prefix[i:]):
+                    return child, prefix[:i] + child.label
+
+                return None
+
+            node = child
+            i += len(child.label)
+
+        return node, prefix
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return whether any key starts with the given prefix."""
+        found = self._find_prefix(prefix)
+        return found is not None and found[0].size > 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """Return the number of keys that start with the given prefix."""
+        found = self._find_prefix(prefix)
+        return found[0].size if found is not None else 0
+
+    def find(self, prefix: str) -> Iterator[tuple[str, T]]:
+        """Find all entries with the given prefix."""
+        found = self._find_prefix(prefix)
+
+        if found is not None:
+            yield from _items(*found)
+
+
+def _common_prefix_length(label: str, key: str, start: int) -> int:
+    """Return the number of leading characters of the label that the key has from the start."""
+    if key.startswith(label, start):
+        return len(label)
+
+    length = 0
+
+    while start + length < len(key) and label[length] == key[start + length]:
+        length += 1
+
+    return length
+
+
+def _merge_with_child(parent: RadixTrieMap[T], node: RadixTrieMap[T]) -> None:
+    """Replace a node without a value by its only child, joining the labels of both."""
+    (child,) = node.children.values()
+    child.label = node.label + child.label
+    parent.children[child.label[0]] = child
+
+
+def _items(node: RadixTrieMap[T], prefix: str) -> Iterator[tuple[str, T]]:
+    """Yield the entries below the node, depth first, with their keys preceded by the prefix."""
+    if node.value is not None:
+        yield (prefix, node.value)
+
+    path = [prefix]
+    stack = [iter(node.children.values())]
+
+    while stack:
+        for child in stack[-1]:
+            path.append(child.label)
+
+            if child.value is not None:
+                yield ("".join(path), child.value)
+
+            stack.append(iter(child.children.values()))
+            break
+        else:
+            stack.pop()
+            path.pop()
@@ -0,0 +1,160 @@
+"""A RangeMap data structure for Advent of Code 2023."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterable, Mapping, Sequence
+
+from .interval import Interval
+from .interval_set import IntervalSet
+
+
+class OverlappingRangesError(Exception):
+    """Raised when the ranges of a RangeMap overlap."""
+
+
+class RangeMap:
+    """
+    A map of integers that moves ranges of them by an offset, and leaves all others in place.
+
+    The map is stored as a step function: a sorted list of breakpoints, each with the offset that
+    applies from it up to the next breakpoint. Integers before the first breakpoint are not moved,
+    and neither are the ones after the last, whose offset is always 0. Looking up an integer takes
+    a single binary search, and two maps compose into one, so a whole chain of maps can be
+    collapsed before it is applied. The breakpoints and offsets can be any sequence of integers,
+    such as a memoryview of a snapshot.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[Interval, int]] = ()) -> None:
+        """Create a map that moves every given source range by the offset paired with it."""
+        points: list[int] = []
+        offsets: list[int] = []
+        end = None
+
+        for source, offset in sorted(ranges, key=lambda item: item[0].start):
+            if not source:
+                continue
+
+            if end is not None and source.start < end:
+                raise OverlappingRangesError
+
+            points.extend((source.start, source.end))
+            offsets.extend((offset, 0))
+            end = source.end
+
+        self.points: Sequence[int]
+        self.offsets: Sequence[int]
+        self.points, self.offsets = self._normalize(points, offsets)
+
+    @classmethod
+    def _from_steps(cls, points: list[int], offsets: list[int]) -> "RangeMap":
+        """Create a RangeMap from sorted breakpoints and the offsets that start at them."""
+        range_map = cls()
+        range_map.points, range_map.offsets = cls._normalize(points, offsets)
+        return range_map
+
+    @classmethod
+    def from_tables(cls, tables: Mapping[str, memoryview]) -> "RangeMap":
+        """Create a RangeMap on the tables of a snapshot, without copying them."""
+        range_map = cls()
+        range_map.points = tables["points"]
+        range_map.offsets = tables["offsets"]
+        return range_map
+
+    def to_tables(self) -> dict[str, memoryview]:
+        """Return the breakpoints and offsets as buffers, to write a snapshot of the map."""
+        return {
+            "points": memoryview(array("q", self.points)),
+            "offsets": memoryview(array("q", self.offsets)),
+        }
+
+    @staticmethod
+    def _normalize(points: list[int], offsets: list[int]) -> tuple[list[int], list[int]]:
+        """Drop the breakpoints that do not change the offset."""
+        normalized_points: list[int] = []
+        normalized_offsets: list[int] = []
+        previous = 0
+
+        for i, (point, offset) in enumerate(zip(points, offsets, strict=True)):
+            # Of several offsets starting at the same point, only the last one applies.
+            if i + 1 < len(points) and points[i + 1] == point:
+                continue
+
+            if offset != previous:
+                normalized_points.append(point)
+                normalized_offsets.append(offset)
+                previous = offset
+
+        return normalized_points, normalized_offsets
+
+    def __repr__(self) -> str:
+        return f"RangeMap({list(self)})"
+
+    def __len__(self) -> int:
+        return sum(1 for offset in self.offsets if offset)
+
+    def __iter__(self) -> Generator[tuple[Interval, int], None, None]:
+        """Yield every range that is moved, along with its offset."""
+        for i, offset in enumerate(self.offsets):
+            if offset:
+                yield Interval(self.points[i], self.points[i + 1]), offset
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RangeMap):
+            return NotImplemented
+
+        return list(self.points) == list(other.points) and list(self.offsets) == list(other.offsets)
+
+    def __getitem__(self, point: int) -> int:
+        """Return the integer the given one is mapped to."""
+        return point + self.offset(point)
+
+    def offset(self, point: int) -> int:
+        """Return the offset the given integer is moved by."""
+        i = bisect_right(self.points, point) - 1
+        return self.offsets[i] if i >= 0 else 0
+
+    def image(self, intervals: Iterable[Interval]) -> IntervalSet:
+        """Return the integers that the given intervals are mapped to."""
+        image = IntervalSet()
+
+        for interval in intervals:
+            if not interval:
+                continue
+
+            start = interval.start
+            i = bisect_right(self.points, start) - 1
+
+            # Split the interval at every breakpoint within it, and move each piece by its offset.
+            while start < interval.end:
+                offset = self.offsets[i] if i >= 0 else 0
+                end = self.points[i + 1] if i + 1 < len(self.points) else interval.end
+                end = min(end, interval.end)
+
+                image.add(Interval(start + offset, end + offset))
+
+                start = end
+                i += 1
+
+        return image
+
+    def compose(self, other: "RangeMap") -> "RangeMap":
+        """Return the map that applies this map first, and then the other one."""
+        points = set(self.points)
+
+        # The composed map can also change its offset wherever this map moves an integer onto a
+        # breakpoint of the other map, so find the breakpoints within the image of every step.
+        for i in range(-1, len(self.points)):
+            offset = self.offsets[i] if i >= 0 else 0
+            low = bisect_left(other.points, self.points[i] + offset) if i >= 0 else 0
+            high = (
+                bisect_left(other.points, self.points[i + 1] + offset)
+                if i + 1 < len(self.points)
+                else len(other.points)
+            )
+
+            points.update(point - offset for point in other.points[low:high])
+
+        sorted_points = sorted(points)
+        offsets = [other[self[point]] - point for point in sorted_points]
+
+        return self._from_steps(sorted_points, offsets)
@@ -0,0 +1,101 @@
+"""Snapshots of Advent of Code 2023 data structures, to share them between processes."""
+
+import json
+import mmap
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Protocol, Self, TypeVar
+
+
+class InvalidSnapshotError(Exception):
+    """Raised when a file is not a snapshot of the expected data structure."""
+
+
+class Snapshottable(Protocol):
+    """A data structure that can be stored as a set of named buffers."""
+
+    @classmethod
+    def from_tables(cls, tables: Mapping[str, memoryview]) -> Self:
+        """Create the data structure on the buffers of a snapshot."""
+        ...
+
+    def to_tables(self) -> dict[str, memoryview]:
+        """Return the buffers that make up the data structure."""
+        ...
+
+
+S = TypeVar("S", bound=Snapshottable)
+
+MAGIC = b"AOC23SNP"
+
+# Every table starts at a multiple of the largest item size, so it can be cast in place.
+_ALIGNMENT = 8
+
+
+def _align(offset: int) -> int:
+    """Round the offset up to the next multiple of the alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_snapshot(path: Path, structure: Snapshottable) -> None:
+    """
+    Write a snapshot of the data structure to a file.
+
+    The file starts with a magic number and a JSON header, which names the type of the data
+    structure and the format, offset and length of each of its tables, followed by the raw bytes of
+    the tables, each aligned to 8 bytes.
+    """
+    tables = structure.to_tables()
+    layout = {}
+    offset = 0
+
+    for name, table in tables.items():
+        layout[name] = {"format": table.format, "offset": offset, "length": table.nbytes}
+        offset = _align(offset + table.nbytes)
+
+    header = json.dumps(
+        {"type": type(structure).__name__, "byteorder": sys.byteorder, "tables": layout},
+    ).encode()
+    preamble = MAGIC + len(header).to_bytes(8, "little") + header
+
+    with path.open("wb") as f:
+        f.write(preamble.ljust(_align(len(preamble)), b"\0"))
+
+        for table in tables.values():
+            f.write(table.cast("B"))
+            f.write(bytes(_align(table.nbytes) - table.nbytes))
+
+
+def load_snapshot(path: Path, cls: type[S]) -> S:
+    """
+    Load a snapshot of a data structure of the given type from a file.
+
+    The file is memory mapped read-only, and the tables are memoryviews of the map, so loading
+    takes constant time for the tables that the data structure does not copy, and processes that
+    load the same snapshot share its pages. The map stays open for as long as any table is in use.
+    """
+    with path.open("rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(data)
+    start = len(MAGIC) + 8
+
+    if len(view) < start or view[: len(MAGIC)] != MAGIC:
+        raise InvalidSnapshotError
+
+    header_length = int.from_bytes(view[len(MAGIC) : start], "little")
+    header = json.loads(bytes(view[start : start + header_length]))
+
+    if header["type"] != cls.__name__ or header["byteorder"] != sys.byteorder:
+        raise InvalidSnapshotError
+
+    base = _align(start + header_length)
+    tables = {
+        name: view[base + table["offset"] : base + table["offset"] + table["length"]].cast(
+            table["format"],
+        )
+        for name, table in header["tables"].items()
+    }
+
+    return cls.from_tables(tables)
@@ -0,0 +1,32 @@
+"""Tests for the AhoCorasick data structure."""
+
+from .aho_corasick import AhoCorasick
+from .trie_map import TrieMap
+
+
+def test__search_overlapping_keys() -> None:
+    """Test whether every occurrence of every key is found, including overlapping ones."""
+    automaton = AhoCorasick(TrieMap.create({"he": 1, "she": 2, "his": 3, "hers": 4}))
+
+    assert len(automaton) == 4
+    assert list(automaton.search("ushers")) == [(1, "she", 2), (2, "he", 1), (2, "hers", 4)]
+    assert list(automaton.search("ahishers")) == [
+        (1, "his", 3),
+        (3, "she", 2),
+        (4, "he", 1),
+        (4, "hers", 4),
+    ]
+
+
+def test__search_without_matches() -> None:
+    """Test whether nothing is found in a text without keys, or with an automaton without keys."""
+    assert not list(AhoCorasick(TrieMap.create({"abc": 1})).search("ababab"))
+    assert not list(AhoCorasick(TrieMap[int]()).search("abc"))
+
+
+def test__search_repeated_key() -> None:
+    """Test whether a key is found at every position it occurs, even if the occurrences overlap."""
+    automaton = AhoCorasick(TrieMap.create({"aa": 1, "a": 2}))
+
+    assert [start for start, key, _ in automaton.search("aaa") if key == "aa"] == [0, 1]
+    assert sum(1 for _, key, _ in automaton.search("aaa") if key == "a") == 3
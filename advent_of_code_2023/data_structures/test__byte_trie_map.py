@@ -0,0 +1,37 @@
+"""Tests for the ByteTrieMap data structure."""
+
+from .byte_trie_map import ByteTrieMap
+
+
+def test__set_get_find_and_delete() -> None:
+    """Test whether entries can be set, looked up, found by prefix and deleted."""
+    trie = ByteTrieMap.create({b"one": 1, b"on": 2, b"two": 3})
+
+    assert list(trie) == [(b"on", 2), (b"one", 1), (b"two", 3)]
+    assert list(trie.find(memoryview(b"on"))) == [(b"on", 2), (b"one", 1)]
+    assert trie[b"on"] == 2
+    assert trie[memoryview(b"two")] == 3
+    assert trie[b"o"] is None
+    assert b"o" not in trie
+    assert len(trie) == 3
+    assert trie.count_prefix(b"o") == 2
+    assert not trie.has_prefix(b"x")
+
+    del trie[b"on"]
+
+    assert list(trie) == [(b"one", 1), (b"two", 3)]
+
+    del trie[b"one"]
+
+    assert [byte for byte, child in enumerate(trie.children) if child] == [ord("t")]
+
+
+def test__longest_matches() -> None:
+    """Test whether data is split into the longest keys, skipping bytes that start none."""
+    trie = ByteTrieMap.create({b"a": 1, b"ab": 2, b"abc": 3, b"bcd": 4})
+
+    assert list(trie.longest_matches(memoryview(b"xabcdabdbcd"))) == [
+        (1, b"abc", 3),
+        (5, b"ab", 2),
+        (8, b"bcd", 4),
+    ]
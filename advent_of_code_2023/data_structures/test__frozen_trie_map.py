@@ -0,0 +1,48 @@
+"""Tests for the FrozenTrieMap data structure."""
+
+import pickle
+
+from .trie_map import TrieMap
+
+
+def test__lookups() -> None:
+    """Test whether a frozen TrieMap has the same entries and prefixes as the original."""
+    trie = TrieMap.create({"two": 3, "one": 1, "on": 2, "": 0})
+    frozen = trie.freeze()
+
+    assert list(frozen) == [("", 0), ("on", 2), ("one", 1), ("two", 3)]
+    assert list(frozen.find("on")) == [("on", 2), ("one", 1)]
+    assert list(frozen.find("x")) == []
+    assert frozen["one"] == 1
+    assert frozen["o"] is None
+    assert "o" not in frozen
+    assert "two" in frozen
+    assert len(frozen) == 4
+    assert frozen.count_prefix("o") == 2
+    assert frozen.has_prefix("tw")
+    assert not frozen.has_prefix("twos")
+
+
+def test__empty() -> None:
+    """Test whether an empty TrieMap can be frozen."""
+    frozen = TrieMap[int]().freeze()
+
+    assert list(frozen) == []
+    assert len(frozen) == 0
+    assert not frozen.has_prefix("")
+
+
+def test__pickle() -> None:
+    """Test whether a frozen TrieMap survives pickling."""
+    frozen = TrieMap.create({"one": 1, "two": 2}).freeze()
+
+    assert list(pickle.loads(pickle.dumps(frozen))) == list(frozen)  # noqa: S301
+
+
+def test__long_keys() -> None:
+    """Test whether keys longer than the recursion limit can be used."""
+    key = "a" * 100_000
+    frozen = TrieMap.create({key: 1}).freeze()
+
+    assert frozen[key] == 1
+    assert list(frozen.find("aaa")) == [(key, 1)]
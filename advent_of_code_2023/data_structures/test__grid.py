@@ -0,0 +1,69 @@
+"""Tests for the Grid data structure."""
+
+import pytest
+
+from .grid import Grid, RaggedGridError
+
+
+def test__from_text() -> None:
+    """Test whether a grid is read row by row, skipping empty lines."""
+    grid = Grid.from_text("abc\ndef\n\n")
+
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[2, 1] == ord("f")
+    assert str(grid) == "abc\ndef"
+
+
+def test__from_text_with_ragged_rows() -> None:
+    """Test whether rows of different lengths are rejected."""
+    with pytest.raises(RaggedGridError):
+        Grid.from_text("abc\nde\n")
+
+
+def test__views_share_the_buffer() -> None:
+    """Test whether transposed and flipped views read and write the original buffer."""
+    grid = Grid.from_text("abc\ndef\n")
+
+    transposed = grid.transpose()
+    flipped = grid.flip_vertical()
+
+    assert str(transposed) == "ad\nbe\ncf"
+    assert str(flipped) == "def\nabc"
+    assert str(flipped.transpose()) == "da\neb\nfc"
+
+    transposed[1, 2] = ord("X")
+    flipped[0, 1] = ord("Y")
+
+    assert str(grid) == "Ybc\ndeX"
+    assert grid.copy() == grid
+    assert grid.copy().data is not grid.data
+
+
+def test__bounds() -> None:
+    """Test whether coordinates outside the grid are rejected unless wrapped."""
+    grid = Grid.from_text("ab\ncd\n")
+
+    with pytest.raises(IndexError):
+        grid[-1, 0]
+
+    assert grid.get_wrapped(-1, 3) == ord("d")
+    assert list(grid.neighbours(grid.index(0, 0))) == [1, 2]
+    assert grid.find(ord("c")) == (0, 1)
+    assert grid.find(ord("z")) is None
+
+
+def test__read_only_view() -> None:
+    """Test whether a read-only view rejects writes, while its copies accept them."""
+    grid = Grid.from_text("ab\ncd\n")
+    view = grid.transpose().read_only()
+
+    with pytest.raises(TypeError):
+        view[0, 1] = ord("X")
+
+    grid[1, 0] = ord("Y")
+    copy = view.copy()
+    copy[0, 1] = ord("X")
+
+    assert str(view) == "ac\nYd"
+    assert str(copy) == "ac\nXd"
+    assert str(view.translate(bytes.maketrans(b"a", b"Z"))) == "Zc\nYd"
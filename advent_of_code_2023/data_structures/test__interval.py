@@ -0,0 +1,43 @@
+"""Tests for the Interval data structure."""
+
+import copy
+import dataclasses
+import pickle
+
+from .interval import Interval
+
+
+def test__empty_results_share_the_sentinel() -> None:
+    """Test whether empty intersections and gaps are all the shared empty interval."""
+    assert Interval(0, 5) & Interval(5, 9) is Interval.EMPTY
+    assert Interval(0, 5) & Interval(7, 9) is Interval.EMPTY
+    assert Interval(0, 5) - Interval(3, 9) is Interval.EMPTY
+    assert Interval(0, 5) & Interval(3, 9) == Interval(3, 5)
+    assert not hasattr(Interval(0, 5), "__dict__")
+
+
+def test__predicates() -> None:
+    """Test whether the predicates agree with the intersection."""
+    a = Interval(0, 5)
+
+    for b in [Interval(5, 9), Interval(3, 9), Interval(1, 2), Interval(2, 2), Interval(-3, 0)]:
+        assert a.overlaps(b) == bool(a & b)
+        assert a.intersection_length(b) == len(a & b)
+        assert a.contains_interval(b) == (a & b == b or not b)
+
+
+def test__hash_matches_equality() -> None:
+    """Test whether equal intervals have equal hashes and can be used as keys."""
+    assert hash(Interval(1, 3)) == hash(Interval(1, 3))
+    assert {Interval(1, 3): "a"}[Interval(1, 3)] == "a"
+
+
+def test__pickle_and_copy() -> None:
+    """Test whether intervals survive pickling, copying and conversion before they are hashed."""
+    interval = Interval(1, 5)
+
+    assert pickle.loads(pickle.dumps(interval)) == interval  # noqa: S301
+    assert copy.deepcopy(interval) == interval
+    assert dataclasses.astuple(interval) == (1, 5)
+    assert hash(interval) == hash(Interval(1, 5))
+    assert dataclasses.astuple(interval) == (1, 5)
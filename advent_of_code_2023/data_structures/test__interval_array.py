@@ -0,0 +1,34 @@
+"""Tests for the IntervalArray data structure."""
+
+import pytest
+
+from .interval import Interval
+from .interval_array import IntervalArray, MismatchedLengthError
+
+
+def test__shift_clip_and_intersect() -> None:
+    """Test whether the bulk operations match the same operations on every interval."""
+    intervals = IntervalArray.from_intervals([Interval(0, 4), Interval(6, 10), Interval(12, 14)])
+
+    assert list(intervals.shift(5)) == [Interval(5, 9), Interval(11, 15), Interval(17, 19)]
+    assert list(intervals.clip(Interval(2, 8))) == [Interval(2, 4), Interval(6, 8), Interval(8, 8)]
+    assert list(intervals.intersect(Interval(2, 8))) == [Interval(2, 4), Interval(6, 8)]
+    assert intervals.nbytes == 6 * 8
+
+
+def test__sort_and_merge() -> None:
+    """Test whether intervals are sorted by start, and overlapping or adjacent ones merged."""
+    intervals = IntervalArray([9, 0, 3, 5, 20], [12, 3, 5, 6, 20])
+
+    assert list(intervals.merge()) == [Interval(0, 6), Interval(9, 12)]
+
+    intervals.sort()
+
+    assert intervals.starts.tolist() == [0, 3, 5, 9, 20]
+    assert intervals.ends.tolist() == [3, 5, 6, 12, 20]
+
+
+def test__mismatched_lengths() -> None:
+    """Test whether starts and ends of different lengths are rejected."""
+    with pytest.raises(MismatchedLengthError):
+        IntervalArray([1, 2], [3])
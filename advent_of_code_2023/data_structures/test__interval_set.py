@@ -0,0 +1,57 @@
+"""Tests for the IntervalSet data structure."""
+
+import random
+
+from .interval import Interval
+from .interval_set import IntervalSet
+
+
+def to_set(interval_set: IntervalSet) -> set[int]:
+    """Return the integers in an interval set."""
+    return {value for interval in interval_set for value in interval}
+
+
+def test__add_merges_overlapping_and_adjacent_intervals() -> None:
+    """Test whether intervals that overlap or touch are merged into one."""
+    interval_set = IntervalSet([Interval(5, 7), Interval(0, 2), Interval(10, 12)])
+    interval_set.add(Interval(2, 5))
+    interval_set.add(Interval(6, 6))
+
+    assert list(interval_set) == [Interval(0, 7), Interval(10, 12)]
+    assert 6 in interval_set
+    assert 7 not in interval_set
+
+
+def test__discard_splits_intervals() -> None:
+    """Test whether removing the middle of an interval leaves both ends."""
+    interval_set = IntervalSet([Interval(0, 10), Interval(12, 14)])
+    interval_set.discard(Interval(3, 13))
+
+    assert list(interval_set) == [Interval(0, 3), Interval(13, 14)]
+    assert list(interval_set.overlapping(Interval(2, 20))) == [Interval(2, 3), Interval(13, 14)]
+    assert interval_set.bounds == Interval(0, 14)
+
+    interval_set.discard(Interval(0, 14))
+
+    assert interval_set.bounds is Interval.EMPTY
+
+
+def test__set_operations_match_python_sets() -> None:
+    """Test whether union, intersection, difference and complement agree with Python sets."""
+    rng = random.Random(2023)
+
+    for _ in range(100):
+        a, b = (
+            IntervalSet(
+                Interval(start, start + rng.randrange(8))
+                for start in rng.sample(range(50), rng.randrange(6))
+            )
+            for _ in range(2)
+        )
+        bound = Interval(10, 40)
+
+        assert to_set(a | b) == to_set(a) | to_set(b)
+        assert to_set(a & b) == to_set(a) & to_set(b)
+        assert to_set(a - b) == to_set(a) - to_set(b)
+        assert to_set(a.complement(bound)) == set(bound) - to_set(a)
+        assert a | b == IntervalSet([*a, *b])
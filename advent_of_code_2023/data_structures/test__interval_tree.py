@@ -0,0 +1,44 @@
+"""Tests for the IntervalTree data structure."""
+
+import random
+
+from .interval import Interval
+from .interval_tree import IntervalTree
+
+
+def test__stab_and_overlapping() -> None:
+    """Test whether the intervals containing a point or overlapping an interval are found."""
+    tree = IntervalTree(
+        [
+            (Interval(0, 5), "a"),
+            (Interval(3, 8), "b"),
+            (Interval(8, 9), "c"),
+            (Interval(4, 4), "d"),
+        ],
+    )
+
+    assert sorted(value for _, value in tree.stab(4)) == ["a", "b"]
+    assert sorted(value for _, value in tree.stab(8)) == ["c"]
+    assert sorted(value for _, value in tree.overlapping(Interval(5, 9))) == ["b", "c"]
+    assert len(tree) == 3
+
+
+def test__queries_match_brute_force() -> None:
+    """Test whether queries find the same intervals as checking every interval."""
+    rng = random.Random(2023)
+
+    for _ in range(50):
+        intervals = [
+            Interval(start, start + rng.randrange(10))
+            for start in (rng.randrange(100) for _ in range(rng.randrange(30)))
+        ]
+        tree = IntervalTree((interval, i) for i, interval in enumerate(intervals))
+
+        for point in range(-1, 110):
+            expected = {i for i, interval in enumerate(intervals) if point in interval}
+            assert {i for _, i in tree.stab(point)} == expected
+
+        for _ in range(20):
+            query = Interval(rng.randrange(100), rng.randrange(100, 120))
+            expected = {i for i, interval in enumerate(intervals) if interval & query}
+            assert {i for _, i in tree.overlapping(query)} == expected
@@ -0,0 +1,92 @@
+"""Tests for the RadixTrieMap data structure."""
+
+import random
+
+from .radix_trie_map import RadixTrieMap
+
+
+def test__set_get_find_and_delete() -> None:
+    """Test whether entries can be set, looked up, found by prefix and deleted."""
+    trie = RadixTrieMap.create({"one": 1, "on": 2, "two": 3})
+
+    assert sorted(trie) == [("on", 2), ("one", 1), ("two", 3)]
+    assert sorted(trie.find("o")) == [("on", 2), ("one", 1)]
+    assert list(trie.find("tw")) == [("two", 3)]
+    assert trie["on"] == 2
+    assert trie["o"] is None
+    assert trie["onex"] is None
+    assert "o" not in trie
+
+    del trie["on"]
+
+    assert sorted(trie) == [("one", 1), ("two", 3)]
+
+    del trie["one"]
+
+    assert list(trie.children) == ["t"]
+
+
+def test__splits_and_merges() -> None:
+    """Test whether edges are split on insertion and merged again on deletion."""
+    trie = RadixTrieMap.create({"calibration": 1})
+
+    assert [child.label for child in trie.children.values()] == ["calibration"]
+
+    trie["calendar"] = 2
+
+    (node,) = trie.children.values()
+    assert node.label == "cal"
+    assert sorted(child.label for child in node.children.values()) == ["endar", "ibration"]
+
+    del trie["calendar"]
+
+    assert [child.label for child in trie.children.values()] == ["calibration"]
+
+    trie["cal"] = 3
+    trie["calendar"] = 2
+    del trie["cal"]
+
+    (node,) = trie.children.values()
+    assert node.label == "cal"
+    assert node.value is None
+
+
+def test__sizes() -> None:
+    """Test whether the number of keys and keys with a prefix follow assignments and deletions."""
+    trie = RadixTrieMap.create({"one": 1, "on": 2, "two": 3})
+    trie["one"] = 4
+
+    assert len(trie) == 3
+    assert trie.count_prefix("o") == 2
+    assert trie.count_prefix("onex") == 0
+    assert trie.has_prefix("tw")
+    assert not trie.has_prefix("twx")
+
+
+def test__matches_dict() -> None:
+    """Test whether random assignments and deletions leave the same entries as a dictionary."""
+    rng = random.Random(0)
+    trie = RadixTrieMap[int]()
+    expected: dict[str, int] = {}
+
+    for i in range(2000):
+        key = "".join(rng.choices("ab", k=rng.randrange(6)))
+
+        if rng.random() < 0.6:
+            trie[key] = i
+            expected[key] = i
+        else:
+            del trie[key]
+            expected.pop(key, None)
+
+    assert sorted(trie) == sorted(expected.items())
+    assert len(trie) == len(expected)
+    assert trie.count_prefix("ab") == sum(key.startswith("ab") for key in expected)
+
+    # Every node other than the root has a value or branches.
+    stack = list(trie.children.values())
+
+    while stack:
+        node = stack.pop()
+        assert node.value is not None or len(node.children) >= 2
+        stack.extend(node.children.values())
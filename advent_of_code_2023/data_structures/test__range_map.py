@@ -0,0 +1,51 @@
+"""Tests for the RangeMap data structure."""
+
+import random
+
+import pytest
+
+from .interval import Interval
+from .interval_set import IntervalSet
+from .range_map import OverlappingRangesError, RangeMap
+
+
+def make_range_map(rng: random.Random) -> RangeMap:
+    """Make a map of a few random, disjoint ranges within [0, 100)."""
+    points = sorted(rng.sample(range(100), 2 * rng.randrange(5)))
+    return RangeMap(
+        (Interval(start, end), rng.randrange(-20, 20))
+        for start, end in zip(points[::2], points[1::2], strict=True)
+    )
+
+
+def test__lookup_and_image() -> None:
+    """Test whether mapped ranges are moved and everything else passes through."""
+    range_map = RangeMap([(Interval(98, 100), -48), (Interval(50, 98), 2)])
+
+    points = [0, 49, 50, 97, 98, 99, 100]
+
+    assert [range_map[point] for point in points] == [0, 49, 52, 99, 50, 51, 100]
+    assert range_map.image([Interval(79, 93), Interval(96, 102)]) == IntervalSet(
+        [Interval(81, 95), Interval(98, 100), Interval(50, 52), Interval(100, 102)],
+    )
+
+
+def test__overlapping_ranges() -> None:
+    """Test whether overlapping source ranges are rejected."""
+    with pytest.raises(OverlappingRangesError):
+        RangeMap([(Interval(0, 5), 1), (Interval(4, 8), 2)])
+
+
+def test__compose_matches_applying_both_maps() -> None:
+    """Test whether a composed map maps every integer like applying both maps in turn."""
+    rng = random.Random(2023)
+
+    for _ in range(100):
+        first, second = make_range_map(rng), make_range_map(rng)
+        composed = first.compose(second)
+
+        for point in range(-30, 130):
+            assert composed[point] == second[first[point]]
+
+        interval = Interval(rng.randrange(100), rng.randrange(100, 130))
+        assert composed.image([interval]) == second.image(first.image([interval]))
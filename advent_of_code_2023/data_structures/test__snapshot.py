@@ -0,0 +1,62 @@
+"""Tests for snapshots of data structures."""
+
+from pathlib import Path
+
+import pytest
+
+from .frozen_trie_map import FrozenTrieMap
+from .interval import Interval
+from .interval_array import IntervalArray
+from .range_map import RangeMap
+from .snapshot import InvalidSnapshotError, load_snapshot, write_snapshot
+from .trie_map import TrieMap
+
+
+def test__frozen_trie_map(tmp_path: Path) -> None:
+    """Test whether a frozen TrieMap can be loaded from a snapshot with the same entries."""
+    frozen = TrieMap.create({"one": 1, "on": 2, "two": 3, "drei": 4}).freeze()
+    write_snapshot(tmp_path / "trie", frozen)
+
+    loaded = load_snapshot(tmp_path / "trie", FrozenTrieMap)
+
+    assert list(loaded) == list(frozen)
+    assert loaded["on"] == 2
+    assert loaded.count_prefix("o") == 2
+    assert isinstance(loaded.sizes, memoryview)
+
+
+def test__interval_array(tmp_path: Path) -> None:
+    """Test whether an IntervalArray can be loaded from a snapshot, and changed afterwards."""
+    intervals = IntervalArray([1, 5, 9], [3, 8, 12])
+    write_snapshot(tmp_path / "intervals", intervals)
+
+    loaded = load_snapshot(tmp_path / "intervals", IntervalArray)
+    loaded.append(Interval(20, 21))
+
+    assert list(loaded) == [*intervals, Interval(20, 21)]
+
+
+def test__range_map(tmp_path: Path) -> None:
+    """Test whether a RangeMap can be loaded from a snapshot, including an empty one."""
+    range_map = RangeMap([(Interval(98, 100), -48), (Interval(50, 98), 2)])
+    write_snapshot(tmp_path / "range_map", range_map)
+    write_snapshot(tmp_path / "empty", RangeMap())
+
+    loaded = load_snapshot(tmp_path / "range_map", RangeMap)
+
+    assert loaded == range_map
+    assert loaded[99] == 51
+    assert loaded.compose(loaded)[50] == 54
+    assert load_snapshot(tmp_path / "empty", RangeMap) == RangeMap()
+
+
+def test__invalid_snapshot(tmp_path: Path) -> None:
+    """Test whether loading a snapshot of another type or another file fails."""
+    write_snapshot(tmp_path / "range_map", RangeMap())
+    (tmp_path / "text").write_text("not a snapshot")
+
+    with pytest.raises(InvalidSnapshotError):
+        load_snapshot(tmp_path / "range_map", IntervalArray)
+
+    with pytest.raises(InvalidSnapshotError):
+        load_snapshot(tmp_path / "text", RangeMap)
@@ -0,0 +1,57 @@
+"""Tests for the Trie data structure."""
+
+from .trie import Trie
+
+
+def test__add_find_and_delete() -> None:
+    """Test whether words can be added, found by prefix and deleted."""
+    trie = Trie.create(["ab", "abc", "b", ""])
+
+    assert list(trie) == ["", "ab", "abc", "b"]
+    assert list(trie.find("a")) == ["ab", "abc"]
+    assert "ab" in trie
+    assert "a" not in trie
+
+    del trie["ab"]
+
+    assert list(trie) == ["", "abc", "b"]
+
+    del trie["abc"]
+    del trie[""]
+
+    assert list(trie) == ["b"]
+    assert list(trie.children) == ["b"]
+
+
+def test__long_words() -> None:
+    """Test whether words longer than the recursion limit can be used."""
+    word = "a" * 100_000
+    trie = Trie.create([word])
+
+    assert word in trie
+    assert len(trie) == 1
+    assert list(trie.find("aaa")) == [word]
+
+
+def test__sizes() -> None:
+    """Test whether the number of words and words with a prefix follow additions and deletions."""
+    trie = Trie.create(["ab", "abc", "b"])
+    trie.add("ab")
+
+    assert len(trie) == 3
+    assert trie.count_prefix("ab") == 2
+    assert trie.count_prefix("c") == 0
+    assert trie.has_prefix("a")
+    assert not trie.has_prefix("ba")
+
+    del trie["a"]
+    del trie["abc"]
+
+    assert len(trie) == 2
+    assert trie.count_prefix("a") == 1
+
+    del trie["ab"]
+    del trie["b"]
+
+    assert len(trie) == 0
+    assert not trie.has_prefix("")
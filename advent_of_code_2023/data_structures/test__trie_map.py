@@ -0,0 +1,82 @@
+"""Tests for the TrieMap data structure."""
+
+from .trie_map import TrieMap
+
+
+def test__set_get_find_and_delete() -> None:
+    """Test whether entries can be set, looked up, found by prefix and deleted."""
+    trie = TrieMap.create({"one": 1, "on": 2, "two": 3})
+
+    assert list(trie) == [("on", 2), ("one", 1), ("two", 3)]
+    assert list(trie.find("on")) == [("on", 2), ("one", 1)]
+    assert trie["on"] == 2
+    assert trie["o"] is None
+    assert "o" not in trie
+
+    del trie["on"]
+
+    assert list(trie) == [("one", 1), ("two", 3)]
+
+    del trie["one"]
+
+    assert list(trie.children) == ["t"]
+
+
+def test__long_keys() -> None:
+    """Test whether keys longer than the recursion limit can be used."""
+    key = "a" * 100_000
+    trie = TrieMap.create({key: 1})
+
+    assert trie[key] == 1
+    assert list(trie.find("aaa")) == [(key, 1)]
+
+
+def test__sizes() -> None:
+    """Test whether the number of keys and keys with a prefix follow assignments and deletions."""
+    trie = TrieMap.create({"one": 1, "on": 2, "two": 3})
+    trie["one"] = 4
+
+    assert len(trie) == 3
+    assert trie.count_prefix("on") == 2
+    assert trie.has_prefix("tw")
+    assert not trie.has_prefix("three")
+
+    del trie["o"]
+    del trie["on"]
+
+    assert len(trie) == 2
+    assert trie.count_prefix("o") == 1
+    assert trie.has_prefix("one")
+    assert not trie.has_prefix("onex")
+
+
+def test__cursor() -> None:
+    """Test whether a cursor reports the values and dead ends along the characters it is fed."""
+    cursor = TrieMap.create({"on": 1, "one": 2}).cursor()
+
+    assert cursor.feed("o") is None
+    assert not cursor.dead
+    assert cursor.feed("n") == 1
+    assert cursor.feed("e") == 2
+    assert cursor.feed("s") is None
+    assert cursor.dead
+    assert cursor.feed("o") is None
+    assert cursor.dead
+
+    cursor.reset()
+
+    assert cursor.feed("o") is None
+    assert cursor.value is None
+    assert not cursor.dead
+
+
+def test__longest_matches() -> None:
+    """Test whether text is split into the longest keys, skipping characters that start none."""
+    trie = TrieMap.create({"a": 1, "ab": 2, "abc": 3, "bcd": 4})
+
+    assert list(trie.longest_matches("xabcdabdbcd")) == [
+        (1, "abc", 3),
+        (5, "ab", 2),
+        (8, "bcd", 4),
+    ]
+    assert list(trie.longest_matches("")) == []
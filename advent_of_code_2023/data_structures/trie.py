@@ -4,11 +4,20 @@ from collections.abc import Generator, Iterable
 
 
 class Trie:
-    """A Trie data structure."""
+    """
+    A Trie data structure.
+
+    All operations walk the Trie with a loop over the characters of the word, instead of recursing
+    on slices of it, so they take O(k) time for a word of length k and work for words of any
+    length. Every node keeps the number of words below it up to date, so the number of words with
+    a given prefix is known as soon as the prefix has been walked.
+    """
 
     def __init__(self) -> None:
         self.children: dict[str, Trie] = {}
         self.end_of_word: bool = False
+        # The number of words ending at or below this node.
+        self.size: int = 0
 
     @classmethod
     def create(cls, words: Iterable[str]) -> "Trie":
@@ -22,53 +31,107 @@ class Trie:
         return self.end_of_word
 
     def __contains__(self, word: str) -> bool:
-        if not word:
-            return self.end_of_word
+        node = self._find_node(word)
+        return node is not None and node.end_of_word
 
-        if word[0] not in self.children:
-            return False
+    def __delitem__(self, word: str) -> None:
+        path: list[tuple[Trie, str]] = []
+        node = self
 
-        return word[1:] in self.children[word[0]]
+        for char in word:
+            if char not in node.children:
+                return
 
-    def __delitem__(self, word: str) -> None:
-        if not word:
-            self.end_of_word = False
+            path.append((node, char))
+            node = node.children[char]
 
-        if word[0] not in self.children:
+        if not node.end_of_word:
             return
 
-        del self.children[word[0]][word[1:]]
+        node.end_of_word = False
+        node.size -= 1
 
-        if not self.children[word[0]]:
-            del self.children[word[0]]
+        # Remove the nodes that no longer lead to any word, from the bottom up.
+        for parent, char in reversed(path):
+            parent.size -= 1
 
-    def __iter__(self) -> Generator[str, None, None]:
-        if self.end_of_word:
-            yield ""
+            if not parent.children[char].size:
+                del parent.children[char]
 
-        for char, child in self.children.items():
-            for word in child:
-                yield char + word
+    def __iter__(self) -> Generator[str, None, None]:
+        yield from _words(self, "")
 
     def __len__(self) -> int:
-        return sum(1 for _ in self)
+        return self.size
+
+    def _find_node(self, prefix: str) -> "Trie | None":
+        """Return the node at the end of the prefix, or `None` if there is none."""
+        node = self
+
+        for char in prefix:
+            child = node.children.get(char)
+
+            if child is None:
+                return None
+
+            node = child
+
+        return node
 
     def add(self, word: str) -> None:
         """Add a word to the Trie."""
-        if not word:
-            self.end_of_word = True
+        if word in self:
             return
 
-        self.children.setdefault(word[0], Trie()).add(word[1:])
+        node = self
+        node.size += 1
+
+        for char in word:
+            child = node.children.get(char)
+
+            if child is None:
+                child = node.children[char] = Trie()
+
+            node = child
+            node.size += 1
+
+        node.end_of_word = True
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return whether any word starts with the given prefix."""
+        node = self._find_node(prefix)
+        return node is not None and node.size > 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """Return the number of words that start with the given prefix."""
+        node = self._find_node(prefix)
+        return node.size if node is not None else 0
 
     def find(self, prefix: str) -> Generator[str, None, None]:
         """Find all words with the given prefix."""
-        if not prefix:
-            yield from self
-            return
+        node = self._find_node(prefix)
 
-        if prefix[0] not in self.children:
-            return
+        if node is not None:
+            yield from _words(node, prefix)
+
+
+def _words(node: Trie, prefix: str) -> Generator[str, None, None]:
+    """Yield the words below the node, depth first, each preceded by the prefix."""
+    if node.end_of_word:
+        yield prefix
+
+    path = [prefix]
+    stack = [iter(node.children.items())]
+
+    while stack:
+        for char, child in stack[-1]:
+            path.append(char)
+
+            if child.end_of_word:
+                yield "".join(path)
 
-        for word in self.children[prefix[0]].find(prefix[1:]):
-            yield prefix[0] + word
+            stack.append(iter(child.children.items()))
+            break
+        else:
+            stack.pop()
+            path.pop()
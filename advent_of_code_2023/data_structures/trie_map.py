@@ -3,15 +3,26 @@
 from collections.abc import Iterator
 from typing import Generic, TypeVar
 
+from .frozen_trie_map import FrozenTrieMap
+
 T = TypeVar("T")
 
 
 class TrieMap(Generic[T]):
-    """A TrieMap data structure."""
+    """
+    A TrieMap data structure.
+
+    All operations walk the TrieMap with a loop over the characters of the key, instead of
+    recursing on slices of it, so they take O(k) time for a key of length k and work for keys of
+    any length. Every node keeps the number of entries below it up to date, so the number of keys
+    with a given prefix is known as soon as the prefix has been walked.
+    """
 
     def __init__(self) -> None:
         self.children: dict[str, TrieMap[T]] = {}
         self.value: T | None = None
+        # The number of entries at or below this node.
+        self.size: int = 0
 
     @classmethod
     def create(cls, kv_pairs: dict[str, T]) -> "TrieMap[T]":
@@ -22,57 +33,180 @@ class TrieMap(Generic[T]):
         return trie
 
     def __setitem__(self, key: str, value: T) -> None:
-        if not key:
-            self.value = value
-        else:
-            self.children.setdefault(key[0], TrieMap[T]())[key[1:]] = value
+        if (node := self._find_node(key)) is not None and node.value is not None:
+            node.value = value
+            return
 
-    def __getitem__(self, key: str) -> T | None:
-        if not key:
-            return self.value
+        node = self
+        node.size += 1
 
-        if key[0] not in self.children:
-            return None
+        for char in key:
+            child = node.children.get(char)
 
-        return self.children[key[0]][key[1:]]
+            if child is None:
+                child = node.children[char] = TrieMap[T]()
 
-    def __contains__(self, key: str) -> bool:
-        if not key:
-            return self.value is not None
+            node = child
+            node.size += 1
 
-        if key[0] not in self.children:
-            return False
+        node.value = value
 
-        return key[1:] in self.children[key[0]]
+    def __getitem__(self, key: str) -> T | None:
+        node = self._find_node(key)
+        return node.value if node is not None else None
+
+    def __contains__(self, key: str) -> bool:
+        node = self._find_node(key)
+        return node is not None and node.value is not None
 
     def __delitem__(self, key: str) -> None:
-        if not key:
-            self.value = None
+        path: list[tuple[TrieMap[T], str]] = []
+        node = self
+
+        for char in key:
+            if char not in node.children:
+                return
+
+            path.append((node, char))
+            node = node.children[char]
 
-        if key[0] not in self.children:
+        if node.value is None:
             return
 
-        del self.children[key[0]][key[1:]]
+        node.value = None
+        node.size -= 1
 
-        if not self.children[key[0]]:
-            del self.children[key[0]]
+        # Remove the nodes that no longer lead to any value, from the bottom up.
+        for parent, char in reversed(path):
+            parent.size -= 1
+
+            if not parent.children[char].size:
+                del parent.children[char]
 
     def __iter__(self) -> Iterator[tuple[str, T]]:
-        if self.value is not None:
-            yield ("", self.value)
+        yield from _items(self, "")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _find_node(self, prefix: str) -> "TrieMap[T] | None":
+        """Return the node at the end of the prefix, or `None` if there is none."""
+        node = self
+
+        for char in prefix:
+            child = node.children.get(char)
+
+            if child is None:
+                return None
+
+            node = child
 
-        for key, child in self.children.items():
-            for suffix, value in child:
-                yield (key + suffix, value)
+        return node
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return whether any key starts with the given prefix."""
+        node = self._find_node(prefix)
+        return node is not None and node.size > 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """Return the number of keys that start with the given prefix."""
+        node = self._find_node(prefix)
+        return node.size if node is not None else 0
 
     def find(self, prefix: str) -> Iterator[tuple[str, T]]:
         """Find all entries with the given prefix."""
-        if not prefix:
-            yield from self
-            return
+        node = self._find_node(prefix)
 
-        if prefix[0] not in self.children:
-            return
+        if node is not None:
+            yield from _items(node, prefix)
+
+    def cursor(self) -> "TrieMapCursor[T]":
+        """Return a cursor at the root of the TrieMap."""
+        return TrieMapCursor(self)
 
-        for suffix, value in self.children[prefix[0]].find(prefix[1:]):
-            yield (prefix[0] + suffix, value)
+    def longest_matches(self, text: str) -> Iterator[tuple[int, str, T]]:
+        """
+        Yield the start, key and value of every token, splitting the text into the longest keys.
+
+        The text is scanned from left to right. At every position, the longest key that starts
+        there is yielded and the scan continues after it; positions where no key starts are
+        skipped. The empty key is never matched.
+        """
+        cursor = self.cursor()
+        start = 0
+
+        while start < len(text):
+            cursor.reset()
+            end, value = start, None
+
+            for i in range(start, len(text)):
+                if (found := cursor.feed(text[i])) is not None:
+                    end, value = i + 1, found
+                elif cursor.dead:
+                    break
+
+            if value is None:
+                start += 1
+            else:
+                yield start, text[start:end], value
+                start = end
+
+    def freeze(self) -> FrozenTrieMap[T]:
+        """Compile the TrieMap into a read-only FrozenTrieMap with the same entries."""
+        return FrozenTrieMap(self)
+
+
+class TrieMapCursor(Generic[T]):
+    """
+    A position in a TrieMap that moves down one character at a time.
+
+    Feeding a character follows a single edge from the current node, instead of walking the whole
+    prefix again from the root, so scanners can extend a match in O(1) time per character.
+    """
+
+    def __init__(self, trie: TrieMap[T]) -> None:
+        self.trie = trie
+        self.node: TrieMap[T] | None = trie
+
+    @property
+    def value(self) -> T | None:
+        """Return the value of the key that ends at the cursor, if any."""
+        return self.node.value if self.node is not None else None
+
+    @property
+    def dead(self) -> bool:
+        """Return whether no key starts with the characters fed so far."""
+        return self.node is None or not self.node.size
+
+    def feed(self, char: str) -> T | None:
+        """Move the cursor along the character, and return the value of the key that ends there."""
+        if self.node is not None:
+            self.node = self.node.children.get(char)
+
+        return self.value
+
+    def reset(self) -> None:
+        """Move the cursor back to the root."""
+        self.node = self.trie
+
+
+def _items(node: TrieMap[T], prefix: str) -> Iterator[tuple[str, T]]:
+    """Yield the entries below the node, depth first, with their keys preceded by the prefix."""
+    if node.value is not None:
+        yield (prefix, node.value)
+
+    path = [prefix]
+    stack = [iter(node.children.items())]
+
+    while stack:
+        for char, child in stack[-1]:
+            path.append(char)
+
+            if child.value is not None:
+                yield ("".join(path), child.value)
+
+            stack.append(iter(child.children.items()))
+            break
+        else:
+            stack.pop()
+            path.pop()
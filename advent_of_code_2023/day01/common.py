@@ -0,0 +1,11 @@
+"""Advent of Code 2023 Day 1 shared parsing."""
+
+from advent_of_code_2023 import Source, open_text, parse_once, phase
+
+
+@parse_once
+@phase("parse")
+def read_lines(source: Source) -> tuple[str, ...]:
+    """Read the input line by line."""
+    with open_text(source) as f:
+        return tuple(line.rstrip() for line in f)
@@ -1,10 +1,20 @@
 """Advent of Code 2023 Day 1 Part 2."""
 
+import io
 import logging
-from collections.abc import Generator
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from advent_of_code_2023 import TrieMap
+from advent_of_code_2023 import (
+    CHUNK_SIZE,
+    AhoCorasick,
+    Source,
+    TrieMap,
+    phase,
+    split_at_lines,
+)
+from advent_of_code_2023.day01.common import read_lines
 
 
 class InsufficientDigitsError(Exception):
@@ -22,64 +32,82 @@ DIGIT_MAP = TrieMap.create(
         "seven": "7",
         "eight": "8",
         "nine": "9",
+        **{digit: digit for digit in "123456789"},
     },
 )
 
-REVERSE_MAP = TrieMap.create(
-    {
-        "eno": "1",
-        "owt": "2",
-        "eerht": "3",
-        "ruof": "4",
-        "evif": "5",
-        "xis": "6",
-        "neves": "7",
-        "thgie": "8",
-        "enin": "9",
-    },
-)
+DIGIT_SEARCH = AhoCorasick(DIGIT_MAP)
 
 
-def read_lines(path: Path) -> Generator[str, None, None]:
-    """Read the input file line by line."""
-    with Path.open(path) as f:
-        while line := f.readline():
-            yield line.rstrip()
+def find_calibration_value(line: str) -> int:
+    """Find the calibration value for the given line."""
+    first = last = None
 
+    # No digit is part of another, so the digits are found in the order in which they start.
+    for _, _, digit in DIGIT_SEARCH.search(line):
+        if first is None:
+            first = digit
+        last = digit
 
-def find_digit(line: str, dictionary: TrieMap[str]) -> str | None:
-    """Find the first digit in a line."""
-    prefix = ""
+    if not first or not last:
+        raise InsufficientDigitsError
 
-    for char in line:
-        if char.isdigit():
-            return char
+    return int(first + last)
 
-        prefix += char
 
-        if digit := dictionary[prefix]:
-            return digit
+def solve(source: Source) -> int:
+    """Sum all calibration values in the puzzle input."""
+    lines = read_lines(source)
 
-        while not any(dictionary.find(prefix)):
-            prefix = prefix[1:]
+    with phase("solve"):
+        return sum(find_calibration_value(line) for line in lines)
 
-    return None
 
+def sum_chunk(path: Path, start: int, end: int) -> int:
+    """Sum the calibration values of the lines between two offsets in the input file."""
+    with path.open("rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
 
-def find_calibration_value(line: str) -> int:
-    """Find the calibration value for the given line."""
-    first = find_digit(line, DIGIT_MAP)
-    last = find_digit(line[::-1], REVERSE_MAP)
+    # The lines are scanned one at a time, without building a list of them.
+    with io.StringIO(text, newline=None) as lines:
+        return sum(find_calibration_value(line) for line in lines)
 
-    if not first or not last:
-        raise InsufficientDigitsError
 
-    return int(first + last)
+def sum_calibration_values_in_parallel(
+    path: Path,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Sum all calibration values in the input file, scanning chunks of it in parallel.
+
+    The file is split into chunks of a fixed size, usually many more than there are workers, so
+    the memory each worker needs does not grow with the file, and workers that finish early pick
+    up the remaining chunks.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = split_at_lines(path, chunk_size)
+
+    with phase("solve"):
+        if workers == 1 or len(chunks) <= 1:
+            return sum(sum_chunk(path, start, end) for start, end in chunks)
+
+        # Workers read their own chunk of the file, so only the offsets are sent to them.
+        with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            return sum(
+                executor.map(
+                    sum_chunk,
+                    [path] * len(chunks),
+                    [start for start, _ in chunks],
+                    [end for _, end in chunks],
+                ),
+            )
 
 
 def sum_calibration_values(path: Path) -> int:
     """Sum all calibration values in the input file."""
-    return sum(find_calibration_value(line) for line in read_lines(path))
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,14 @@
 
 from pathlib import Path
 
-from .part1 import sum_calibration_values
+import pytest
+
+from .part1 import (
+    InsufficientDigitsError,
+    find_calibration_value,
+    sum_calibration_values,
+    sum_digit_lines,
+)
 
 
 def test__sum_calibration_values_with_test_input() -> None:
@@ -12,3 +19,14 @@ def test__sum_calibration_values_with_test_input() -> None:
 def test__sum_calibration_values_with_puzzle_input() -> None:
     """Test whether the sum of all calibration values matches the puzzle solution."""
     assert sum_calibration_values(Path(__file__).parent / "input/input") == 55386
+
+
+def test__sum_digit_lines() -> None:
+    """Test whether the bulk sum matches the calibration values of the separate lines."""
+    lines = ["1abc2", "pqr3stu8vwx", "a1b2c3d4e5f", "treb7uchet"]
+
+    assert sum_digit_lines("\r\n".join(lines).encode()) == sum(map(find_calibration_value, lines))
+    assert sum_digit_lines(b"") == 0
+
+    with pytest.raises(InsufficientDigitsError):
+        sum_digit_lines(b"1\nabc\n2\n")
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from .part2 import sum_calibration_values
+from .part2 import sum_calibration_values, sum_calibration_values_in_parallel
 
 
 def test__sum_calibration_values_with_test_input() -> None:
@@ -13,3 +13,12 @@ def test__sum_calibration_values_with_test_input() -> None:
 def test__sum_calibration_values_with_puzzle_input() -> None:
     """Test whether the sum of all calibration values matches the puzzle solution."""
     assert sum_calibration_values(Path(__file__).parent / "input/input") == 54824
+
+
+def test__sum_calibration_values_in_parallel() -> None:
+    """Test whether scanning chunks of the input in parallel gives the same sum."""
+    path = Path(__file__).parent / "input/input"
+
+    assert sum_calibration_values_in_parallel(path, workers=1) == 54824
+    assert sum_calibration_values_in_parallel(path, workers=1, chunk_size=1000) == 54824
+    assert sum_calibration_values_in_parallel(path, workers=3, chunk_size=1000) == 54824
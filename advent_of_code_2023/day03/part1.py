@@ -4,21 +4,16 @@ import logging
 from collections.abc import Generator
 from pathlib import Path
 
-Matrix = list[str]
+from advent_of_code_2023 import Grid, Source, phase
+from advent_of_code_2023.day03.common import read_matrix
 
 
-def read_matrix(path: Path) -> Matrix:
-    """Read a matrix from a file and return it as a list of strings."""
-    with Path.open(path) as f:
-        return [line.strip() for line in f.readlines() if line.strip()]
-
-
-def find_part_numbers(matrix: Matrix) -> Generator[int, None, None]:
+def find_part_numbers(matrix: Grid) -> Generator[int, None, None]:
     """Find all numbers adjacent to a symbol in the given matrix."""
-    for row, line in enumerate(matrix):
+    for row, line in enumerate(matrix.rows()):
         number: str = ""
 
-        for column, char in enumerate(line):
+        for column, char in enumerate(bytes(line).decode()):
             is_digit = char.isdigit()
 
             if is_digit:
@@ -43,7 +38,7 @@ def find_part_numbers(matrix: Matrix) -> Generator[int, None, None]:
                         ],
                     )
 
-                if row < len(matrix) - 1:
+                if row < matrix.height - 1:
                     coordinates.extend(
                         [
                             (row + 1, column)
@@ -55,7 +50,10 @@ def find_part_numbers(matrix: Matrix) -> Generator[int, None, None]:
                     )
 
                 for x, y in coordinates:
-                    neighbour = matrix[x][y]
+                    if not matrix.in_bounds(y, x):
+                        continue
+
+                    neighbour = chr(matrix[y, x])
                     if not neighbour.isalnum() and neighbour != ".":
                         yield int(number)
                         break
@@ -63,9 +61,17 @@ def find_part_numbers(matrix: Matrix) -> Generator[int, None, None]:
                 number = ""
 
 
+def solve(source: Source) -> int:
+    """Sum all numbers adjacent to a symbol in the matrix."""
+    matrix = read_matrix(source)
+
+    with phase("solve"):
+        return sum(find_part_numbers(matrix))
+
+
 def sum_part_numbers(path: Path) -> int:
-    """Sum all numbers adjacent to a symbol in the given matrix."""
-    return sum(find_part_numbers(read_matrix(path)))
+    """Sum all numbers adjacent to a symbol in the matrix in the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
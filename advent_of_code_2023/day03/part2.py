@@ -3,18 +3,13 @@
 import logging
 from pathlib import Path
 
-Matrix = list[str]
+from advent_of_code_2023 import Grid, Source, phase
+from advent_of_code_2023.day03.common import read_matrix
 
 GEAR_RATIO_LENGTH = 2
 
 
-def read_matrix(path: Path) -> Matrix:
-    """Read a matrix from a file and return it as a list of strings."""
-    with Path.open(path) as f:
-        return [line.strip() for line in f.readlines() if line.strip()]
-
-
-def find_gear_ratios(matrix: Matrix) -> list[int]:
+def find_gear_ratios(matrix: Grid) -> list[int]:
     """
     Find all gear ratios in the matrix.
 
@@ -23,10 +18,10 @@ def find_gear_ratios(matrix: Matrix) -> list[int]:
     """
     gear_map: dict[tuple[int, int], list[int]] = {}
 
-    for row, line in enumerate(matrix):
+    for row, line in enumerate(matrix.rows()):
         number: str = ""
 
-        for column, char in enumerate(line):
+        for column, char in enumerate(bytes(line).decode()):
             is_digit = char.isdigit()
 
             if is_digit:
@@ -51,7 +46,7 @@ def find_gear_ratios(matrix: Matrix) -> list[int]:
                         ],
                     )
 
-                if row < len(matrix) - 1:
+                if row < matrix.height - 1:
                     coordinates.extend(
                         [
                             (row + 1, column)
@@ -63,7 +58,10 @@ def find_gear_ratios(matrix: Matrix) -> list[int]:
                     )
 
                 for x, y in coordinates:
-                    neighbour = matrix[x][y]
+                    if not matrix.in_bounds(y, x):
+                        continue
+
+                    neighbour = chr(matrix[y, x])
                     if neighbour == "*":
                         gear_map.setdefault((x, y), []).append(int(number))
 
@@ -72,9 +70,20 @@ def find_gear_ratios(matrix: Matrix) -> list[int]:
     return [gear[0] * gear[1] for gear in gear_map.values() if len(gear) == GEAR_RATIO_LENGTH]
 
 
+def solve(source: Source) -> int:
+    """Sum all gear ratios in the matrix."""
+    matrix = read_matrix(source)
+
+    with phase("solve"):
+        gear_ratios = find_gear_ratios(matrix)
+
+    with phase("aggregate"):
+        return sum(gear_ratios)
+
+
 def sum_gear_ratios(path: Path) -> int:
     """Sum all gear ratios in the matrix at the given path."""
-    return sum(find_gear_ratios(read_matrix(path)))
+    return solve(path)
 
 
 if __name__ == "__main__":
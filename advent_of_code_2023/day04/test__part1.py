@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from .part1 import calculate_total_score
+from .part1 import calculate_total_score, solve
 
 
 def test__calculate_total_score_with_example_data() -> None:
@@ -13,3 +13,9 @@ def test__calculate_total_score_with_example_data() -> None:
 def test__calculate_total_score_with_puzzle_data() -> None:
     """Test whether the sum of all card scores matches the puzzle solution."""
     assert calculate_total_score(Path(__file__).parent / "input/input") == 19135
+
+
+def test__solve_with_example_data_in_memory() -> None:
+    """Test whether solving the example data in memory matches the example solution."""
+    data = (Path(__file__).parent / "input/test__input").read_text()
+    assert solve(data) == 13
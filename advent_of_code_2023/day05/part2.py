@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
-from advent_of_code_2023 import Interval
+from advent_of_code_2023 import Interval, IntervalSet, RangeMap, Source, open_text, phase
 
 
 @dataclass
@@ -23,13 +23,13 @@ class Almanac:
     seeds: list[Interval]
 
     @classmethod
-    def from_path(cls, path: Path) -> "Almanac":
-        """Read an almanac from a file."""
+    def from_source(cls, puzzle_input: Source) -> "Almanac":
+        """Read an almanac from a file or from memory."""
         seeds: list[Interval] = []
         maps: list[list[AlmanacEntry]] = []
         current_map: list[AlmanacEntry] = []
 
-        with path.open() as f:
+        with open_text(puzzle_input) as f:
             while line := f.readline():
                 line = line.strip()
                 if "seeds" in line:
@@ -56,30 +56,40 @@ class Almanac:
 
 
 def find_min_destination(almanac: Almanac) -> int:
-    """Find the minimum destination from the Almanac."""
-    current_sources = almanac.seeds
+    """
+    Find the minimum destination from the Almanac.
 
+    Sources that no entry of a map covers are mapped to the same destination.
+    """
+    current_sources = IntervalSet(almanac.seeds)
+
+    # With only a few seed ranges, mapping them one step at a time is cheaper than composing the
+    # steps into a single map first.
     for step in almanac.entries:
-        next_sources = []
-        for source in current_sources:
-            for entry in step:
-                offset = entry.destination.start - entry.source.start
-                if overlap := entry.source & source:
-                    next_sources.append(Interval(overlap.start + offset, overlap.end + offset))
-        current_sources = next_sources
+        range_map = RangeMap(
+            (entry.source, entry.destination.start - entry.source.start) for entry in step
+        )
+        current_sources = range_map.image(current_sources)
 
-    return min(source.start for source in current_sources)
+    return current_sources.bounds.start
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    almanac = Almanac.from_path(path)
+    with phase("parse"):
+        almanac = Almanac.from_source(source)
+
+    with phase("solve"):
+        return find_min_destination(almanac)
 
-    return find_min_destination(almanac)
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
 
-    solution = calculate_solution(Path(__file__).parent / "input/test__input")
+    solution = calculate_solution(Path(__file__).parent / "input/input")
     logging.info(solution)
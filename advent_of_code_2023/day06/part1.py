@@ -6,12 +6,8 @@ from collections.abc import Generator, Iterable
 from functools import reduce
 from pathlib import Path
 
-
-def read_lines(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of lines."""
-    with Path.open(path) as f:
-        while line := f.readline():
-            yield line
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day06.common import read_lines
 
 
 def read_numbers(line: str) -> list[int]:
@@ -60,14 +56,23 @@ def calculate_winning_strategies(time_distance: tuple[int, ...]) -> int:
     return math.floor(r2) - math.ceil(r1) + 1
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    time_distance = read_time_distance(read_lines(path))
+    lines = read_lines(source)
+
+    with phase("solve"):
+        winning_strategies = [
+            calculate_winning_strategies(time_distance)
+            for time_distance in read_time_distance(lines)
+        ]
 
-    return reduce(
-        lambda solution, winning_strategies: solution * winning_strategies,
-        map(calculate_winning_strategies, time_distance),
-    )
+    with phase("aggregate"):
+        return reduce(lambda solution, strategies: solution * strategies, winning_strategies)
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
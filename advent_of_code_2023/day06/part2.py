@@ -2,15 +2,11 @@
 
 import logging
 import math
-from collections.abc import Generator, Iterable
+from collections.abc import Iterable
 from pathlib import Path
 
-
-def read_lines(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of lines."""
-    with Path.open(path) as f:
-        while line := f.readline():
-            yield line
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day06.common import read_lines
 
 
 def read_number(line: str) -> int:
@@ -54,11 +50,17 @@ def calculate_winning_strategies(time: int, record_distance: int) -> int:
     return math.floor(r2) - math.ceil(r1) + 1
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    time, distance = map(read_number, read_lines(path))
+    time, distance = map(read_number, read_lines(source))
+
+    with phase("solve"):
+        return calculate_winning_strategies(time, distance)
 
-    return calculate_winning_strategies(time, distance)
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
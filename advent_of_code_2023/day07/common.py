@@ -0,0 +1,73 @@
+"""Advent of Code 2023 Day 7 shared parsing."""
+
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass
+
+from advent_of_code_2023 import Source, parse_once, phase, read_char_stream
+
+CARD_LABELS = "23456789TJQKA"
+
+
+@dataclass
+class CardsReader:
+    """Read cards from a stream of characters."""
+
+    cards = ""
+
+    def read(self, char: str) -> None:
+        """Read a character."""
+        if char in CARD_LABELS:
+            self.cards += char
+
+    def reset(self) -> None:
+        """Reset the reader."""
+        self.cards = ""
+
+
+@dataclass
+class BidReader:
+    """Read a bid from a stream of characters."""
+
+    _bid = ""
+
+    def read(self, char: str) -> None:
+        """Read a character."""
+        if char.isdigit():
+            self._bid += char
+
+    def reset(self) -> None:
+        """Reset the reader."""
+        self._bid = ""
+
+    @property
+    def bid(self) -> int:
+        """Return the bid."""
+        return int(self._bid)
+
+
+def parse_hands(stream: Iterable[str]) -> Generator[tuple[str, int], None, None]:
+    """Parse a stream of characters into the cards and bid of every hand."""
+    bid_reader = BidReader()
+    cards_reader = CardsReader()
+
+    current_reader = cards_reader
+
+    for char in stream:
+        current_reader.read(char)
+
+        if char == " ":
+            current_reader = bid_reader
+            continue
+
+        if char == "\n":
+            yield cards_reader.cards, bid_reader.bid
+            bid_reader.reset()
+            cards_reader.reset()
+            current_reader = cards_reader
+
+
+@parse_once
+@phase("parse")
+def read_hands(source: Source) -> tuple[tuple[str, int], ...]:
+    """Read the cards and bid of every hand."""
+    return tuple(parse_hands(read_char_stream(source)))
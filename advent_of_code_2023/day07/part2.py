@@ -1,11 +1,13 @@
 """Advent of Code 2023 Day 7 Part 2."""
 
 import logging
-from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day07.common import read_hands
+
 CARD_STRENGTH = "J23456789TQKA"
 
 
@@ -41,79 +43,20 @@ class Hand:
         return max(score(self.cards.replace("J", char)) for char in CARD_STRENGTH[1:])
 
 
-@dataclass
-class CardsReader:
-    """Read cards from a stream of characters."""
-
-    cards = ""
-
-    def read(self, char: str) -> None:
-        """Read a character."""
-        if char in CARD_STRENGTH:
-            self.cards += char
-
-    def reset(self) -> None:
-        """Reset the reader."""
-        self.cards = ""
-
-
-@dataclass
-class BidReader:
-    """Read a bid from a stream of characters."""
-
-    _bid = ""
-
-    def read(self, char: str) -> None:
-        """Read a character."""
-        if char.isdigit():
-            self._bid += char
-
-    def reset(self) -> None:
-        """Reset the reader."""
-        self._bid = ""
-
-    @property
-    def bid(self) -> int:
-        """Return the bid."""
-        return int(self._bid)
-
-
-def parse_hands(stream: Iterable[str]) -> Generator[Hand, None, None]:
-    """Parse a stream of characters."""
-    bid_reader = BidReader()
-    cards_reader = CardsReader()
-
-    current_reader = cards_reader
-
-    for char in stream:
-        current_reader.read(char)
-
-        if char == " ":
-            current_reader = bid_reader
-            continue
-
-        if char == "\n":
-            yield Hand(bid=bid_reader.bid, cards=cards_reader.cards)
-            bid_reader.reset()
-            cards_reader.reset()
-            current_reader = cards_reader
+def solve(source: Source) -> int:
+    """Calculate the solution."""
+    hands = (Hand(bid=bid, cards=cards) for cards, bid in read_hands(source))
 
+    with phase("solve"):
+        sorted_hands = sorted(hands)
 
-def read_char_stream(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while char := f.read(1):
-            yield char
+    with phase("aggregate"):
+        return sum(hand.bid * i for i, hand in enumerate(sorted_hands, start=1))
 
 
 def calculate_solution(path: Path) -> int:
-    """Calculate the solution."""
-    stream = read_char_stream(path)
-    hands = parse_hands(stream)
-
-    sorted_hands = sorted(hands)
-
-    return sum(hand.bid * i for i, hand in enumerate(sorted_hands, start=1))
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""Advent of Code 2023 Day 9 shared parsing."""
+
+from collections.abc import Generator, Iterable
+
+from advent_of_code_2023 import Source, parse_once, phase, read_char_stream
+
+
+def parse_readings(stream: Iterable[str]) -> Generator[tuple[int, ...], None, None]:
+    """Parse a stream of numbers as a sequence of readings per line."""
+    reading: list[int] = []
+    current_number = ""
+
+    for char in stream:
+        if char.isdigit() or char == "-":
+            current_number += char
+            continue
+
+        if char == " ":
+            reading.append(int(current_number))
+            current_number = ""
+            continue
+
+        if char == "\n":
+            reading.append(int(current_number))
+            current_number = ""
+            yield tuple(reading)
+            reading = []
+
+
+@parse_once
+@phase("parse")
+def read_readings(source: Source) -> tuple[tuple[int, ...], ...]:
+    """Read the readings of every line."""
+    return tuple(parse_readings(read_char_stream(source)))
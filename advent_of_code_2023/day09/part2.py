@@ -1,18 +1,21 @@
 """Advent of Code 2023 Day 9 Part 2."""
 
 import logging
-from collections.abc import Generator, Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import cached_property, reduce
 from itertools import pairwise
 from pathlib import Path
 
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day09.common import read_readings
+
 
 @dataclass(frozen=True)
 class OasisReading:
     """A reading from the OASIS."""
 
-    reading: list[int]
+    reading: Sequence[int]
 
     @cached_property
     def next_reading(self) -> int:
@@ -27,39 +30,17 @@ class OasisReading:
         return reduce(lambda a, b: b - a, (layer[0] for layer in reversed(layers)))
 
 
-def parse_oasis(stream: Iterable[str]) -> Generator[OasisReading, None, None]:
-    """Parse a stream of numbers as OASIS readings."""
-    reading: list[int] = []
-    current_number = ""
-
-    for char in stream:
-        if char.isdigit() or char == "-":
-            current_number += char
-            continue
-
-        if char == " ":
-            reading.append(int(current_number))
-            current_number = ""
-            continue
-
-        if char == "\n":
-            reading.append(int(current_number))
-            current_number = ""
-            yield OasisReading(reading)
-            reading = []
-
+def solve(source: Source) -> int:
+    """Calculate the solution."""
+    readings = read_readings(source)
 
-def read_char_stream(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while char := f.read(1):
-            yield char
+    with phase("solve"):
+        return sum(OasisReading(reading).next_reading for reading in readings)
 
 
 def calculate_solution(path: Path) -> int:
-    """Calculate the solution."""
-    stream = read_char_stream(path)
-    return sum(oasis.next_reading for oasis in parse_oasis(stream))
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
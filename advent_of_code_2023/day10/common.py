@@ -0,0 +1,10 @@
+"""Advent of Code 2023 Day 10 shared parsing."""
+
+from advent_of_code_2023 import Grid, Source, parse_once, phase, read_bytes
+
+
+@parse_once
+@phase("parse")
+def read_grid(source: Source) -> Grid:
+    """Read the grid of pipes."""
+    return Grid.from_text(read_bytes(source)).read_only()
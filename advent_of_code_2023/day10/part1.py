@@ -1,158 +1,212 @@
 """Advent of Code 2023 Day 10 Part 1."""
 
 import logging
-from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from advent_of_code_2023 import SearchStats, Source, phase
+from advent_of_code_2023.day10.common import read_grid
+
 
 @dataclass
 class Graph:
-    """A basic graph that maps the metal island landscape."""
+    """
+    A basic graph that maps the metal island landscape.
 
-    nodes: set[tuple[int, int]] = field(default_factory=set)
-    edges: dict[tuple[int, int], set[tuple[int, int]]] = field(
-        default_factory=lambda: defaultdict(set),
-    )
-    start: tuple[int, int] = (0, 0)
+    The nodes are the tiles of the landscape, numbered by their flat index, so the edges of all
+    nodes are kept in a list indexed by it.
+    """
 
-    def add_node(self, node: tuple[int, int]) -> None:
-        """Add a node to the graph."""
-        self.nodes.add(node)
+    edges: list[list[int]] = field(default_factory=list)
+    start: int = 0
 
-    def add_edge(self, node1: tuple[int, int], node2: tuple[int, int]) -> None:
+    def add_edge(self, node1: int, node2: int) -> None:
         """Add an edge to the graph."""
-        self.add_node(node1)
-        self.add_node(node2)
-        self.edges[node1].add(node2)
-        self.edges[node2].add(node1)
-
-    def find_longest_path(self, start: tuple[int, int]) -> int:
-        """Find the longest path from the given start position."""
-        queue: deque[list[tuple[int, int]]] = deque([[start]])
+        if node2 not in self.edges[node1]:
+            self.edges[node1].append(node2)
+            self.edges[node2].append(node1)
+
+    def find_longest_path(self, start: int, stats: SearchStats | None = None) -> int:
+        """
+        Find the longest path from the given start position.
+
+        The work done by the search is added to `stats`, if given.
+        """
+        edges = self.edges
         max_distance = 0
 
-        while queue:
-            path = queue.pop()
-            node = path[-1]
+        # The nodes on the current path, as flags by flat index and in order.
+        on_path = bytearray(len(edges))
+        on_path[start] = 1
+        path = [start]
+        stack = [iter(edges[start])]
+
+        pops, frontier_peak, dedup_hits = 0, 0, 0
 
-            for neighbor in self.edges[node]:
-                if neighbor == node:
+        while stack:
+            if len(stack) > frontier_peak:
+                frontier_peak = len(stack)
+
+            # The edge back to the node the path came from is not a way forward.
+            previous = path[-2] if len(path) > 1 else -1
+
+            for neighbor in stack[-1]:
+                if neighbor == previous:
                     continue
                 if neighbor == start:
                     max_distance = max(max_distance, len(path))
-                elif neighbor not in path:
-                    queue.append([*path, neighbor])
+                elif not on_path[neighbor]:
+                    on_path[neighbor] = 1
+                    path.append(neighbor)
+                    stack.append(iter(edges[neighbor]))
+                    break
+                else:
+                    dedup_hits += 1
+            else:
+                stack.pop()
+                on_path[path.pop()] = 0
+                pops += 1
+
+        if stats is not None:
+            # Every node taken off the stack had all of its edges followed, and the stack is
+            # drained, so every node on it besides the start was pushed and taken off again.
+            stats.merge(
+                SearchStats(
+                    nodes_expanded=pops,
+                    pushes=pops - 1,
+                    pops=pops,
+                    frontier_peak=frontier_peak,
+                    dedup_hits=dedup_hits,
+                ),
+            )
 
         return max_distance
 
 
-def read_graph(path: Path) -> Graph:
-    """Read a Graph from a file."""
-    with Path.open(path) as f:
-        lines = [line.strip() for line in f.readlines()]
+@phase("parse")
+def read_graph(source: Source) -> Graph:
+    """Read a Graph."""
+    grid = read_grid(source)
 
-    graph = Graph()
+    graph = Graph([[] for _ in range(len(grid))])
 
-    if not any(lines):
+    if not len(grid):
         return graph
 
-    line_length = len(lines[0])
+    width, size = grid.width, len(grid)
+    tiles = grid.data if grid.is_contiguous else grid.copy().data
 
     actions = {
-        ".": lambda x, y: graph.add_node((x, y)),
-        "S": lambda x, y: (graph.add_node((x, y)), setattr(graph, "start", (x, y))),
-        "|": lambda x, y: (
+        ".": lambda _: None,
+        "S": lambda i: setattr(graph, "start", i),
+        "|": lambda i: (
             (
-                y - 1 >= 0
-                and lines[y - 1][x] in {"S", "|", "7", "F"}
-                and graph.add_edge((x, y), (x, y - 1))
+                i >= width
+                and tiles[i - width] in b"S|7F"
+                and graph.add_edge(i, i - width)
             ),
             (
-                y + 1 < len(lines)
-                and lines[y + 1][x] in {"S", "|", "L", "J"}
-                and graph.add_edge((x, y), (x, y + 1))
+                i + width < size
+                and tiles[i + width] in b"S|LJ"
+                and graph.add_edge(i, i + width)
             ),
         ),
-        "-": lambda x, y: (
+        "-": lambda i: (
             (
-                x - 1 >= 0
-                and lines[y][x - 1] in {"S", "-", "L", "F"}
-                and graph.add_edge((x, y), (x - 1, y))
+                i % width
+                and tiles[i - 1] in b"S-LF"
+                and graph.add_edge(i, i - 1)
             ),
             (
-                x + 1 < line_length
-                and lines[y][x + 1] in {"S", "-", "J", "7"}
-                and graph.add_edge((x, y), (x + 1, y))
+                (i + 1) % width
+                and tiles[i + 1] in b"S-J7"
+                and graph.add_edge(i, i + 1)
             ),
         ),
-        "L": lambda x, y: (
+        "L": lambda i: (
             (
-                y - 1 >= 0
-                and lines[y - 1][x] in {"S", "|", "7", "F"}
-                and graph.add_edge((x, y), (x, y - 1))
+                i >= width
+                and tiles[i - width] in b"S|7F"
+                and graph.add_edge(i, i - width)
             ),
             (
-                x + 1 < line_length
-                and lines[y][x + 1] in {"S", "-", "J", "7"}
-                and graph.add_edge((x, y), (x + 1, y))
+                (i + 1) % width
+                and tiles[i + 1] in b"S-J7"
+                and graph.add_edge(i, i + 1)
             ),
         ),
-        "J": lambda x, y: (
+        "J": lambda i: (
             (
-                y - 1 >= 0
-                and lines[y - 1][x] in {"S", "|", "7", "F"}
-                and graph.add_edge((x, y), (x, y - 1))
+                i >= width
+                and tiles[i - width] in b"S|7F"
+                and graph.add_edge(i, i - width)
             ),
             (
-                x - 1 >= 0
-                and lines[y][x - 1] in {"S", "-", "L", "F"}
-                and graph.add_edge((x, y), (x - 1, y))
+                i % width
+                and tiles[i - 1] in b"S-LF"
+                and graph.add_edge(i, i - 1)
             ),
         ),
-        "7": lambda x, y: (
+        "7": lambda i: (
             (
-                x - 1 >= 0
-                and lines[y][x - 1] in {"S", "-", "L", "F"}
-                and graph.add_edge((x, y), (x - 1, y))
+                i % width
+                and tiles[i - 1] in b"S-LF"
+                and graph.add_edge(i, i - 1)
             ),
             (
-                y + 1 < len(lines)
-                and lines[y + 1][x] in {"S", "|", "L", "J"}
-                and graph.add_edge((x, y), (x, y + 1))
+                i + width < size
+                and tiles[i + width] in b"S|LJ"
+                and graph.add_edge(i, i + width)
             ),
         ),
-        "F": lambda x, y: (
+        "F": lambda i: (
             (
-                x + 1 < line_length
-                and lines[y][x + 1] in {"S", "-", "J", "7"}
-                and graph.add_edge((x, y), (x + 1, y))
+                (i + 1) % width
+                and tiles[i + 1] in b"S-J7"
+                and graph.add_edge(i, i + 1)
             ),
             (
-                y + 1 < len(lines)
-                and lines[y + 1][x] in {"S", "|", "L", "J"}
-                and graph.add_edge((x, y), (x, y + 1))
+                i + width < size
+                and tiles[i + width] in b"S|LJ"
+                and graph.add_edge(i, i + width)
             ),
         ),
     }
 
-    for i in range(len(lines) * line_length):
-        y, x = divmod(i, line_length)
-        char = lines[y][x]
+    for i in range(size):
+        char = chr(tiles[i])
 
         action = actions.get(char)
         if action:
-            action(x, y)
+            action(i)
         else:
-            logging.error("Unknown character %s at position %s", char, (x, y))
+            logging.error("Unknown character %s at position %s", char, grid.coordinates(i))
 
     return graph
 
 
-def calculate_solution(path: Path) -> int:
+def solve_with_stats(source: Source) -> tuple[int, SearchStats]:
+    """Calculate the solution, along with the work the search did to find it."""
+    graph = read_graph(source)
+    stats = SearchStats()
+
+    with phase("solve"):
+        solution = graph.find_longest_path(graph.start, stats) // 2
+
+    stats.report()
+
+    return solution, stats
+
+
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    graph = read_graph(path)
-    return graph.find_longest_path(graph.start) // 2
+    solution, _ = solve_with_stats(source)
+    return solution
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -3,21 +3,24 @@
 import logging
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, Source, phase
+from advent_of_code_2023.day10.common import read_grid
+
+GROUND = ord(".")
 
-def find_enclosed_tiles(path: Path) -> int:
-    """Count the number of tiles that cannot be reached from the edges."""
-    with Path.open(path) as f:
-        lines = [line.strip() for line in f.readlines()]
 
-    if not any(lines):
+def find_enclosed_tiles(grid: Grid) -> int:
+    """Count the number of tiles that cannot be reached from the edges."""
+    if not len(grid):
         return 0
 
-    reachable = set()
-    unreachable = set()
+    # Flags for the tiles that can, or at some point could not, be reached from the edges.
+    reachable = Grid(grid.width, grid.height)
+    unreachable = Grid(grid.width, grid.height)
 
-    matrix_width = len(lines[0])
-    matrix_height = len(lines)
-    matrix_size = matrix_width * matrix_height
+    matrix_width = grid.width
+    matrix_height = grid.height
+    matrix_size = len(grid)
 
     # Iterate over the matrix in a spiral pattern to find the unreachable tiles.
 
@@ -28,44 +31,50 @@ def find_enclosed_tiles(path: Path) -> int:
 
     def is_reachable() -> bool:
         """Check whether any of the surrounding tiles are reachable."""
-        return any(
-            [
-                x == 0,
-                y == 0,
-                x == matrix_width - 1,
-                y == matrix_height - 1,
-                (x - 1, y) in reachable,
-                (x + 1, y) in reachable,
-                (x, y - 1) in reachable,
-                (x, y + 1) in reachable,
-            ],
+        return bool(
+            x == 0
+            or y == 0
+            or x == matrix_width - 1
+            or y == matrix_height - 1
+            or reachable[x - 1, y]
+            or reachable[x + 1, y]
+            or reachable[x, y - 1]
+            or reachable[x, y + 1],
         )
 
     for _ in range(matrix_size):
-        if lines[y][x] == ".":
+        if grid[x, y] == GROUND:
             if is_reachable():
-                reachable.add((x, y))
+                reachable[x, y] = 1
             else:
-                unreachable.add((x, y))
+                unreachable[x, y] = 1
 
         if (
             x + dx < 0
             or x + dx >= matrix_width
             or y + dy < 0
             or y + dy >= matrix_height
-            or (x + dx, y + dy) in reachable
+            or reachable[x + dx, y + dy]
         ):
             dx, dy = -dy, dx
 
         x += dx
         y += dy
 
-    return len(unreachable)
+    return sum(unreachable.data)
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution to the problem."""
-    return find_enclosed_tiles(path)
+    grid = read_grid(source)
+
+    with phase("solve"):
+        return find_enclosed_tiles(grid)
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
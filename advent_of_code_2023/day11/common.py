@@ -0,0 +1,10 @@
+"""Advent of Code 2023 Day 11 shared parsing."""
+
+from advent_of_code_2023 import Grid, Source, parse_once, phase, read_bytes
+
+
+@parse_once
+@phase("parse")
+def read_image(source: Source) -> Grid:
+    """Read the image of the universe."""
+    return Grid.from_text(read_bytes(source)).read_only()
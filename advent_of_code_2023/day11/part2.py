@@ -4,26 +4,31 @@ import logging
 from itertools import combinations
 from pathlib import Path
 
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day11.common import read_image
 
-def read_galaxies(path: Path) -> set[tuple[int, int]]:
-    """Read a set of galaxies from a file."""
-    with Path.open(path) as f:
-        lines = [line.strip() for line in f.readlines()]
+GALAXY = ord("#")
+
+
+@phase("parse")
+def read_galaxies(source: Source) -> set[tuple[int, int]]:
+    """Read a set of galaxies."""
+    image = read_image(source)
 
     galaxies: set[tuple[int, int]] = set()
 
-    if not any(lines):
+    if not len(image):
         return galaxies
 
-    empty_columns = [i for i in range(len(lines[0])) if all(line[i] == "." for line in lines)]
+    empty_columns = [x for x, column in enumerate(image.columns()) if GALAXY not in column]
     y_offset = 0
 
-    for y, line in enumerate(lines):
+    for y, line in enumerate(image.rows()):
 
         local_galaxies: set[tuple[int, int]] = set()
 
         for x, char in enumerate(line):
-            if char == "#":
+            if char == GALAXY:
                 x_offset = len([i for i in empty_columns if i < x]) * (1000000 - 1)
                 local_galaxies.add((x + x_offset, y + y_offset))
 
@@ -40,10 +45,17 @@ def manhattan_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    galaxies = read_galaxies(path)
-    return sum(manhattan_distance(a, b) for a, b in combinations(galaxies, 2))
+    galaxies = read_galaxies(source)
+
+    with phase("solve"):
+        return sum(manhattan_distance(a, b) for a, b in combinations(galaxies, 2))
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+"""Advent of Code 2023 Day 12 shared parsing."""
+
+from advent_of_code_2023 import Source, open_text, parse_once, phase
+
+
+@parse_once
+@phase("parse")
+def read_rows(source: Source) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Read every row of springs along with the tokens of damaged springs it should contain."""
+    rows = []
+
+    with open_text(source) as f:
+        while line := f.readline():
+            row, token_lengths = line.strip().split(" ")
+            tokens = tuple("#" * int(length) for length in token_lengths.split(","))
+            rows.append((row, tokens))
+
+    return tuple(rows)
@@ -4,6 +4,9 @@ import logging
 from collections.abc import Generator
 from pathlib import Path
 
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day12.common import read_rows
+
 
 def find_all_variations(row: str) -> Generator[str, None, None]:
     """Find all variations of a row."""
@@ -39,18 +42,17 @@ def find_valid_alternatives(row: str, tokens: list[str]) -> int:
     return result
 
 
-def read_rows(path: Path) -> Generator[tuple[str, list[str]], None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while line := f.readline():
-            row, token_lengths = line.strip().split(" ")
-            tokens: list[str] = ["#" * int(length) for length in token_lengths.split(",")] * 5
-            yield row * 5, tokens
+def solve(source: Source) -> int:
+    """Calculate the solution."""
+    rows = read_rows(source)
+
+    with phase("solve"):
+        return sum(find_valid_alternatives(row * 5, list(tokens) * 5) for row, tokens in rows)
 
 
 def calculate_solution(path: Path) -> int:
-    """Calculate the solution."""
-    return sum(find_valid_alternatives(row, tokens) for row, tokens in read_rows(path))
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+"""Advent of Code 2023 Day 13 shared parsing."""
+
+from advent_of_code_2023 import Grid, Source, open_text, parse_once, phase
+
+
+@parse_once
+@phase("parse")
+def read_patterns(source: Source) -> tuple[Grid, ...]:
+    """Read all patterns."""
+    patterns = []
+
+    with open_text(source) as f:
+        current_pattern = []
+        while line := f.readline():
+            if line == "\n":
+                patterns.append(Grid.from_lines(current_pattern).read_only())
+                current_pattern = []
+            else:
+                current_pattern.append(line.strip())
+
+        if len(current_pattern):
+            patterns.append(Grid.from_lines(current_pattern).read_only())
+
+    return tuple(patterns)
@@ -1,38 +1,22 @@
 """Advent of Code 2023 Day 13 Part 2."""
 
 import logging
-from collections.abc import Generator
 from itertools import pairwise
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, Source, phase
+from advent_of_code_2023.day13.common import read_patterns
 
-def read_patterns(path: Path) -> Generator[list[str], None, None]:
-    """Read a stream of patterns from a file."""
-    with Path.open(path) as f:
-        current_pattern = []
-        while line := f.readline():
-            if line == "\n":
-                yield current_pattern
-                current_pattern = []
-            else:
-                current_pattern.append(line.strip())
 
-        if len(current_pattern):
-            yield current_pattern
-
-
-def transpose(pattern: list[str]) -> list[str]:
-    """Transpose a pattern."""
-    return ["".join(row) for row in zip(*pattern, strict=True)]
-
-
-def hamming_distance(a: str, b: str) -> int:
-    """Calculate the hamming distance between two strings."""
+def hamming_distance(a: memoryview, b: memoryview) -> int:
+    """Calculate the hamming distance between two rows."""
     return sum(1 for x, y in zip(a, b, strict=True) if x != y)
 
 
-def find_reflection(pattern: list[str], allowed_smudges: int = 1) -> int:
+def find_reflection(grid: Grid, allowed_smudges: int = 1) -> int:
     """Check a pattern for reflections."""
+    pattern = list(grid.rows())
+
     for index, (a, b) in enumerate(pairwise(pattern)):
         smudges_remaining = allowed_smudges - hamming_distance(a, b)
 
@@ -53,20 +37,28 @@ def find_reflection(pattern: list[str], allowed_smudges: int = 1) -> int:
     return 0
 
 
-def find_reflections(pattern: list[str]) -> int:
+def find_reflections(pattern: Grid) -> int:
     """Check a pattern for horizontal and vertical reflections."""
     if horizontal := find_reflection(pattern):
         return horizontal * 100
 
-    if vertical := find_reflection(transpose(pattern)):
+    if vertical := find_reflection(pattern.transpose()):
         return vertical
 
     return 0
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    return sum(find_reflections(pattern) for pattern in read_patterns(path))
+    patterns = read_patterns(source)
+
+    with phase("solve"):
+        return sum(find_reflections(pattern) for pattern in patterns)
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+"""Advent of Code 2023 Day 14 shared parsing."""
+
+from advent_of_code_2023 import Grid, Source, parse_once, phase, read_bytes
+
+
+@parse_once
+@phase("parse")
+def read_platform(source: Source) -> Grid:
+    """Read the input as a grid."""
+    return Grid.from_text(read_bytes(source)).read_only()
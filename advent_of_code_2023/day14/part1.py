@@ -1,36 +1,45 @@
 """Advent of Code 2023 Day 14 Part 1."""
 
 import logging
-from copy import deepcopy
 from itertools import pairwise
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, Source, phase
+from advent_of_code_2023.day14.common import read_platform
 
-def read_platform(path: Path) -> list[list[str]]:
-    """Read a file as a list of strings."""
-    with Path.open(path) as f:
-        return [list(line) for line in f.read().splitlines()]
+ROUNDED = ord("O")
+EMPTY = ord(".")
 
 
-def shift_north(platform: list[list[str]]) -> list[list[str]]:
+def shift_north(platform: Grid) -> Grid:
     """Shift rounded rocks on the platform north."""
-    result = deepcopy(platform)
-    for a, b in pairwise(result):
+    result = platform.copy()
+    for a, b in pairwise(result.rows()):
         for index, char in enumerate(b):
-            if char == "O" and a[index] == ".":
-                a[index] = "O"
-                b[index] = "."
+            if char == ROUNDED and a[index] == EMPTY:
+                a[index] = ROUNDED
+                b[index] = EMPTY
     return result
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    platform = read_platform(path)
+    platform = read_platform(source)
+
+    with phase("solve"):
+        while platform != (new_platform := shift_north(platform)):
+            platform = new_platform
 
-    while platform != (new_platform := shift_north(platform)):
-        platform = new_platform
+    with phase("aggregate"):
+        return sum(
+            bytes(row).count(ROUNDED) * (index + 1)
+            for index, row in enumerate(platform.flip_vertical().rows())
+        )
 
-    return sum(row.count("O") * (index + 1) for index, row in enumerate(reversed(platform)))
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -2,76 +2,82 @@
 
 import logging
 from collections.abc import Callable
-from copy import deepcopy
 from functools import reduce
 from itertools import pairwise
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, Source, count, phase
+from advent_of_code_2023.day14.common import read_platform
 
-def transpose(platform: list[list[str]]) -> list[list[str]]:
-    """Transpose a platform."""
-    return [list(row) for row in zip(*platform, strict=True)]
+ROUNDED = ord("O")
+EMPTY = ord(".")
 
 
-def read_platform(path: Path) -> list[list[str]]:
-    """Read a file as a list of strings."""
-    with Path.open(path) as f:
-        return [list(line) for line in f.read().splitlines()]
-
-
-def shift_north(platform: list[list[str]]) -> list[list[str]]:
+def shift_north(platform: Grid) -> Grid:
     """Shift rounded rocks on the platform north."""
-    result = deepcopy(platform)
-    for a, b in pairwise(result):
+    result = platform.copy()
+    for a, b in pairwise(result.rows()):
         for index, char in enumerate(b):
-            if char == "O" and a[index] == ".":
-                a[index] = "O"
-                b[index] = "."
+            if char == ROUNDED and a[index] == EMPTY:
+                a[index] = ROUNDED
+                b[index] = EMPTY
     return result
 
 
-def shift_south(platform: list[list[str]]) -> list[list[str]]:
+def shift_south(platform: Grid) -> Grid:
     """Shift rounded rocks on the platform south."""
-    return list(reversed(shift_north(list(reversed(platform)))))
+    return shift_north(platform.flip_vertical()).flip_vertical()
 
 
-def shift_west(platform: list[list[str]]) -> list[list[str]]:
+def shift_west(platform: Grid) -> Grid:
     """Shift rounded rocks on the platform east."""
-    return transpose(shift_north(transpose(platform)))
+    return shift_north(platform.transpose()).transpose()
 
 
-def shift_east(platform: list[list[str]]) -> list[list[str]]:
+def shift_east(platform: Grid) -> Grid:
     """Shift rounded rocks on the platform west."""
-    return transpose(shift_south(transpose(platform)))
+    return shift_south(platform.transpose()).transpose()
 
 
 def shift_platform(
-    shift: Callable[[list[list[str]]], list[list[str]]], platform: list[list[str]],
-) -> list[list[str]]:
+    shift: Callable[[Grid], Grid], platform: Grid,
+) -> Grid:
     """Shift rounded rocks on the platform until they cannot shift any further."""
     while platform != (new_platform := shift(platform)):
         platform = new_platform
     return platform
 
 
-def calculate_solution(path: Path, ticks: int) -> int:
+def solve(source: Source, ticks: int) -> int:
     """Calculate the solution."""
     i = 0
     operations = [shift_north, shift_west, shift_south, shift_east]
-    new_platform = []
-    platform = read_platform(path)
+    platform = read_platform(source)
+    new_platform = platform
 
-    def tick(platform: list[list[str]]) -> list[list[str]]:
+    def tick(platform: Grid) -> Grid:
         return reduce(lambda acc, op: shift_platform(op, acc), operations, platform)
 
-    while i < ticks and platform != (new_platform := tick(platform)):
-        platform = new_platform
-        i += 1
+    with phase("solve"):
+        while i < ticks and platform != (new_platform := tick(platform)):
+            platform = new_platform
+            i += 1
+
+    count("ticks", i)
 
     if i < ticks - 1:
         logging.debug("Repeating pattern found after %d ticks", i)
 
-    return sum(row.count("O") * (index + 1) for index, row in enumerate(reversed(new_platform)))
+    with phase("aggregate"):
+        return sum(
+            bytes(row).count(ROUNDED) * (index + 1)
+            for index, row in enumerate(new_platform.flip_vertical().rows())
+        )
+
+
+def calculate_solution(path: Path, ticks: int) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path, ticks)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+"""Advent of Code 2023 Day 15 shared parsing."""
+
+from collections.abc import Generator, Iterable
+
+from advent_of_code_2023 import Source, parse_once, phase, read_char_stream
+
+
+def parse_initialization_sequences(stream: Iterable[str]) -> Generator[str, None, None]:
+    """Parse initialization sequences from a stream of characters."""
+    current_sequence = ""
+
+    for char in stream:
+        if char in {"\n", ","} and current_sequence:
+            yield current_sequence
+            current_sequence = ""
+            continue
+
+        current_sequence += char
+
+
+@parse_once
+@phase("parse")
+def read_initialization_sequences(source: Source) -> tuple[str, ...]:
+    """Read all initialization sequences."""
+    return tuple(parse_initialization_sequences(read_char_stream(source)))
@@ -1,29 +1,11 @@
 """Advent of Code 2023 Day 15 Part 1."""
 
 import logging
-from collections.abc import Generator, Iterable
 from functools import reduce
 from pathlib import Path
 
-
-def read_char_stream(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while char := f.read(1):
-            yield char
-
-
-def parse_initialization_sequences(stream: Iterable[str]) -> Generator[str, None, None]:
-    """Parse initialization sequences from a stream of characters."""
-    current_sequence = ""
-
-    for char in stream:
-        if char in {"\n", ","} and current_sequence:
-            yield current_sequence
-            current_sequence = ""
-            continue
-
-        current_sequence += char
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day15.common import read_initialization_sequences
 
 
 def calculate_hash(initialization_sequence: str) -> int:
@@ -33,15 +15,20 @@ def calculate_hash(initialization_sequence: str) -> int:
     )
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
-    stream = read_char_stream(path)
+    initialization_sequences = read_initialization_sequences(source)
 
-    initialization_sequences = parse_initialization_sequences(stream)
+    with phase("solve"):
+        hashes = list(map(calculate_hash, initialization_sequences))
 
-    hashes = map(calculate_hash, initialization_sequences)
+    with phase("aggregate"):
+        return sum(hashes)
 
-    return sum(hashes)
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -2,49 +2,30 @@
 
 import logging
 from collections import defaultdict
-from collections.abc import Generator, Iterable
 from functools import reduce
 from pathlib import Path
 
-Step = tuple[str, str, int]
-
-
-def read_char_stream(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while char := f.read(1):
-            yield char
+from advent_of_code_2023 import Source, phase
+from advent_of_code_2023.day15.common import read_initialization_sequences
 
+Step = tuple[str, str, int]
 
-def parse_steps(stream: Iterable[str]) -> Generator[Step, None, None]:
-    """Parse steps from a stream of characters."""
-    current_label = ""
-    current_operator = ""
-    current_focal_length = ""
 
-    for char in stream:
-        if char in {"\n", ","}:
-            yield (
-                current_label,
-                current_operator,
-                int(current_focal_length) if current_focal_length else 0,
-            )
-            current_label = ""
-            current_operator = ""
-            current_focal_length = ""
-            continue
+def parse_step(initialization_sequence: str) -> Step:
+    """Parse a step from an initialization sequence."""
+    label = ""
+    operator = ""
+    focal_length = ""
 
+    for char in initialization_sequence:
         if char.isalpha():
-            current_label += char
-            continue
-
-        if char.isdigit():
-            current_focal_length += char
-            continue
+            label += char
+        elif char.isdigit():
+            focal_length += char
+        elif char in {"=", "-"}:
+            operator += char
 
-        if char in {"=", "-"}:
-            current_operator += char
-            continue
+    return label, operator, int(focal_length) if focal_length else 0
 
 
 def calculate_hash(label: str) -> int:
@@ -56,23 +37,32 @@ def calculate_hash(label: str) -> int:
     )
 
 
-def calculate_solution(path: Path) -> int:
+def solve(source: Source) -> int:
     """Calculate the solution."""
     boxes: dict[int, dict[str, int]] = defaultdict(dict)
 
-    for label, operator, focal_length in parse_steps(read_char_stream(path)):
-        label_hash = calculate_hash(label)
-        box = boxes[label_hash]
-        if operator == "=":
-            box[label] = focal_length
-        elif operator == "-" and label in box:
-            del box[label]
-
-    return sum(
-        (1 + box) * (1 + slot) * focal_length
-        for box, lenses in boxes.items()
-        for slot, focal_length in enumerate(lenses.values())
-    )
+    initialization_sequences = read_initialization_sequences(source)
+
+    with phase("solve"):
+        for label, operator, focal_length in map(parse_step, initialization_sequences):
+            label_hash = calculate_hash(label)
+            box = boxes[label_hash]
+            if operator == "=":
+                box[label] = focal_length
+            elif operator == "-" and label in box:
+                del box[label]
+
+    with phase("aggregate"):
+        return sum(
+            (1 + box) * (1 + slot) * focal_length
+            for box, lenses in boxes.items()
+            for slot, focal_length in enumerate(lenses.values())
+        )
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
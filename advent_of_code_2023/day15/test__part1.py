@@ -37,3 +37,12 @@ def test__calculate_solution_with_example_data() -> None:
 def test__calculate_solution_with_puzzle_data() -> None:
     """Test whether the calculated_solution matches the puzzle solution."""
     assert calculate_solution(Path(__file__).parent / "input/input") == 519041
+
+
+def test__calculate_solution_with_crlf_line_breaks(tmp_path: Path) -> None:
+    """Test whether an input saved with CRLF line breaks gives the same solution."""
+    contents = (Path(__file__).parent / "input/test__input").read_bytes()
+    path = tmp_path / "input"
+    path.write_bytes(contents.replace(b"\n", b"\r\n"))
+
+    assert calculate_solution(path) == 1320
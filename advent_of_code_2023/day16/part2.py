@@ -1,32 +1,43 @@
 """Advent of Code 2023 Day 16 Part 2."""
 
 import logging
-from collections import defaultdict, deque
+from collections import deque
 from pathlib import Path
 from typing import Literal
 
+from advent_of_code_2023 import Grid, SearchStats, Source, count, phase
+from advent_of_code_2023.day16.common import read_contraption
+
 Direction = Literal["d", "l", "r", "u"]
 
-REFRACTION_TABLE: dict[str, dict[Direction, list[Direction]]] = {
-    "\\": {
+DIRECTION_BITS: dict[Direction, int] = {"d": 1, "l": 2, "r": 4, "u": 8}
+
+REFRACTION_TABLE: dict[int, dict[Direction, list[Direction]]] = {
+    ord("."): {
+        "d": ["d"],
+        "l": ["l"],
+        "r": ["r"],
+        "u": ["u"],
+    },
+    ord("\\"): {
         "d": ["r"],
         "l": ["u"],
         "r": ["d"],
         "u": ["l"],
     },
-    "/": {
+    ord("/"): {
         "d": ["l"],
         "l": ["d"],
         "r": ["u"],
         "u": ["r"],
     },
-    "|": {
+    ord("|"): {
         "d": ["d"],
         "l": ["d", "u"],
         "r": ["d", "u"],
         "u": ["u"],
     },
-    "-": {
+    ord("-"): {
         "d": ["l", "r"],
         "l": ["l"],
         "r": ["r"],
@@ -35,23 +46,29 @@ REFRACTION_TABLE: dict[str, dict[Direction, list[Direction]]] = {
 }
 
 
-def read_contraption(path: Path) -> list[str]:
-    """Read a contraption from a file."""
-    with Path.open(path) as f:
-        return [line.strip() for line in f.readlines() if line.strip()]
-
-
 def find_energized_tiles(
-    contraption: list[str],
+    contraption: Grid,
     start: tuple[int, int, Direction],
+    stats: SearchStats | None = None,
 ) -> list[tuple[int, int]]:
-    """Find all energized tiles in the given contraption."""
+    """
+    Find all energized tiles in the given contraption.
+
+    The beam starts just outside the contraption, so the starting position is not energized
+    itself. Every tile keeps a bitmask of the directions beams have entered it in. The work done
+    by the search is added to `stats`, if given.
+    """
     queue: deque[tuple[int, int, Direction]] = deque([start])
-    seen: dict[tuple[int, int], set[Direction]] = defaultdict(set)
+    seen = bytearray(len(contraption))
+
+    pops, frontier_peak, dedup_hits, exits = 0, 0, 0, 0
 
     while len(queue) > 0:
+        if len(queue) > frontier_peak:
+            frontier_peak = len(queue)
+
         x, y, direction = queue.popleft()
-        seen[(x, y)].add(direction)
+        pops += 1
 
         if direction == "d":
             y += 1
@@ -62,44 +79,80 @@ def find_energized_tiles(
         elif direction == "u":
             y -= 1
 
-        if x < 0 or y < 0 or x >= len(contraption[0]) or y >= len(contraption):
+        if not contraption.in_bounds(x, y):
+            exits += 1
             continue
 
-        symbol = contraption[y][x]
+        index = contraption.index(x, y)
 
-        if symbol == ".":
-            queue.append((x, y, direction))
+        if seen[index] & DIRECTION_BITS[direction]:
+            dedup_hits += 1
             continue
 
+        seen[index] |= DIRECTION_BITS[direction]
+
         queue.extend(
             (x, y, new_direction)
-            for new_direction in REFRACTION_TABLE[symbol][direction]
-            if new_direction not in seen[(x, y)]
+            for new_direction in REFRACTION_TABLE[contraption.get(index)][direction]
         )
 
-    return [tile for tile, directions in seen.items() if len(directions)]
+    if stats is not None:
+        # The queue is drained, so every entry on it besides the start was pushed and taken off
+        # again.
+        stats.merge(
+            SearchStats(
+                nodes_expanded=pops - dedup_hits - exits,
+                pushes=pops - 1,
+                pops=pops,
+                frontier_peak=frontier_peak,
+                dedup_hits=dedup_hits,
+            ),
+        )
 
+    return [contraption.coordinates(index) for index, directions in enumerate(seen) if directions]
 
-def calculate_solution(path: Path) -> int:
-    """Calculate the solution."""
-    contraption = read_contraption(path)
+
+def solve_with_stats(source: Source) -> tuple[int, SearchStats]:
+    """Calculate the solution, along with the work the searches did to find it."""
+    contraption = read_contraption(source)
 
     # Add starting positions for all four sides of the contraption
     starting_positions = []
 
     # left edge
-    starting_positions.extend((-1, y, "r") for y in range(len(contraption)))
+    starting_positions.extend((-1, y, "r") for y in range(contraption.height))
     # right edge
-    starting_positions.extend((len(contraption[0]), y, "l") for y in range(len(contraption)))
+    starting_positions.extend((contraption.width, y, "l") for y in range(contraption.height))
     # top edge
-    starting_positions.extend((x, -1, "d") for x in range(len(contraption[0])))
+    starting_positions.extend((x, -1, "d") for x in range(contraption.width))
     # bottom edge
-    starting_positions.extend((x, len(contraption), "u") for x in range(len(contraption[0])))
+    starting_positions.extend((x, contraption.height, "u") for x in range(contraption.width))
+
+    count("starting_positions", len(starting_positions))
+
+    stats = SearchStats()
+
+    with phase("solve"):
+        energized_tiles = [
+            len(find_energized_tiles(contraption, starting_position, stats))
+            for starting_position in starting_positions
+        ]
+
+    stats.report()
 
-    return max(
-        len(find_energized_tiles(contraption, starting_position)) - 1
-        for starting_position in starting_positions
-    )
+    with phase("aggregate"):
+        return max(energized_tiles), stats
+
+
+def solve(source: Source) -> int:
+    """Calculate the solution."""
+    solution, _ = solve_with_stats(source)
+    return solution
+
+
+def calculate_solution(path: Path) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""Advent of Code 2023 Day 17 shared parsing."""
+
+from advent_of_code_2023 import Grid, Source, parse_once, phase, read_bytes
+
+# Maps the digits of the heatmap to the heat loss they represent.
+HEAT_LOSS_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+@parse_once
+@phase("parse")
+def read_heatmap(source: Source) -> Grid:
+    """Read a map."""
+    return Grid.from_text(read_bytes(source)).translate(HEAT_LOSS_TABLE).read_only()
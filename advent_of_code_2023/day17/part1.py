@@ -2,23 +2,22 @@
 
 import heapq
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, SearchStats, Source, phase
+from advent_of_code_2023.day17.common import read_heatmap
+
 Coordinate = tuple[int, int]
 Direction = tuple[int, int]
 Distance = float
 Step = int
 
-# The directions we can move in, and the directions we can turn in from each direction.
-DIRECTIONS: dict[Direction, list[Direction]] = {
-    (0, 0): [(0, 1), (0, -1), (1, 0), (-1, 0)],
-    (0, 1): [(1, 0), (-1, 0)],
-    (0, -1): [(1, 0), (-1, 0)],
-    (1, 0): [(0, 1), (0, -1)],
-    (-1, 0): [(0, 1), (0, -1)],
-}
+# The moves by direction number. Direction 0 is the one we start in, before any move.
+MOVES: list[Direction] = [(0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)]
+
+# The directions we can turn in from each direction.
+TURNS: list[list[int]] = [[1, 2, 3, 4], [3, 4], [3, 4], [1, 2], [1, 2]]
 
 # The maximum number of steps we can take in the same direction.
 MAX_STEPS = 3
@@ -36,78 +35,119 @@ class NoPathFoundError(Exception):
         return f"No path found between {self.start} and {self.end}."
 
 
-def read_heatmap(path: Path) -> list[list[int]]:
-    """Read a map from a file."""
-    with Path.open(path) as f:
-        return [[int(c) for c in line.strip()] for line in f.readlines() if line.strip()]
-
-
 def dijkstra(
-    graph: list[list[int]],
+    graph: Grid,
     start: Coordinate,
     end: Coordinate,
+    stats: SearchStats | None = None,
 ) -> Distance:
-    """Find the smallest distance between the given start and end points."""
-    distances: dict[tuple[Coordinate, Direction, Step], Distance] = defaultdict(
-        lambda: float("inf"),
-    )
+    """
+    Find the smallest distance between the given start and end points.
 
-    bound_x, bound_y = len(graph[0]), len(graph)
+    The work done by the search is added to `stats`, if given.
+    """
+    width, height = graph.width, graph.height
+    heat_losses = graph.data if graph.is_contiguous else graph.copy().data
+    end_index = graph.index(*end)
 
-    min_heap: list[tuple[Distance, Coordinate, Direction, Step]] = [
-        (0, start, (0, 0), MAX_STEPS),
-    ]
+    # The states are numbered by flat index, direction and steps, so their distances fit in a list.
+    states_per_tile = len(MOVES) * (MAX_STEPS + 1)
+    distances: list[Distance] = [float("inf")] * (len(graph) * states_per_tile)
 
-    while len(min_heap):
-        distance_from_start, (x, y), direction, steps = heapq.heappop(min_heap)
+    min_heap: list[tuple[Distance, int, int, Step]] = [
+        (0, graph.index(*start), 0, MAX_STEPS),
+    ]
 
-        directions = (
-            DIRECTIONS[direction] if steps >= MAX_STEPS else [direction, *DIRECTIONS[direction]]
-        )
+    pops, frontier_peak, dedup_hits = 0, 0, 0
 
-        for new_direction in directions:
-            dx, dy = new_direction
-            nx, ny = x + dx, y + dy
+    try:
+        while len(min_heap):
+            if len(min_heap) > frontier_peak:
+                frontier_peak = len(min_heap)
 
-            if not (0 <= nx < bound_x and 0 <= ny < bound_y):
-                continue
+            distance_from_start, index, direction, steps = heapq.heappop(min_heap)
+            y, x = divmod(index, width)
+            pops += 1
 
-            dist_to_new_point = distance_from_start + graph[ny][nx]
-            new_coordinate = (nx, ny)
+            directions = (
+                TURNS[direction] if steps >= MAX_STEPS else [direction, *TURNS[direction]]
+            )
 
-            if new_coordinate == end:
-                return dist_to_new_point
+            for new_direction in directions:
+                dx, dy = MOVES[new_direction]
+                nx, ny = x + dx, y + dy
+
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+
+                new_index = ny * width + nx
+                dist_to_new_point = distance_from_start + heat_losses[new_index]
+
+                if new_index == end_index:
+                    return dist_to_new_point
+
+                new_steps = steps + 1 if new_direction == direction else 1
+
+                key = (new_index * len(MOVES) + new_direction) * (MAX_STEPS + 1) + new_steps
+
+                if dist_to_new_point >= distances[key]:
+                    dedup_hits += 1
+                    continue
+
+                distances[key] = dist_to_new_point
+
+                heapq.heappush(
+                    min_heap,
+                    (
+                        dist_to_new_point,
+                        new_index,
+                        new_direction,
+                        new_steps,
+                    ),
+                )
+
+        raise NoPathFoundError(start=start, end=end)
+    finally:
+        if stats is not None:
+            # Stale entries are not skipped, so every entry taken off the heap is expanded. Every
+            # entry on the heap besides the start was pushed, and was either taken off again or is
+            # still on it.
+            stats.merge(
+                SearchStats(
+                    nodes_expanded=pops,
+                    pushes=pops + len(min_heap) - 1,
+                    pops=pops,
+                    frontier_peak=max(frontier_peak, len(min_heap)),
+                    dedup_hits=dedup_hits,
+                ),
+            )
 
-            new_steps = steps + 1 if new_direction == direction else 1
 
-            key = (new_coordinate, new_direction, new_steps)
+def solve_with_stats(source: Source) -> tuple[Distance, SearchStats]:
+    """Calculate the solution, along with the work the search did to find it."""
+    heatmap = read_heatmap(source)
 
-            if dist_to_new_point >= distances[key]:
-                continue
+    start = (0, 0)
+    end = (heatmap.width - 1, heatmap.height - 1)
+    stats = SearchStats()
 
-            distances[key] = dist_to_new_point
+    with phase("solve"):
+        solution = dijkstra(heatmap, start, end, stats)
 
-            heapq.heappush(
-                min_heap,
-                (
-                    dist_to_new_point,
-                    new_coordinate,
-                    new_direction,
-                    new_steps,
-                ),
-            )
+    stats.report()
 
-    raise NoPathFoundError(start=start, end=end)
+    return solution, stats
 
 
-def calculate_solution(path: Path) -> Distance:
+def solve(source: Source) -> Distance:
     """Calculate the solution."""
-    heatmap = read_heatmap(path)
+    solution, _ = solve_with_stats(source)
+    return solution
 
-    start = (0, 0)
-    end = (len(heatmap[0]) - 1, len(heatmap) - 1)
 
-    return dijkstra(heatmap, start, end)
+def calculate_solution(path: Path) -> Distance:
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from .part1 import calculate_solution
+from .part1 import calculate_solution, solve_with_stats
 
 
 def test__calculate_solution_with_example_data() -> None:
@@ -13,3 +13,13 @@ def test__calculate_solution_with_example_data() -> None:
 def test__calculate_solution_with_puzzle_data() -> None:
     """Test whether the calculated_solution matches the puzzle solution."""
     assert calculate_solution(Path(__file__).parent / "input/input") == 847
+
+
+def test__solve_with_stats() -> None:
+    """Test whether the search reports the work it did along with the solution."""
+    solution, stats = solve_with_stats(Path(__file__).parent / "input/test__input")
+
+    assert solution == 102
+    assert stats.nodes_expanded == stats.pops > 0
+    assert stats.pushes >= stats.pops - 1
+    assert 0 < stats.frontier_peak <= stats.pushes + 1
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from .part2 import calculate_solution
+from .part2 import calculate_solution, solve
 
 
 def test__calculate_solution_with_example_data() -> None:
@@ -13,3 +13,9 @@ def test__calculate_solution_with_example_data() -> None:
 def test__calculate_solution_with_puzzle_data() -> None:
     """Test whether the calculated_solution matches the puzzle solution."""
     assert calculate_solution(Path(__file__).parent / "input/input") == 997
+
+
+def test__solve_with_example_data_in_memory() -> None:
+    """Test whether solving the example data in memory matches the example solution."""
+    data = memoryview((Path(__file__).parent / "input/test__input").read_bytes())
+    assert solve(data) == 94
@@ -5,75 +5,133 @@ from collections import deque
 from collections.abc import Generator
 from pathlib import Path
 
+from advent_of_code_2023 import Grid, SearchStats, Source, phase
+from advent_of_code_2023.day21.common import read_map
+
 Point = tuple[int, int]
 
 DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
 
+ROCK = ord("#")
+
 
 class NoStartFoundError(Exception):
     """No start found."""
 
 
-def read_map(path: Path) -> list[str]:
-    """Read the map."""
-    with Path.open(path) as file:
-        return [line.strip() for line in file if line.strip()]
-
-
-def find_start(map_: list[str]) -> Point:
+def find_start(map_: Grid) -> Point:
     """Find the start."""
-    for y, line in enumerate(map_):
-        for x, char in enumerate(line):
-            if char == "S":
-                return (x, y)
-    raise NoStartFoundError
+    if (start := map_.find(ord("S"))) is None:
+        raise NoStartFoundError
+    return start
 
 
 def find_points_in_range(
-    map_: list[str],
+    map_: Grid,
     start: Point,
     range_: int,
+    stats: SearchStats | None = None,
 ) -> Generator[Point, None, None]:
-    """Find all points reachable from start at the given range using BFS."""
-    queue: deque[tuple[int, Point]] = deque([(0, start)])
-    seen: set[Point] = {start}
-
-    bound_x = len(map_[0])
-    bound_y = len(map_)
+    """
+    Find all points reachable from start at the given range using BFS.
+
+    The work done by the search is added to `stats`, if given, once the generator is exhausted or
+    closed.
+    """
+    width, height = map_.width, map_.height
+    tiles = map_.data if map_.is_contiguous else map_.copy().data
+
+    # Every point in range lies in the square of side 2 * range_ + 1 around the start, so points
+    # are numbered by their flat index in that square.
+    side = 2 * range_ + 1
+    left, top = start[0] - range_, start[1] - range_
+
+    queue: deque[tuple[int, int, int]] = deque([(0, *start)])
+    seen = bytearray(side * side)
+    seen[(start[1] - top) * side + start[0] - left] = 1
+
+    nodes_expanded, pops, frontier_peak, dedup_hits = 0, 0, 0, 0
+
+    try:
+        while queue:
+            if len(queue) > frontier_peak:
+                frontier_peak = len(queue)
+
+            steps, x, y = queue.popleft()
+            pops += 1
+
+            if steps % 2 == range_ % 2:
+                yield (x, y)
+
+            if steps == range_:
+                continue
+
+            nodes_expanded += 1
+
+            for dx, dy in DIRECTIONS:
+                new_x, new_y = x + dx, y + dy
+
+                if tiles[new_y % height * width + new_x % width] == ROCK:
+                    continue
+
+                index = (new_y - top) * side + new_x - left
+
+                if seen[index]:
+                    dedup_hits += 1
+                    continue
+
+                seen[index] = 1
+                queue.append((steps + 1, new_x, new_y))
+    finally:
+        if stats is not None:
+            # Every entry on the queue besides the start was pushed, and was either taken off
+            # again or is still on it.
+            stats.merge(
+                SearchStats(
+                    nodes_expanded=nodes_expanded,
+                    pushes=pops + len(queue) - 1,
+                    pops=pops,
+                    frontier_peak=max(frontier_peak, len(queue)),
+                    dedup_hits=dedup_hits,
+                ),
+            )
+
+
+def solve_with_stats(source: Source, steps: int) -> tuple[int, SearchStats]:
+    """Calculate the solution, along with the work the searches did to find it."""
+    map_ = read_map(source)
+    start = find_start(map_)
+    stats = SearchStats()
 
-    while queue:
-        steps, (x, y) = queue.popleft()
+    if steps % 2 == 0 or steps <= 65 + 131 * 2:
+        with phase("solve"):
+            solution = len(set(find_points_in_range(map_, start, steps, stats)))
+    else:
+        with phase("solve"):
+            a0 = len(set(find_points_in_range(map_, start, 65, stats)))
+            a1 = len(set(find_points_in_range(map_, start, 65 + 131, stats)))
+            a2 = len(set(find_points_in_range(map_, start, 65 + 131 * 2, stats)))
 
-        if steps % 2 == range_ % 2:
-            yield (x, y)
+        with phase("aggregate"):
+            b0, b1, b2 = a0, a1 - a0, a2 - a1
+            n = (steps - 65) // map_.height
 
-        if steps == range_:
-            continue
+            solution = b0 + b1 * n + (n * (n - 1) // 2) * (b2 - b1)
 
-        for dx, dy in DIRECTIONS:
-            new_x, new_y = x + dx, y + dy
+    stats.report()
 
-            if map_[new_y % bound_y][new_x % bound_x] in {".", "S"} and (new_x, new_y) not in seen:
-                seen.add((new_x, new_y))
-                queue.append((steps + 1, (new_x, new_y)))
+    return solution, stats
 
 
-def calculate_solution(path: Path, steps: int) -> int:
+def solve(source: Source, steps: int) -> int:
     """Calculate the solution."""
-    map_ = read_map(path)
-    start = find_start(map_)
-
-    if steps % 2 == 0 or steps <= 65 + 131 * 2:
-        return len(set(find_points_in_range(map_, start, steps)))
-
-    a0 = len(set(find_points_in_range(map_, start, 65)))
-    a1 = len(set(find_points_in_range(map_, start, 65 + 131)))
-    a2 = len(set(find_points_in_range(map_, start, 65 + 131 * 2)))
+    solution, _ = solve_with_stats(source, steps)
+    return solution
 
-    b0, b1, b2 = a0, a1 - a0, a2 - a1
-    n = (steps - 65) // len(map_)
 
-    return b0 + b1 * n + (n * (n - 1) // 2) * (b2 - b1)
+def calculate_solution(path: Path, steps: int) -> int:
+    """Calculate the solution from the input file."""
+    return solve(path, steps)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,10 @@
 
 from pathlib import Path
 
-from .part1 import calculate_solution
+from advent_of_code_2023 import SearchStats
+
+from .common import read_map
+from .part1 import calculate_solution, find_points_in_range, find_start, solve
 
 
 def test__calculate_solution_with_example_data() -> None:
@@ -13,3 +16,22 @@ def test__calculate_solution_with_example_data() -> None:
 def test__calculate_solution_with_puzzle_data() -> None:
     """Test whether the calculated_solution matches the puzzle solution."""
     assert calculate_solution(Path(__file__).parent / "input/input", 64) == 3724
+
+
+def test__find_points_in_range_stats_when_closed_early() -> None:
+    """Test whether a search that is not exhausted still reports the work it did."""
+    map_ = read_map(Path(__file__).parent / "input/test__input")
+    stats = SearchStats()
+
+    points = find_points_in_range(map_, find_start(map_), 6, stats)
+    next(points)
+    points.close()
+
+    # The start is yielded before any of its neighbours are pushed.
+    assert stats == SearchStats(pops=1, frontier_peak=1)
+
+
+def test__solve_with_example_data_in_memory() -> None:
+    """Test whether solving the example data in memory matches the example solution."""
+    data = (Path(__file__).parent / "input/test__input").read_text()
+    assert solve(data, 6) == 16
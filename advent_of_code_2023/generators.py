@@ -0,0 +1,442 @@
+"""
+Generate synthetic puzzle inputs of any size for Advent of Code 2023.
+
+Every generator takes a seeded random number generator and a size, and returns the text of a valid
+puzzle input. What the size means depends on the day, e.g. the number of lines or the side length
+of a grid. Generating with the same seed and size always produces the same input.
+"""
+
+import argparse
+import logging
+import string
+from collections.abc import Callable
+from itertools import pairwise
+from pathlib import Path
+from random import Random
+
+Generator = Callable[[Random, int], str]
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+CUBE_COLORS = ["red", "green", "blue"]
+
+SCHEMATIC_SYMBOLS = "*#+$/@%=&-"
+
+CARDS = "23456789TJQKA"
+
+LABEL_ALPHABET = string.ascii_uppercase + string.digits
+
+ALMANAC_CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+# Maps the offsets to the previous and next tile of a loop to the pipe connecting them.
+PIPES = {
+    frozenset({(0, -1), (0, 1)}): "|",
+    frozenset({(-1, 0), (1, 0)}): "-",
+    frozenset({(0, -1), (1, 0)}): "L",
+    frozenset({(0, -1), (-1, 0)}): "J",
+    frozenset({(0, 1), (-1, 0)}): "7",
+    frozenset({(0, 1), (1, 0)}): "F",
+}
+
+ALMANAC_BOUND = 2**32
+
+
+class UnknownDayError(Exception):
+    """Raised when there is no generator for the requested day."""
+
+
+def random_grid(rng: Random, width: int, height: int, weights: dict[str, float]) -> list[str]:
+    """Generate a grid of the given size where each tile is picked by weight."""
+    tiles = list(weights)
+    tile_weights = list(weights.values())
+
+    return ["".join(rng.choices(tiles, tile_weights, k=width)) for _ in range(height)]
+
+
+def generate_day01(rng: Random, size: int) -> str:
+    """Generate `size` lines of calibration values mixing letters, digits and digit words."""
+    lines = []
+
+    for _ in range(size):
+        tokens = [str(rng.randint(1, 9))]
+
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.2:  # noqa: PLR2004
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind < 0.5:  # noqa: PLR2004
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day02(rng: Random, size: int) -> str:
+    """Generate `size` games, each consisting of a number of cube sets."""
+    lines = []
+
+    for game_id in range(1, size + 1):
+        cube_sets = []
+
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(CUBE_COLORS, rng.randint(1, len(CUBE_COLORS)))
+            cube_sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+
+        lines.append(f"Game {game_id}: {'; '.join(cube_sets)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day03(rng: Random, size: int) -> str:
+    """Generate an engine schematic of `size` by `size` tiles."""
+    lines = []
+
+    for _ in range(size):
+        line = ""
+
+        while len(line) < size:
+            kind = rng.random()
+            if kind < 0.15:  # noqa: PLR2004
+                line += str(rng.randint(1, 999)) + "."
+            elif kind < 0.2:  # noqa: PLR2004
+                line += rng.choice(SCHEMATIC_SYMBOLS)
+            else:
+                line += "."
+
+        lines.append(line[:size])
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day04(rng: Random, size: int) -> str:
+    """Generate `size` scratch cards with 10 winning numbers and 25 numbers you have."""
+    width = len(str(size))
+    lines = []
+
+    for card_id in range(1, size + 1):
+        winning_numbers = rng.sample(range(1, 100), 10)
+        your_numbers = rng.sample(range(1, 100), 25)
+
+        lines.append(
+            f"Card {card_id:>{width}}: "
+            + " ".join(f"{number:>2}" for number in winning_numbers)
+            + " | "
+            + " ".join(f"{number:>2}" for number in your_numbers),
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day05(rng: Random, size: int, maps: int = 7, seed_ranges: int = 10) -> str:
+    """Generate an almanac with the given number of maps, each consisting of `size` entries."""
+    seeds = []
+
+    for _ in range(seed_ranges):
+        start = rng.randrange(ALMANAC_BOUND)
+        seeds.extend([start, rng.randint(1, (ALMANAC_BOUND - start) // 8 + 1)])
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    categories = [
+        ALMANAC_CATEGORIES[i] if i < len(ALMANAC_CATEGORIES) else f"category{i}"
+        for i in range(maps + 1)
+    ]
+
+    for source, destination in pairwise(categories):
+        cuts = sorted(rng.sample(range(ALMANAC_BOUND), 2 * size))
+        entries = []
+
+        for start, end in zip(cuts[::2], cuts[1::2], strict=True):
+            length = end - start
+            entries.append(f"{rng.randrange(ALMANAC_BOUND - length)} {start} {length}")
+
+        rng.shuffle(entries)
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(entries))
+
+    return "\n\n".join(sections) + "\n"
+
+
+def generate_day06(rng: Random, size: int) -> str:
+    """Generate `size` races, each with a time and a record distance that can be beaten."""
+    times = [rng.randint(7, 100) for _ in range(size)]
+    distances = [
+        (charge := rng.randint(1, time - 1)) * (time - charge) - rng.randint(1, time)
+        for time in times
+    ]
+    distances = [max(0, distance) for distance in distances]
+
+    return (
+        "Time:      " + " ".join(f"{time:>4}" for time in times) + "\n"
+        "Distance:  " + " ".join(f"{distance:>4}" for distance in distances) + "\n"
+    )
+
+
+def generate_day07(rng: Random, size: int) -> str:
+    """Generate `size` hands of cards, each with a bid."""
+    lines = [f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}" for _ in range(size)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day08(rng: Random, size: int, ghosts: int = 6) -> str:
+    """
+    Generate a map of roughly `size` nodes.
+
+    The nodes form one chain per ghost, from a node ending in `A` to a node ending in `Z`. The end
+    of every chain loops back to the node after its start, so every ghost reaches its end again
+    after the same number of steps. The first chain runs from `AAA` to `ZZZ`.
+    """
+    ghosts = max(1, min(ghosts, size // 4))
+    chain_length = max(2, size // ghosts)
+
+    # Inner nodes must not end in `A` or `Z`, so they are never mistaken for a start or an end.
+    inner_alphabet = [char for char in LABEL_ALPHABET if char not in "AZ"]
+    inner_labels = [
+        LABEL_ALPHABET[i // len(inner_alphabet) // len(LABEL_ALPHABET)]
+        + LABEL_ALPHABET[i // len(inner_alphabet) % len(LABEL_ALPHABET)]
+        + inner_alphabet[i % len(inner_alphabet)]
+        for i in rng.sample(
+            range(len(LABEL_ALPHABET) ** 2 * len(inner_alphabet)),
+            ghosts * (chain_length - 1),
+        )
+    ]
+
+    prefixes = rng.sample(
+        [a + b for a in LABEL_ALPHABET for b in LABEL_ALPHABET if a + b not in {"AA", "ZZ"}],
+        ghosts - 1,
+    )
+    lines = []
+
+    for ghost, prefix in enumerate(["AA", *prefixes]):
+        end = "ZZZ" if ghost == 0 else f"{prefix}Z"
+        chain = [
+            f"{prefix}A",
+            *inner_labels[ghost * (chain_length - 1) : (ghost + 1) * (chain_length - 1)],
+            end,
+        ]
+
+        lines.extend(
+            f"{node} = ({successor}, {successor})"
+            for node, successor in zip(chain, [*chain[1:], chain[1]], strict=True)
+        )
+
+    rng.shuffle(lines)
+    directions = "".join(rng.choices("LR", k=rng.randint(1, max(1, min(size, 300)))))
+
+    return f"{directions}\n\n" + "\n".join(lines) + "\n"
+
+
+def generate_day09(rng: Random, size: int, length: int = 21) -> str:
+    """Generate `size` OASIS readings, each sampled from a random polynomial."""
+    lines = []
+
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(0, 5))]
+        # A non-zero leading coefficient keeps the reading from being all zeros, which has no
+        # differences to extrapolate from.
+        coefficients.append(rng.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5]))
+        reading = [
+            sum(coefficient * x**power for power, coefficient in enumerate(coefficients))
+            for x in range(length)
+        ]
+        lines.append(" ".join(map(str, reading)))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day10(rng: Random, size: int, junk: float = 0.3) -> str:
+    """
+    Generate a field of `size` by `size` tiles containing a single loop of pipes.
+
+    The loop snakes through a rectangular block of the field. Tiles outside of the loop are filled
+    with random junk pipes or ground.
+    """
+    width = max(2, size - rng.randint(0, size // 4))
+    height = max(2, size - rng.randint(0, size // 4))
+    height -= height % 2
+    offset_x = rng.randint(0, size - width)
+    offset_y = rng.randint(0, size - height)
+
+    # Go right along the top row, snake back through the block and return along the left column.
+    loop = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        columns = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        loop.extend((x, y) for x in columns)
+    loop.extend((0, y) for y in range(height - 1, 0, -1))
+
+    weights = {".": 1 - junk, **dict.fromkeys("|-LJ7F", junk / 6)}
+    field = [list(row) for row in random_grid(rng, size, size, weights)]
+
+    for i, (x, y) in enumerate(loop):
+        previous_x, previous_y = loop[i - 1]
+        next_x, next_y = loop[(i + 1) % len(loop)]
+        connections = frozenset({(previous_x - x, previous_y - y), (next_x - x, next_y - y)})
+        field[offset_y + y][offset_x + x] = PIPES[connections]
+
+    start_x, start_y = rng.choice(loop)
+    field[offset_y + start_y][offset_x + start_x] = "S"
+
+    return "\n".join("".join(row) for row in field) + "\n"
+
+
+def generate_day11(rng: Random, size: int) -> str:
+    """Generate an image of `size` by `size` pixels containing galaxies."""
+    return "\n".join(random_grid(rng, size, size, {".": 0.97, "#": 0.03})) + "\n"
+
+
+def generate_day12(rng: Random, size: int, row_length: int = 12) -> str:
+    """Generate `size` rows of springs with their damaged groups, partially unknown."""
+    lines = []
+
+    for _ in range(size):
+        row = "".join(rng.choices(".#", k=row_length))
+        if "#" not in row:
+            row = row[:-1] + "#"
+
+        groups = [str(len(group)) for group in row.split(".") if group]
+        masked = "".join("?" if rng.random() < 0.4 else char for char in row)  # noqa: PLR2004
+
+        lines.append(f"{masked} {','.join(groups)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day13(rng: Random, size: int) -> str:
+    """Generate `size` patterns of ash and rocks, each with a line of reflection."""
+    patterns = []
+
+    for _ in range(size):
+        width = rng.randint(5, 17)
+        height = rng.randint(5, 17)
+        line = rng.randint(1, height - 1)
+
+        rows = random_grid(rng, width, height, {".": 0.5, "#": 0.5})
+        for offset in range(min(line, height - line)):
+            rows[line + offset] = rows[line - offset - 1]
+
+        if rng.random() < 0.5:  # noqa: PLR2004
+            rows = ["".join(column) for column in zip(*rows, strict=True)]
+
+        patterns.append("\n".join(rows))
+
+    return "\n\n".join(patterns) + "\n"
+
+
+def generate_day14(rng: Random, size: int) -> str:
+    """Generate a platform of `size` by `size` tiles with rounded and cube-shaped rocks."""
+    return "\n".join(random_grid(rng, size, size, {".": 0.7, "O": 0.2, "#": 0.1})) + "\n"
+
+
+def generate_day15(rng: Random, size: int) -> str:
+    """Generate an initialization sequence of `size` steps."""
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, int(size**0.5)))
+    ]
+
+    steps = [
+        f"{rng.choice(labels)}={rng.randint(1, 9)}"
+        if rng.random() < 0.7  # noqa: PLR2004
+        else f"{rng.choice(labels)}-"
+        for _ in range(size)
+    ]
+
+    return ",".join(steps) + "\n"
+
+
+def generate_day16(rng: Random, size: int) -> str:
+    """Generate a contraption of `size` by `size` tiles with mirrors and splitters."""
+    weights = {".": 0.8, **dict.fromkeys("/\\|-", 0.05)}
+    return "\n".join(random_grid(rng, size, size, weights)) + "\n"
+
+
+def generate_day17(rng: Random, size: int) -> str:
+    """Generate a heat map of `size` by `size` city blocks."""
+    return "\n".join(random_grid(rng, size, size, dict.fromkeys("123456789", 1))) + "\n"
+
+
+def generate_day21(rng: Random, size: int) -> str:
+    """
+    Generate a garden of `size` by `size` plots with the start in the centre.
+
+    The size is rounded up to an odd number. The middle row and column and the edges of the garden
+    are kept free of rocks, like in the puzzle input.
+    """
+    size += 1 - size % 2
+    middle = size // 2
+
+    garden = [list(row) for row in random_grid(rng, size, size, {".": 0.85, "#": 0.15})]
+
+    for i in range(size):
+        for x, y in [(i, 0), (i, size - 1), (0, i), (size - 1, i), (i, middle), (middle, i)]:
+            garden[y][x] = "."
+
+    garden[middle][middle] = "S"
+
+    return "\n".join("".join(row) for row in garden) + "\n"
+
+
+GENERATORS: dict[str, Generator] = {
+    "day01": generate_day01,
+    "day02": generate_day02,
+    "day03": generate_day03,
+    "day04": generate_day04,
+    "day05": generate_day05,
+    "day06": generate_day06,
+    "day07": generate_day07,
+    "day08": generate_day08,
+    "day09": generate_day09,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day12": generate_day12,
+    "day13": generate_day13,
+    "day14": generate_day14,
+    "day15": generate_day15,
+    "day16": generate_day16,
+    "day17": generate_day17,
+    "day21": generate_day21,
+}
+
+
+def generate(day: str, size: int, seed: int = 0) -> str:
+    """Generate a puzzle input of the given size for the given day."""
+    if day not in GENERATORS:
+        raise UnknownDayError(day)
+
+    return GENERATORS[day](Random(seed), size)
+
+
+def write_input(day: str, size: int, path: Path, seed: int = 0) -> Path:
+    """Generate a puzzle input of the given size for the given day and write it to a file."""
+    path.write_text(generate(day, size, seed))
+    return path
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("day", choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    args = parse_args()
+    write_input(args.day, args.size, args.output, args.seed)
+    logging.info("Generated %s input of size %d at %s", args.day, args.size, args.output)
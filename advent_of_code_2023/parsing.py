@@ -0,0 +1,41 @@
+"""Shared parsing helpers for Advent of Code 2023 puzzle inputs."""
+
+import functools
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from .streams import Source
+
+__all__ = ["PARSE_CACHE_SIZE", "parse_once"]
+
+# The number of parsed inputs to keep in memory for each reader.
+PARSE_CACHE_SIZE = 4
+
+T = TypeVar("T")
+
+
+def parse_once(read: Callable[[Source], T]) -> Callable[[Source], T]:
+    """
+    Cache the model that a reader parses from a file in memory.
+
+    Both parts of a day read the same input, so running them in the same process parses it only
+    once. The cache is keyed by the modification time and size of the file as well as its path,
+    so a file that changed on disk is parsed again. Cached models are shared between callers, so
+    readers return immutable models, such as tuples and read-only grids. Contents passed in memory
+    are parsed on every call.
+    """
+
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def read_version(path: Path, _mtime_ns: int, _size: int) -> T:
+        return read(path)
+
+    @functools.wraps(read)
+    def wrapper(source: Source) -> T:
+        if not isinstance(source, Path):
+            return read(source)
+
+        stat = source.stat()
+        return read_version(source.resolve(), stat.st_mtime_ns, stat.st_size)
+
+    return wrapper
@@ -0,0 +1,234 @@
+"""Phase-level profiling hooks for Advent of Code 2023 solutions."""
+
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Generator
+from contextlib import ContextDecorator, contextmanager
+from dataclasses import asdict, dataclass, field
+from types import TracebackType
+from typing import Protocol, TextIO
+
+__all__ = [
+    "JsonSink",
+    "LoggingSink",
+    "MemorySink",
+    "NullSink",
+    "Phase",
+    "SearchStats",
+    "Sink",
+    "count",
+    "get_sink",
+    "peak",
+    "phase",
+    "profile",
+    "set_sink",
+]
+
+
+class Sink(Protocol):
+    """A destination for the timings and counters recorded by solutions."""
+
+    def record_phase(self, name: str, wall_time: float) -> None:
+        """Record that a phase with the given name took the given number of seconds."""
+
+    def record_count(self, name: str, value: int) -> None:
+        """Record that the counter with the given name increased by the given value."""
+
+    def record_peak(self, name: str, value: int) -> None:
+        """Record that the counter with the given name reached the given value."""
+
+
+class NullSink:
+    """A sink that discards everything. Profiling is disabled while it is installed."""
+
+    def record_phase(self, name: str, wall_time: float) -> None:
+        """Discard the phase."""
+
+    def record_count(self, name: str, value: int) -> None:
+        """Discard the counter."""
+
+    def record_peak(self, name: str, value: int) -> None:
+        """Discard the counter."""
+
+
+@dataclass
+class MemorySink:
+    """
+    A sink that adds up the time spent in each phase and the value of each counter.
+
+    Counters recorded as peaks keep the largest value instead.
+    """
+
+    phases: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    counters: Counter[str] = field(default_factory=Counter)
+
+    def record_phase(self, name: str, wall_time: float) -> None:
+        """Add the time to the total of the phase."""
+        self.phases[name] += wall_time
+
+    def record_count(self, name: str, value: int) -> None:
+        """Add the value to the counter."""
+        self.counters[name] += value
+
+    def record_peak(self, name: str, value: int) -> None:
+        """Raise the counter to the value, if it is larger."""
+        self.counters[name] = max(self.counters[name], value)
+
+
+@dataclass
+class LoggingSink:
+    """A sink that logs every phase and counter as it is recorded."""
+
+    logger: logging.Logger = field(default_factory=lambda: logging.getLogger(__name__))
+    level: int = logging.INFO
+
+    def record_phase(self, name: str, wall_time: float) -> None:
+        """Log the phase."""
+        self.logger.log(self.level, "phase %s took %.6f s", name, wall_time)
+
+    def record_count(self, name: str, value: int) -> None:
+        """Log the counter."""
+        self.logger.log(self.level, "counter %s increased by %d", name, value)
+
+    def record_peak(self, name: str, value: int) -> None:
+        """Log the counter."""
+        self.logger.log(self.level, "counter %s reached %d", name, value)
+
+
+@dataclass
+class JsonSink:
+    """A sink that writes every phase and counter to a stream as a line of JSON."""
+
+    stream: TextIO
+
+    def record_phase(self, name: str, wall_time: float) -> None:
+        """Write the phase."""
+        self.stream.write(json.dumps({"phase": name, "wall_time": wall_time}) + "\n")
+
+    def record_count(self, name: str, value: int) -> None:
+        """Write the counter."""
+        self.stream.write(json.dumps({"counter": name, "value": value}) + "\n")
+
+    def record_peak(self, name: str, value: int) -> None:
+        """Write the counter."""
+        self.stream.write(json.dumps({"counter": name, "peak": value}) + "\n")
+
+
+_NULL_SINK = NullSink()
+_sink: Sink = _NULL_SINK
+
+# The start times of the phases that are currently running, by name.
+_starts: dict[str, float] = {}
+
+
+def get_sink() -> Sink:
+    """Return the sink that phases and counters are currently recorded to."""
+    return _sink
+
+
+def set_sink(sink: Sink | None) -> Sink:
+    """Install the sink, or disable profiling with `None`, and return the previous sink."""
+    global _sink  # noqa: PLW0603 - The sink is process-wide, like the logging configuration.
+
+    previous = _sink
+    _sink = sink if sink is not None else _NULL_SINK
+
+    return previous
+
+
+@contextmanager
+def profile(sink: Sink) -> Generator[Sink, None, None]:
+    """Record phases and counters to the given sink within the context."""
+    previous = set_sink(sink)
+
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+
+class Phase(ContextDecorator):
+    """
+    Time a phase of a solution, such as parsing the input or solving the puzzle.
+
+    Use it as a context manager around the phase, or as a decorator on a function that makes up
+    the phase. A phase entered while another phase with the same name is running, such as a
+    reader that calls another reader or a recursive function, is counted as part of the outer one.
+    Nothing is timed while profiling is disabled.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._outermost: list[bool] = []
+
+    def __enter__(self) -> "Phase":
+        outermost = _sink is not _NULL_SINK and self.name not in _starts
+        self._outermost.append(outermost)
+
+        if outermost:
+            _starts[self.name] = time.perf_counter()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._outermost.pop():
+            _sink.record_phase(self.name, time.perf_counter() - _starts.pop(self.name))
+
+
+def phase(name: str) -> Phase:
+    """Time the phase with the given name, as a context manager or decorator."""
+    return Phase(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increase the counter with the given name, if profiling is enabled."""
+    if _sink is not _NULL_SINK:
+        _sink.record_count(name, value)
+
+
+def peak(name: str, value: int) -> None:
+    """Raise the counter with the given name to the value, if profiling is enabled."""
+    if _sink is not _NULL_SINK:
+        _sink.record_peak(name, value)
+
+
+@dataclass
+class SearchStats:
+    """
+    The work done by a graph search, to compare algorithms and data structures by more than time.
+
+    Searches count in local variables and merge their totals into the stats object once they
+    finish, so the same object can add up the work of several searches.
+    """
+
+    # Nodes taken off the frontier and whose neighbours were generated.
+    nodes_expanded: int = 0
+    # Entries added to and removed from the frontier, whether it is a heap, queue or stack. The
+    # start that the frontier is seeded with is popped, but not counted as a push.
+    pushes: int = 0
+    pops: int = 0
+    # The largest number of entries on the frontier at any one time.
+    frontier_peak: int = 0
+    # Neighbours that were skipped because they had been seen before, other than the node that
+    # was just left.
+    dedup_hits: int = 0
+
+    def merge(self, other: "SearchStats") -> None:
+        """Add the work done by another search to this one."""
+        self.nodes_expanded += other.nodes_expanded
+        self.pushes += other.pushes
+        self.pops += other.pops
+        self.frontier_peak = max(self.frontier_peak, other.frontier_peak)
+        self.dedup_hits += other.dedup_hits
+
+    def report(self) -> None:
+        """Record every statistic as a counter, if profiling is enabled."""
+        for name, value in asdict(self).items():
+            (peak if name == "frontier_peak" else count)(name, value)
@@ -0,0 +1,449 @@
+"""Run all Advent of Code 2023 solutions in parallel and report their resource usage."""
+
+import argparse
+import importlib
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import pkgutil
+import re
+import resource
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from types import ModuleType
+
+from .cache import ResultCache, cached
+from .profiling import MemorySink, profile
+
+PACKAGE = "advent_of_code_2023"
+PACKAGE_PATH = Path(__file__).parent
+
+DAY_PATTERN = re.compile(r"^day\d{2}$")
+PART_PATTERN = re.compile(r"^part\d$")
+
+# Extra arguments required by entry points that take more than just the input path.
+PUZZLE_ARGUMENTS: dict[tuple[str, str], dict[str, int]] = {
+    ("day14", "part2"): {"ticks": 1000000000},
+    ("day21", "part1"): {"steps": 64},
+    ("day21", "part2"): {"steps": 26501365},
+}
+
+# The entry point of every part that does not call it `calculate_solution`.
+DEFAULT_ENTRY_POINT = "calculate_solution"
+ENTRY_POINTS: dict[tuple[str, str], str] = {
+    ("day01", "part1"): "sum_calibration_values",
+    ("day01", "part2"): "sum_calibration_values",
+    ("day02", "part1"): "find_valid_cube_sets",
+    ("day02", "part2"): "calculate_set_power",
+    ("day03", "part1"): "sum_part_numbers",
+    ("day03", "part2"): "sum_gear_ratios",
+    ("day04", "part1"): "calculate_total_score",
+    ("day04", "part2"): "count_total_cards",
+}
+
+
+class NoEntryPointError(Exception):
+    """Raised when a solution module does not define the entry point with the expected name."""
+
+
+@dataclass(frozen=True)
+class Solution:
+    """A single solution entry point for one part of one day."""
+
+    day: str
+    part: str
+    entry_point: str
+    arguments: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def module(self) -> str:
+        """Return the fully qualified name of the module defining the entry point."""
+        return f"{PACKAGE}.{self.day}.{self.part}"
+
+    def input_path(self, input_name: str = "input") -> Path:
+        """Return the path to the input file with the given name for this day."""
+        return PACKAGE_PATH / self.day / "input" / input_name
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """The result of running a solution, along with its resource usage."""
+
+    day: str
+    part: str
+    answer: int | float | None
+    wall_time: float
+    cpu_time: float | None
+    peak_rss: int | None
+    error: str | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+def find_entry_point(
+    module: ModuleType,
+    name: str = DEFAULT_ENTRY_POINT,
+) -> Callable[..., int | float]:
+    """
+    Find the entry point with the given name in a solution module.
+
+    The entry point must be a function defined in the module that takes the input path as its
+    first argument, such as the wrapper around the `solve` function of the part.
+    """
+    function = getattr(module, name, None)
+
+    if inspect.isfunction(function) and function.__module__ == module.__name__:
+        parameters = list(inspect.signature(function).parameters.values())
+
+        if parameters and parameters[0].annotation is Path:
+            return function
+
+    raise NoEntryPointError(module.__name__, name)
+
+
+def discover_solutions(days: Iterable[int] | None = None) -> list[Solution]:
+    """Discover the entry points of all solutions in the package."""
+    selected_days = {f"day{day:02d}" for day in days} if days is not None else None
+    solutions: list[Solution] = []
+
+    for day in sorted(pkgutil.iter_modules([str(PACKAGE_PATH)]), key=lambda info: info.name):
+        if not day.ispkg or not DAY_PATTERN.match(day.name):
+            continue
+
+        if selected_days is not None and day.name not in selected_days:
+            continue
+
+        for part in sorted(
+            pkgutil.iter_modules([str(PACKAGE_PATH / day.name)]),
+            key=lambda info: info.name,
+        ):
+            if not PART_PATTERN.match(part.name):
+                continue
+
+            module = importlib.import_module(f"{PACKAGE}.{day.name}.{part.name}")
+
+            solutions.append(
+                Solution(
+                    day=day.name,
+                    part=part.name,
+                    entry_point=find_entry_point(
+                        module,
+                        ENTRY_POINTS.get((day.name, part.name), DEFAULT_ENTRY_POINT),
+                    ).__name__,
+                    arguments=PUZZLE_ARGUMENTS.get((day.name, part.name), {}),
+                ),
+            )
+
+    return solutions
+
+
+def run_solution(
+    solution: Solution,
+    path: Path,
+    cache: ResultCache | None = None,
+    *,
+    profiling: bool = False,
+) -> Measurement:
+    """
+    Run a single solution and measure its wall time, CPU time and peak memory usage.
+
+    If a cache is given, the answer is looked up in it before running the solution. With
+    profiling enabled, the time spent in each phase of the solution and its counters are
+    reported as well.
+    """
+    module = importlib.import_module(solution.module)
+    entry_point = getattr(module, solution.entry_point)
+
+    if cache is not None:
+        entry_point = cached(entry_point, cache)
+
+    answer = None
+    error = None
+    sink = MemorySink()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    with profile(sink) if profiling else nullcontext():
+        try:
+            answer = entry_point(path, **solution.arguments)
+        except Exception as e:  # noqa: BLE001 - Report the failure instead of aborting the run.
+            error = f"{type(e).__name__}: {e}"
+
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    return Measurement(
+        day=solution.day,
+        part=solution.part,
+        answer=answer,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        peak_rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        error=error,
+        phases=dict(sink.phases),
+        counters=dict(sink.counters),
+    )
+
+
+def _run_solutions_in_worker(
+    connection: Connection,
+    batch: list[tuple[int, Solution, Path]],
+    cache: ResultCache | None,
+    *,
+    profiling: bool,
+) -> None:
+    """Run solutions one after the other in a worker process and send back each measurement."""
+    for index, solution, path in batch:
+        connection.send((index, run_solution(solution, path, cache, profiling=profiling)))
+    connection.close()
+
+
+def _crashed(solution: Solution, exitcode: int | None, wall_time: float) -> Measurement:
+    """Build the measurement for a solution whose worker exited without reporting back."""
+    return Measurement(
+        day=solution.day,
+        part=solution.part,
+        answer=None,
+        wall_time=wall_time,
+        cpu_time=None,
+        peak_rss=None,
+        error=f"ProcessError: worker exited with code {exitcode}",
+    )
+
+
+def _timed_out(solution: Solution, timeout: float) -> Measurement:
+    """Build the measurement for a solution that did not finish in time."""
+    return Measurement(
+        day=solution.day,
+        part=solution.part,
+        answer=None,
+        wall_time=timeout,
+        cpu_time=None,
+        peak_rss=None,
+        error=f"TimeoutError: no solution after {timeout} seconds",
+    )
+
+
+@dataclass
+class _Worker:
+    """A worker process running a batch of solutions, and when it started the current one."""
+
+    process: multiprocessing.Process
+    connection: Connection
+    batch: deque[tuple[int, Solution, Path]]
+    started: float
+
+    def poll(self, measurements: list[Measurement | None], timeout: float | None) -> bool:
+        """
+        Store the measurements the worker sent back, and return whether it has stopped.
+
+        A worker that crashed or exceeded the timeout on its current solution is stopped, and the
+        failure is recorded for that solution. The solutions it did not start remain in its batch.
+        """
+        # Check this first, so everything an exited worker sent is received below.
+        alive = self.process.is_alive()
+
+        while self.batch and self.connection.poll():
+            try:
+                index, measurement = self.connection.recv()
+            except EOFError:
+                break
+
+            measurements[index] = measurement
+            self.batch.popleft()
+            self.started = time.monotonic()
+
+        elapsed = time.monotonic() - self.started
+
+        if not alive:
+            if self.batch:
+                index, solution, _ = self.batch.popleft()
+                measurements[index] = _crashed(solution, self.process.exitcode, elapsed)
+            return True
+
+        if not self.batch:
+            return True
+
+        if timeout is not None and elapsed >= timeout:
+            self.process.terminate()
+            index, solution, _ = self.batch.popleft()
+            measurements[index] = _timed_out(solution, timeout)
+            return True
+
+        return False
+
+
+def run_solutions(
+    jobs: Iterable[tuple[Solution, Path]],
+    workers: int | None = None,
+    timeout: float | None = None,
+    cache: ResultCache | None = None,
+    *,
+    profiling: bool = False,
+) -> list[Measurement]:
+    """
+    Run the given solutions on the given input files in a pool of worker processes.
+
+    Solutions for the same day and input file run one after the other in the same worker, so the
+    input is parsed only once. Their peak memory usage is the peak of the worker up to that point.
+    A worker that exceeds the timeout on a solution is terminated, and the solutions it had not
+    started yet are moved to a fresh worker.
+    """
+    batches: dict[tuple[str, Path], list[tuple[int, Solution, Path]]] = {}
+
+    for index, (solution, path) in enumerate(jobs):
+        batches.setdefault((solution.day, path), []).append((index, solution, path))
+
+    queue = deque(batches.values())
+    workers = workers or os.cpu_count() or 1
+
+    measurements: list[Measurement | None] = [None] * sum(map(len, queue))
+    running: dict[int, _Worker] = {}
+
+    while queue or running:
+        while queue and len(running) < workers:
+            batch = queue.popleft()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_run_solutions_in_worker,
+                args=(sender, batch, cache),
+                kwargs={"profiling": profiling},
+            )
+            process.start()
+            sender.close()
+            running[process.sentinel] = _Worker(process, receiver, deque(batch), time.monotonic())
+
+        wait_time = (
+            max(0, min(worker.started for worker in running.values()) + timeout - time.monotonic())
+            if timeout is not None
+            else None
+        )
+
+        wait([*running, *(worker.connection for worker in running.values())], wait_time)
+
+        for sentinel, worker in list(running.items()):
+            if not worker.poll(measurements, timeout):
+                continue
+
+            if worker.batch:
+                queue.appendleft(list(worker.batch))
+
+            worker.process.join()
+            worker.connection.close()
+            del running[sentinel]
+
+    return [measurement for measurement in measurements if measurement is not None]
+
+
+def format_table(measurements: Iterable[Measurement]) -> str:
+    """Format the measurements as a plain text table."""
+    measurements = list(measurements)
+    profiled = any(measurement.phases or measurement.counters for measurement in measurements)
+
+    header = ("day", "part", "answer", "wall (s)", "cpu (s)", "peak rss (MiB)", "status")
+
+    if profiled:
+        header = (*header, "phases (s)")
+
+    rows = [
+        (
+            measurement.day,
+            measurement.part,
+            str(measurement.answer) if measurement.answer is not None else "-",
+            f"{measurement.wall_time:.3f}",
+            f"{measurement.cpu_time:.3f}" if measurement.cpu_time is not None else "-",
+            f"{measurement.peak_rss / 1024:.1f}" if measurement.peak_rss is not None else "-",
+            measurement.error or "ok",
+            *([format_profile(measurement)] if profiled else []),
+        )
+        for measurement in measurements
+    ]
+
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip()
+        for row in [header, *rows]
+    )
+
+
+def format_profile(measurement: Measurement) -> str:
+    """Format the phases and counters of a measurement as a single line."""
+    phases = (f"{name}={wall_time:.3f}" for name, wall_time in measurement.phases.items())
+    counters = (f"{name}={value}" for name, value in measurement.counters.items())
+    return " ".join([*phases, *counters]) or "-"
+
+
+def format_json(measurements: Iterable[Measurement]) -> str:
+    """Format the measurements as a JSON document."""
+    return json.dumps([asdict(measurement) for measurement in measurements], indent=2)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {PACKAGE}",
+        description="Run all solutions in parallel and report their resource usage.",
+    )
+    parser.add_argument("--days", type=int, nargs="+", help="only run the given days")
+    parser.add_argument("--input", default="input", help="name of the input file of each day")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="seconds to wait for each solution to finish",
+    )
+    parser.add_argument("--format", choices=["table", "json"], default="table")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report the time spent parsing, solving and aggregating, and solver counters",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse answers from previous runs on unchanged inputs and solutions",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="recompute all answers and overwrite the cached ones",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the solutions selected on the command line and write the report to stdout."""
+    args = parse_args(argv)
+
+    solutions = discover_solutions(args.days)
+    cache = (
+        ResultCache(bypass=args.refresh_cache) if args.cache or args.refresh_cache else None
+    )
+    measurements = run_solutions(
+        [(solution, solution.input_path(args.input)) for solution in solutions],
+        args.workers,
+        args.timeout,
+        cache,
+        profiling=args.profile,
+    )
+
+    report = format_json(measurements) if args.format == "json" else format_table(measurements)
+    sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    main()
@@ -0,0 +1,115 @@
+"""Streaming readers for Advent of Code 2023 puzzle inputs."""
+
+import codecs
+import io
+import mmap
+import os
+from collections.abc import Generator
+from pathlib import Path
+from typing import TextIO
+
+__all__ = [
+    "BLOCK_SIZE",
+    "CHUNK_SIZE",
+    "Source",
+    "open_text",
+    "read_blocks",
+    "read_bytes",
+    "read_char_stream",
+    "read_text",
+    "split_at_lines",
+]
+
+BLOCK_SIZE = 1 << 16
+
+# The size of the pieces of a file that are handed to workers, small enough to keep many of them in
+# memory at once and large enough that scheduling them costs little.
+CHUNK_SIZE = 1 << 25
+
+# A puzzle input, either as the path of a file or as its contents in memory. Strings are always
+# contents, never file names.
+Source = Path | str | bytes | memoryview
+
+
+def read_blocks(path: Path, block_size: int = BLOCK_SIZE) -> Generator[bytes, None, None]:
+    """Read a file as a stream of blocks of bytes from a memory map."""
+    with Path.open(path, "rb") as f:
+        # Empty files cannot be memory mapped.
+        if not os.fstat(f.fileno()).st_size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for offset in range(0, len(data), block_size):
+                yield data[offset : offset + block_size]
+
+
+def split_at_lines(path: Path, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split a file into byte ranges of at least `chunk_size` bytes that end at line breaks."""
+    size = path.stat().st_size
+
+    if not size:
+        return []
+
+    starts = [0]
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        while (target := starts[-1] + chunk_size) < size:
+            newline = data.find(b"\n", target - 1)
+
+            if newline < 0 or newline + 1 >= size:
+                break
+
+            starts.append(newline + 1)
+
+    return list(zip(starts, [*starts[1:], size], strict=True))
+
+
+def read_char_stream(source: Source, block_size: int = BLOCK_SIZE) -> Generator[str, None, None]:
+    """
+    Read a file as a stream of characters, decoding it one block at a time.
+
+    Line breaks are translated to line feeds, like when a file is read in text mode.
+    """
+    if not isinstance(source, Path):
+        yield from io.IncrementalNewlineDecoder(None, translate=True).decode(
+            read_text(source),
+            final=True,
+        )
+        return
+
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+
+    for block in read_blocks(source, block_size):
+        yield from decoder.decode(block)
+
+    yield from decoder.decode(b"", final=True)
+
+
+def read_bytes(source: Source) -> bytes:
+    """Read the contents of a file, or encode contents in memory, as bytes."""
+    if isinstance(source, Path):
+        return source.read_bytes()
+
+    if isinstance(source, str):
+        return source.encode()
+
+    return bytes(source)
+
+
+def read_text(source: Source) -> str:
+    """Read the contents of a file, or decode contents in memory, as text."""
+    if isinstance(source, Path):
+        return source.read_text()
+
+    if isinstance(source, str):
+        return source
+
+    return str(source, "utf-8")
+
+
+def open_text(source: Source) -> TextIO:
+    """Open a file, or contents in memory, as a text stream with universal newlines."""
+    if isinstance(source, Path):
+        return source.open()
+
+    return io.StringIO(read_text(source), newline=None)
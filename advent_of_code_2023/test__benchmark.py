@@ -0,0 +1,64 @@
+"""Tests for the Advent of Code 2023 benchmark harness."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from .benchmark import Curve, Sample, benchmark, compare, read_baseline, write_baseline
+from .runner import discover_solutions
+
+
+@pytest.mark.parametrize(
+    ("timing", "expected_complexity"),
+    [
+        (lambda _: 0.5, "O(1)"),
+        (lambda n: n * 1e-3, "O(n)"),
+        (lambda n: n**2 * 1e-4, "O(n^2)"),
+        (lambda n: 2**n * 1e-3, "O(2^n)"),
+    ],
+)
+def test__curve_complexity(timing: Callable[[int], float], expected_complexity: str) -> None:
+    """Test whether the fitted complexity matches the complexity of the samples."""
+    curve = Curve(
+        "day01",
+        "part1",
+        [Sample(n, timing(n), None, None) for n in range(4, 20, 2)],
+    )
+
+    assert curve.complexity == expected_complexity
+
+
+def test__compare_flags_slower_and_failing_solutions() -> None:
+    """Test whether solutions that got slower or started failing are flagged as regressions."""
+    baseline = [
+        Curve("day01", "part1", [Sample(64, 1.0, None, None), Sample(128, 2.0, None, None)]),
+        Curve("day01", "part2", [Sample(64, 1.0, None, None)]),
+        Curve("day02", "part1", [Sample(64, 1.0, None, None)]),
+    ]
+    current = [
+        Curve("day01", "part1", [Sample(64, 1.0, None, None), Sample(128, 3.0, None, None)]),
+        Curve("day01", "part2", [Sample(64, 1.1, None, None)]),
+        Curve("day02", "part1", [Sample(64, 30.0, None, None, "TimeoutError")]),
+    ]
+
+    regressions = compare(baseline, current, threshold=0.25)
+
+    assert [(regression.day, regression.part, regression.size) for regression in regressions] == [
+        ("day01", "part1", 128),
+        ("day02", "part1", 64),
+    ]
+    assert regressions[0].ratio == 1.5
+    assert regressions[1].ratio is None
+
+
+def test__benchmark_round_trips_through_baseline(tmp_path: Path) -> None:
+    """Test whether benchmark results can be stored as a baseline and read back."""
+    curves = benchmark(discover_solutions([7]), {"day07.part1": [64, 128]}, repeat=1)
+    write_baseline(tmp_path / "baseline.json", curves, seed=0)
+
+    (curve,) = read_baseline(tmp_path / "baseline.json")
+
+    assert curve.key == "day07.part1"
+    assert [sample.size for sample in curve.samples] == [64, 128]
+    assert all(sample.error is None for sample in curve.samples)
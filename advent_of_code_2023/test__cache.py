@@ -0,0 +1,111 @@
+"""Tests for the Advent of Code 2023 result cache."""
+
+import importlib
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from .cache import ResultCache, cached, imported_modules, source_version
+from .day14 import part1 as day14_part1
+
+
+def make_solution() -> tuple[Callable[..., int], list[Path]]:
+    """Make a solution that counts lines, and the list of paths it was called with."""
+    calls: list[Path] = []
+
+    def count_lines(path: Path, offset: int = 0) -> int:
+        calls.append(path)
+        return len(path.read_text().splitlines()) + offset
+
+    return count_lines, calls
+
+
+def test__cached_reuses_answers(tmp_path: Path) -> None:
+    """Test whether answers are reused until the input, arguments or version change."""
+    cache = ResultCache(tmp_path / "cache")
+    path = tmp_path / "input"
+    path.write_text("a\nb\n")
+
+    count_lines, calls = make_solution()
+    solve = cached(count_lines, cache, version="1")
+
+    assert solve(path) == 2
+    assert solve(path) == 2
+    assert len(calls) == 1
+
+    assert solve(path, offset=1) == 3
+    assert cached(count_lines, cache, version="2")(path) == 2
+    assert len(calls) == 3
+
+    path.write_text("a\nb\nc\n")
+
+    assert solve(path) == 3
+    assert len(calls) == 4
+
+
+def test__cached_with_bypass(tmp_path: Path) -> None:
+    """Test whether bypassing the cache recomputes the answer and refreshes the entry."""
+    path = tmp_path / "input"
+    path.write_text("a\n")
+
+    count_lines, calls = make_solution()
+    cached(count_lines, ResultCache(tmp_path / "cache"), version="1")(path)
+    cached(count_lines, ResultCache(tmp_path / "cache", bypass=True), version="1")(path)
+
+    assert len(calls) == 2
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+
+def test__evict_least_recently_used(tmp_path: Path) -> None:
+    """Test whether the least recently used entries are evicted once the cache is too large."""
+    for age, key in enumerate(["c", "b", "a"]):
+        entry = tmp_path / f"{key}.json"
+        entry.write_text('{"answer": 1}')
+        os.utime(entry, ns=(age, age))
+
+    # Each entry takes 13 bytes, so only the two most recently used ones fit.
+    cache = ResultCache(tmp_path, max_size=30)
+
+    assert cache.get("c") == 1
+    cache.evict()
+
+    assert sorted(entry.stem for entry in tmp_path.glob("*.json")) == ["a", "c"]
+
+
+def test__source_version_covers_imported_modules(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test whether editing a module that the solution imports changes the version."""
+    package = tmp_path / "cached_solution"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "helper.py").write_text("def parse(path):\n    return path.read_text()\n")
+    (package / "solution.py").write_text(
+        "from cached_solution.helper import parse\n\n\n"
+        "def solve(path):\n    return len(parse(path))\n",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    solve = importlib.import_module("cached_solution.solution").solve
+
+    assert [module.__name__ for module in imported_modules(sys.modules[solve.__module__])] == [
+        "cached_solution.helper",
+        "cached_solution.solution",
+    ]
+
+    version = source_version(solve)
+    (package / "helper.py").write_text("def parse(path):\n    return path.read_bytes()\n")
+
+    assert source_version(solve) != version
+
+
+def test__source_version_of_a_day_covers_shared_modules() -> None:
+    """Test whether the version of a solution covers its day's parser and the data structures."""
+    names = [module.__name__ for module in imported_modules(day14_part1)]
+
+    assert "advent_of_code_2023.day14.common" in names
+    assert "advent_of_code_2023.data_structures.grid" in names
+    assert "advent_of_code_2023.parsing" in names
@@ -0,0 +1,54 @@
+"""Tests for the Advent of Code 2023 input generators."""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from .day09 import part2 as day09_part2
+from .generators import GENERATORS, UnknownDayError, generate, write_input
+from .runner import Solution, discover_solutions
+
+# Solutions that cannot finish on arbitrary inputs, or need smaller arguments to finish quickly.
+SKIPPED = {("day12", "part2"), ("day14", "part2")}
+ARGUMENTS = {"day21": {"steps": 10}}
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test__generate_is_repeatable(day: str) -> None:
+    """Test whether generating with the same seed produces the same input."""
+    assert generate(day, 20, seed=1) == generate(day, 20, seed=1)
+    assert generate(day, 20, seed=1) != generate(day, 20, seed=2)
+
+
+@pytest.mark.parametrize(
+    "solution",
+    [
+        solution
+        for solution in discover_solutions()
+        if (solution.day, solution.part) not in SKIPPED
+    ],
+    ids=lambda solution: f"{solution.day}.{solution.part}",
+)
+def test__generated_input_can_be_solved(solution: Solution, tmp_path: Path) -> None:
+    """Test whether the solutions accept the generated inputs."""
+    entry_point = getattr(importlib.import_module(solution.module), solution.entry_point)
+    path = write_input(solution.day, 20, tmp_path / "input", seed=1)
+
+    answer = entry_point(path, **ARGUMENTS.get(solution.day, solution.arguments))
+
+    assert isinstance(answer, int | float)
+
+
+def test__generate_with_unknown_day() -> None:
+    """Test whether generating an input for an unknown day raises an error."""
+    with pytest.raises(UnknownDayError):
+        generate("day25", 10)
+
+
+def test__generate_day09_without_zero_readings() -> None:
+    """Test whether no generated reading is all zeros, even for large inputs."""
+    readings = generate("day09", 1024, seed=0).splitlines()
+
+    assert all(set(reading.split()) != {"0"} for reading in readings)
+    assert day09_part2.solve(generate("day09", 1024, seed=0)) == -172
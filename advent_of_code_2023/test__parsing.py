@@ -0,0 +1,34 @@
+"""Tests for the Advent of Code 2023 parsing helpers."""
+
+import os
+from pathlib import Path
+
+from .parsing import parse_once
+from .streams import Source, read_text
+
+
+def test__parse_once_until_file_changes(tmp_path: Path) -> None:
+    """Test whether a file is parsed once, and again after it changed on disk."""
+    calls: list[Source] = []
+
+    @parse_once
+    def read_lines(source: Source) -> tuple[str, ...]:
+        calls.append(source)
+        return tuple(read_text(source).splitlines())
+
+    path = tmp_path / "input"
+    path.write_text("a\nb\n")
+
+    assert read_lines(path) == ("a", "b")
+    assert read_lines(path) is read_lines(path)
+    assert len(calls) == 1
+
+    path.write_text("a\nb\nc\n")
+    os.utime(path, ns=(0, 0))
+
+    assert read_lines(path) == ("a", "b", "c")
+    assert len(calls) == 2
+
+    assert read_lines(b"a\nb\n") == ("a", "b")
+    assert read_lines(b"a\nb\n") == ("a", "b")
+    assert len(calls) == 4
@@ -0,0 +1,75 @@
+"""Tests for the Advent of Code 2023 profiling hooks."""
+
+import io
+import json
+
+from .profiling import JsonSink, MemorySink, SearchStats, count, get_sink, phase, profile
+
+
+@phase("solve")
+def fibonacci(n: int) -> int:
+    """Calculate a Fibonacci number recursively, as a phase that enters itself."""
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def test__phases_and_counters_are_recorded() -> None:
+    """Test whether phases are timed once per outermost entry and counters are added up."""
+    with profile(MemorySink()) as sink:
+        with phase("parse"):
+            count("lines", 2)
+
+        fibonacci(10)
+        fibonacci(10)
+        count("lines")
+
+    assert isinstance(sink, MemorySink)
+    assert sorted(sink.phases) == ["parse", "solve"]
+    assert sink.phases["solve"] > 0
+    assert sink.counters == {"lines": 3}
+
+
+def test__nothing_is_recorded_when_disabled() -> None:
+    """Test whether phases and counters outside of a profile are discarded."""
+    sink = MemorySink()
+
+    with profile(sink):
+        pass
+
+    with phase("parse"):
+        count("lines")
+
+    assert not isinstance(get_sink(), MemorySink)
+    assert not sink.phases
+    assert not sink.counters
+
+
+def test__json_sink() -> None:
+    """Test whether the JSON sink writes one object per line."""
+    stream = io.StringIO()
+
+    with profile(JsonSink(stream)):
+        with phase("parse"):
+            pass
+        count("lines", 4)
+
+    phase_record, count_record = map(json.loads, stream.getvalue().splitlines())
+
+    assert phase_record["phase"] == "parse"
+    assert count_record == {"counter": "lines", "value": 4}
+
+
+def test__search_stats_merge_and_report() -> None:
+    """Test whether search statistics add up across searches and reports, except for peaks."""
+    stats = SearchStats(nodes_expanded=3, pushes=4, pops=3, frontier_peak=2, dedup_hits=1)
+    stats.merge(SearchStats(nodes_expanded=1, pushes=1, pops=1, frontier_peak=1))
+
+    assert stats == SearchStats(nodes_expanded=4, pushes=5, pops=4, frontier_peak=2, dedup_hits=1)
+
+    sink = MemorySink()
+
+    with profile(sink):
+        stats.report()
+        stats.report()
+
+    assert sink.counters["pushes"] == 10
+    assert sink.counters["frontier_peak"] == 2
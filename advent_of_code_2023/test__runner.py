@@ -0,0 +1,113 @@
+"""Tests for the Advent of Code 2023 solution runner."""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from .runner import (
+    Measurement,
+    NoEntryPointError,
+    discover_solutions,
+    find_entry_point,
+    format_table,
+    run_solution,
+    run_solutions,
+)
+
+
+def test__discover_solutions_finds_all_entry_points() -> None:
+    """Test whether every part of every day is discovered with the right entry point."""
+    solutions = {(solution.day, solution.part): solution for solution in discover_solutions()}
+
+    assert solutions["day01", "part1"].entry_point == "sum_calibration_values"
+    assert solutions["day04", "part2"].entry_point == "count_total_cards"
+    assert solutions["day05", "part2"].entry_point == "calculate_solution"
+    assert solutions["day21", "part2"].arguments == {"steps": 26501365}
+
+
+def test__find_entry_point_by_name() -> None:
+    """Test whether entry points are found by name, and missing or unsuitable ones are rejected."""
+    module = importlib.import_module("advent_of_code_2023.day01.part2")
+
+    assert find_entry_point(module, "sum_calibration_values") is module.sum_calibration_values
+
+    with pytest.raises(NoEntryPointError):
+        find_entry_point(module)
+
+    with pytest.raises(NoEntryPointError):
+        find_entry_point(module, "find_calibration_value")
+
+
+def test__discover_solutions_with_selected_days() -> None:
+    """Test whether only the selected days are discovered."""
+    solutions = discover_solutions([6])
+
+    assert [(solution.day, solution.part) for solution in solutions] == [
+        ("day06", "part1"),
+        ("day06", "part2"),
+    ]
+
+
+def test__run_solution_with_puzzle_data() -> None:
+    """Test whether running a solution reports the puzzle solution and its resource usage."""
+    solution, _ = discover_solutions([6])
+    measurement = run_solution(solution, solution.input_path())
+
+    assert measurement.answer == 170000
+    assert measurement.error is None
+    assert measurement.peak_rss is not None
+    assert measurement.peak_rss > 0
+
+
+def test__run_solution_with_profiling(tmp_path: Path) -> None:
+    """Test whether profiling a solution reports the time spent in each of its phases."""
+    solution, _ = discover_solutions([8])
+
+    # Copy the input, so it is not already parsed by another test.
+    path = tmp_path / "input"
+    path.write_bytes(solution.input_path().read_bytes())
+
+    measurement = run_solution(solution, path, profiling=True)
+
+    assert set(measurement.phases) == {"parse", "solve"}
+    assert measurement.counters["steps"] > 0
+
+
+def test__run_solutions_with_puzzle_data() -> None:
+    """Test whether running solutions in a process pool reports all puzzle solutions."""
+    measurements = run_solutions(
+        [(solution, solution.input_path()) for solution in discover_solutions([6, 9])],
+        workers=2,
+    )
+
+    assert [measurement.answer for measurement in measurements] == [
+        170000,
+        20537782,
+        2038472161,
+        1091,
+    ]
+
+
+def test__run_solutions_after_timeout_in_same_batch() -> None:
+    """Test whether solutions queued behind one that timed out still run in a fresh worker."""
+    part1, part2 = discover_solutions([14])
+    measurements = run_solutions(
+        [(part2, part2.input_path()), (part1, part1.input_path())],
+        workers=1,
+        timeout=1,
+    )
+
+    assert [measurement.part for measurement in measurements] == ["part2", "part1"]
+    assert measurements[0].error is not None
+    assert measurements[0].error.startswith("TimeoutError")
+    assert measurements[1].answer == 111979
+
+
+def test__format_table() -> None:
+    """Test whether a failed measurement is reported in the table."""
+    measurement = Measurement("day01", "part1", None, 0.5, 0.25, 2048, "ValueError: oops")
+    header, row = format_table([measurement]).splitlines()
+
+    assert header.startswith("day")
+    assert row.split() == ["day01", "part1", "-", "0.500", "0.250", "2.0", "ValueError:", "oops"]
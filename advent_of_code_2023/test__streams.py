@@ -0,0 +1,64 @@
+"""Tests for the Advent of Code 2023 streaming readers."""
+
+from pathlib import Path
+
+from .streams import open_text, read_blocks, read_bytes, read_char_stream, split_at_lines
+
+
+def test__read_char_stream_across_block_boundaries(tmp_path: Path) -> None:
+    """Test whether characters split across blocks are decoded correctly."""
+    path = tmp_path / "input"
+    path.write_text("ab€cd\n€\n", encoding="utf-8")
+
+    assert "".join(read_char_stream(path, block_size=3)) == "ab€cd\n€\n"
+
+
+def test__read_blocks(tmp_path: Path) -> None:
+    """Test whether a file is read in blocks of the given size."""
+    path = tmp_path / "input"
+    path.write_bytes(b"0123456789")
+
+    assert list(read_blocks(path, block_size=4)) == [b"0123", b"4567", b"89"]
+
+
+def test__read_char_stream_with_empty_file(tmp_path: Path) -> None:
+    """Test whether an empty file results in an empty stream."""
+    path = tmp_path / "input"
+    path.touch()
+
+    assert list(read_char_stream(path)) == []
+
+
+def test__read_contents_in_memory() -> None:
+    """Test whether contents in memory are read the same way as the contents of a file."""
+    contents = "ab€cd\r\n€\n"
+
+    for source in [contents, contents.encode(), memoryview(contents.encode())]:
+        assert "".join(read_char_stream(source)) == "ab€cd\n€\n"
+        assert read_bytes(source) == contents.encode()
+
+        with open_text(source) as f:
+            assert list(f) == ["ab€cd\n", "€\n"]
+
+
+def test__split_at_lines(tmp_path: Path) -> None:
+    """Test whether a file is split into ranges that cover it and end at line breaks."""
+    path = tmp_path / "input"
+    path.write_bytes(b"a\nbbbbbbbb\nc\nd\n")
+
+    assert split_at_lines(path) == [(0, 15)]
+    assert split_at_lines(path, 4) == [(0, 11), (11, 15)]
+    assert split_at_lines(path, 1) == [(0, 2), (2, 11), (11, 13), (13, 15)]
+
+    path.write_bytes(b"")
+
+    assert split_at_lines(path, 1) == []
+
+
+def test__read_char_stream_translates_line_breaks(tmp_path: Path) -> None:
+    """Test whether CRLF and CR line breaks become LF, even when split across blocks."""
+    path = tmp_path / "input"
+    path.write_bytes(b"ab\r\ncd\re\r\n")
+
+    for block_size in [1, 3, 4, 1024]:
+        assert "".join(read_char_stream(path, block_size=block_size)) == "ab\ncd\ne\n"
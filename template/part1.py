@@ -1,20 +1,23 @@
 """Advent of Code 2023 Day 0 Part 1."""
 
 import logging
-from collections.abc import Generator
 from pathlib import Path
 
+from advent_of_code_2023 import Source, phase
+from template.common import read_lines
 
-def read_char_stream(path: Path) -> Generator[str, None, None]:
-    """Read a file as a stream of characters."""
-    with Path.open(path) as f:
-        while char := f.read(1):
-            yield char
+
+def solve(source: Source) -> int:
+    """Calculate the solution."""
+    lines = read_lines(source)
+
+    with phase("solve"):
+        return len(lines)
 
 
 def calculate_solution(path: Path) -> int:
-    """Calculate the solution."""
-    return len([char for char in read_char_stream(path) if char == "\n"])
+    """Calculate the solution from the input file."""
+    return solve(path)
 
 
 if __name__ == "__main__":